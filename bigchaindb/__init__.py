@@ -13,6 +13,9 @@ config = {
         'bind': os.environ.get('BIGCHAINDB_SERVER_BIND') or 'localhost:9984',
         'workers': None,  # if none, the value will be cpu_count * 2 + 1
         'threads': None,  # if none, the value will be cpu_count * 2 + 1
+        'mode': 'sync',  # or 'asyncio', to serve the API from an event loop
+        'max_batch_size': 1000,  # the most transactions posted at once
+        'validation_workers': 1,  # per worker, in the 'asyncio' mode
     },
     'database': {
         'host': os.environ.get('BIGCHAINDB_DATABASE_HOST', 'localhost'),
@@ -30,7 +33,15 @@ config = {
         'rate': 0.01,
     },
     'api_endpoint': os.environ.get('BIGCHAINDB_API_ENDPOINT') or 'http://localhost:9984/api/v1',
-    'backlog_reassign_delay': 120
+    'backlog_reassign_delay': 120,
+    'block_deserialization': {
+        # Note: the transactions of a block to vote on are deserialized
+        #       on a pool of `workers` processes (or threads, if `executor`
+        #       is 'thread'). With a single worker, they are deserialized
+        #       serially.
+        'workers': 1,
+        'executor': 'process',
+    },
 }
 
 # We need to maintain a backup copy of the original config dict in case
@@ -178,7 +178,8 @@ def run_start(args):
     try:
         db.init()
     except DatabaseAlreadyExists:
-        pass
+        # the database may have been created by an older version
+        db.upgrade()
     except KeypairNotFoundException:
         sys.exit("Can't start BigchainDB, no keypair found. "
                  'Did you run `bigchaindb configure`?')
@@ -222,7 +223,7 @@ def run_load(args):
 
 
 def run_set_shards(args):
-    for table in ['bigchain', 'backlog', 'votes']:
+    for table in ['bigchain', 'backlog', 'votes', 'utxo', 'assets']:
         # See https://www.rethinkdb.com/api/python/config/
         table_config = r.table(table).config().run(db.get_conn())
         num_replicas = len(table_config['shards'][0]['replicas'])
@@ -233,7 +234,7 @@ def run_set_shards(args):
 
 
 def run_set_replicas(args):
-    for table in ['bigchain', 'backlog', 'votes']:
+    for table in ['bigchain', 'backlog', 'votes', 'utxo', 'assets']:
         # See https://www.rethinkdb.com/api/python/config/
         table_config = r.table(table).config().run(db.get_conn())
         num_shards = len(table_config['shards'])
@@ -12,13 +12,21 @@ with open(TX_SCHEMA_PATH) as handle:
     TX_SCHEMA_YAML = handle.read()
 TX_SCHEMA = yaml.safe_load(TX_SCHEMA_YAML)
 
+# Check the schema and build its validator only once, instead of doing it
+# for every transaction like ``jsonschema.validate`` does. The validator's
+# resolver also keeps the already resolved ``$ref``s around.
+_TX_SCHEMA_VALIDATOR_CLASS = jsonschema.validators.validator_for(TX_SCHEMA)
+_TX_SCHEMA_VALIDATOR_CLASS.check_schema(TX_SCHEMA)
+TX_SCHEMA_VALIDATOR = _TX_SCHEMA_VALIDATOR_CLASS(TX_SCHEMA)
+
 
 def validate_transaction_schema(tx_body):
     """ Validate a transaction dict against a schema """
     try:
-        jsonschema.validate(tx_body, TX_SCHEMA)
+        TX_SCHEMA_VALIDATOR.validate(tx_body)
     except jsonschema.ValidationError as exc:
         raise SchemaValidationError(str(exc)) from exc
 
 
-__all__ = ['TX_SCHEMA', 'TX_SCHEMA_YAML', 'validate_transaction_schema']
+__all__ = ['TX_SCHEMA', 'TX_SCHEMA_YAML', 'TX_SCHEMA_VALIDATOR',
+           'validate_transaction_schema']
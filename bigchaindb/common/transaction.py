@@ -1,5 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
-from functools import reduce
+from functools import lru_cache, reduce
+from itertools import count
+from multiprocessing import cpu_count
+from os import getpid
+from threading import Lock
 from uuid import uuid4
 
 from cryptoconditions import (Fulfillment as CCFulfillment,
@@ -13,7 +18,87 @@ from bigchaindb.common.exceptions import (KeypairMismatchException,
 from bigchaindb.common.util import serialize, gen_timestamp
 
 
-class Fulfillment(object):
+# NOTE: Every public attribute assignment on a model object draws a fresh
+#       number from this counter. Cached serializations remember the
+#       revisions they were computed from, which is how they notice that any
+#       part of a Transaction has changed since.
+_revision_counter = count()
+
+# NOTE: The maximum number of parsed Fulfillment URIs kept in memory.
+FULFILLMENT_CACHE_SIZE = 2 ** 13
+
+
+@lru_cache(maxsize=FULFILLMENT_CACHE_SIZE)
+def _parse_fulfillment_uri(uri):
+    """Parses a Fulfillment URI and computes its Condition URI.
+
+        Note:
+            The result is cached, so that validating the same Transaction
+            multiple times (e.g. on the API, in the block pipeline and in the
+            vote pipeline) doesn't parse its Fulfillments over and over
+            again. The parsed Fulfillment is shared and must not be mutated.
+
+        Args:
+            uri (str): A Fulfillment URI.
+
+        Returns:
+            tuple: The :class:`cryptoconditions.Fulfillment` and its
+            Condition URI.
+    """
+    fulfillment = CCFulfillment.from_uri(uri)
+    return fulfillment, fulfillment.condition_uri
+
+
+# NOTE: The pool of threads `Transaction.verify_many` verifies Fulfillments on
+#       by default, created once per process since its threads don't survive
+#       a fork.
+_verify_executor = None
+_verify_executor_pid = None
+_verify_executor_lock = Lock()
+
+
+def _get_verify_executor():
+    """Returns the pool of threads of the current process to verify
+    Fulfillments on, with a thread per CPU.
+    """
+    global _verify_executor, _verify_executor_pid
+    with _verify_executor_lock:
+        if _verify_executor_pid != getpid():
+            _verify_executor = ThreadPoolExecutor(cpu_count())
+            _verify_executor_pid = getpid()
+        return _verify_executor
+
+
+class _Revisioned(object):
+    """Base class for the transaction models that tracks their revision.
+
+        Note:
+            Only attribute assignments are tracked. Mutating a value in-place
+            (e.g. updating the `metadata` dict of a Transaction, or the
+            internal state of a Cryptoconditions Fulfillment) is not noticed
+            and requires re-assigning the attribute.
+
+            The models use `__slots__` to keep Blocks of many Transactions
+            small in memory. Copying and pickling them goes through their
+            dictionary representation (see `__reduce__`), so that copies are
+            considered a new revision and pickles stay compact.
+    """
+    __slots__ = ('_revision', '_cache')
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if not name.startswith('_'):
+            self._touch()
+
+    def _touch(self):
+        object.__setattr__(self, '_revision', next(_revision_counter))
+        object.__setattr__(self, '_cache', {})
+
+    def _revision_key(self):
+        return self._revision
+
+
+class Fulfillment(_Revisioned):
     """A Fulfillment is used to spend assets locked by a Condition.
 
         Attributes:
@@ -25,6 +110,7 @@ class Fulfillment(object):
                 optional): A link representing the input of a `TRANSFER`
                 Transaction.
     """
+    __slots__ = ('fulfillment', 'owners_before', 'tx_input', '_lazy_uri')
 
     def __init__(self, fulfillment, owners_before, tx_input=None):
         """Fulfillment shims a Cryptocondition Fulfillment for BigchainDB.
@@ -52,6 +138,41 @@ class Fulfillment(object):
         # TODO: If `other !== Fulfillment` return `False`
         return self.to_dict() == other.to_dict()
 
+    def __reduce__(self):
+        return self.__class__.from_dict, (self.to_dict(),)
+
+    def __getattr__(self, name):
+        # NOTE: This is only called if `name` isn't set on the instance,
+        #       which is the case for the Cryptoconditions Fulfillment of a
+        #       lazily deserialized Fulfillment (see `from_dict`) until it is
+        #       accessed for the first time.
+        if name == 'fulfillment':
+            try:
+                fulfillment = CCFulfillment.from_uri(self._lazy_uri)
+            except ValueError:
+                raise InvalidSignature("Fulfillment URI couldn't been parsed")
+            # NOTE: The Fulfillment didn't change, so its revision stays
+            object.__setattr__(self, 'fulfillment', fulfillment)
+            return fulfillment
+        raise AttributeError(name)
+
+    def _serialize_uri(self):
+        """Returns the URI of the signed Cryptoconditions Fulfillment.
+
+            Note:
+                If the Fulfillment was parsed from a URI in `from_dict`, that
+                URI is returned instead of serializing the Fulfillment again.
+        """
+        try:
+            return self._cache['uri']
+        except KeyError:
+            return self.fulfillment.serialize_uri()
+
+    def _revision_key(self):
+        if self.tx_input is None:
+            return self._revision, None
+        return self._revision, self.tx_input._revision_key()
+
     def to_dict(self, fid=None):
         """Transforms the object to a Python dictionary.
 
@@ -69,7 +190,7 @@ class Fulfillment(object):
                 dict: The Fulfillment as an alternative serialization format.
         """
         try:
-            fulfillment = self.fulfillment.serialize_uri()
+            fulfillment = self._serialize_uri()
         except (TypeError, AttributeError):
             # NOTE: When a non-signed transaction is casted to a dict,
             #       `self.fulfillments` value is lost, as in the node's
@@ -105,7 +226,7 @@ class Fulfillment(object):
         return cls(condition.fulfillment, condition.owners_after)
 
     @classmethod
-    def from_dict(cls, ffill):
+    def from_dict(cls, ffill, lazy=False):
         """Transforms a Python dictionary to a Fulfillment object.
 
             Note:
@@ -114,6 +235,8 @@ class Fulfillment(object):
 
             Args:
                 ffill (dict): The Fulfillment to be transformed.
+                lazy (bool, optional): If `True`, a Fulfillment URI is only
+                    parsed once the `fulfillment` attribute is accessed.
 
             Returns:
                 :class:`~bigchaindb.common.transaction.Fulfillment`
@@ -121,6 +244,17 @@ class Fulfillment(object):
             Raises:
                 InvalidSignature: If a Fulfillment's URI couldn't be parsed.
         """
+        if lazy and isinstance(ffill['fulfillment'], str):
+            input_ = TransactionLink.from_dict(ffill['input'])
+            if not isinstance(ffill['owners_before'], list):
+                raise TypeError('`owners_after` must be a list instance')
+            fulfillment = cls.__new__(cls)
+            fulfillment._lazy_uri = ffill['fulfillment']
+            fulfillment.tx_input = input_
+            fulfillment.owners_before = ffill['owners_before']
+            fulfillment._cache['uri'] = ffill['fulfillment']
+            return fulfillment
+
         try:
             fulfillment = CCFulfillment.from_uri(ffill['fulfillment'])
         except ValueError:
@@ -131,10 +265,13 @@ class Fulfillment(object):
             #       `Fulfillment.to_dict`
             fulfillment = CCFulfillment.from_dict(ffill['fulfillment'])
         input_ = TransactionLink.from_dict(ffill['input'])
-        return cls(fulfillment, ffill['owners_before'], input_)
+        fulfillment = cls(fulfillment, ffill['owners_before'], input_)
+        if isinstance(ffill['fulfillment'], str):
+            fulfillment._cache['uri'] = ffill['fulfillment']
+        return fulfillment
 
 
-class TransactionLink(object):
+class TransactionLink(_Revisioned):
     """An object for unidirectional linking to a Transaction's Condition.
 
         Attributes:
@@ -142,6 +279,7 @@ class TransactionLink(object):
             cid (int, optional): A Condition's index in a Transaction with id
             `txid`.
     """
+    __slots__ = ('txid', 'cid')
 
     def __init__(self, txid=None, cid=None):
         """Used to point to a specific Condition of a Transaction.
@@ -164,6 +302,9 @@ class TransactionLink(object):
     def __bool__(self):
         return self.txid is not None and self.cid is not None
 
+    def __reduce__(self):
+        return self.__class__, (self.txid, self.cid)
+
     def __eq__(self, other):
         # TODO: If `other !== TransactionLink` return `False`
         return self.to_dict() == self.to_dict()
@@ -198,7 +339,7 @@ class TransactionLink(object):
             }
 
 
-class Condition(object):
+class Condition(_Revisioned):
     """A Condition is used to lock an asset.
 
         Attributes:
@@ -207,6 +348,7 @@ class Condition(object):
             owners_after (:obj:`list` of :obj:`str`, optional): A list of
                 owners before a Transaction was confirmed.
     """
+    __slots__ = ('fulfillment', 'owners_after', 'amount')
 
     def __init__(self, fulfillment, owners_after=None, amount=1):
         """Condition shims a Cryptocondition condition for BigchainDB.
@@ -234,6 +376,9 @@ class Condition(object):
         # TODO: If `other !== Condition` return `False`
         return self.to_dict() == other.to_dict()
 
+    def __reduce__(self):
+        return self.__class__.from_dict, (self.to_dict(),)
+
     def to_dict(self, cid=None):
         """Transforms the object to a Python dictionary.
 
@@ -259,7 +404,7 @@ class Condition(object):
             pass
 
         try:
-            condition['uri'] = self.fulfillment.condition_uri
+            condition['uri'] = self._condition_uri()
         except AttributeError:
             condition['uri'] = self.fulfillment
 
@@ -272,6 +417,19 @@ class Condition(object):
             cond['cid'] = cid
         return cond
 
+    def _condition_uri(self):
+        """Returns the (cached) URI of the Condition.
+
+            Raises:
+                AttributeError: If the Condition isn't derived from a
+                    Cryptoconditions Fulfillment (e.g. a hashlock).
+        """
+        try:
+            return self._cache['uri']
+        except KeyError:
+            uri = self._cache['uri'] = self.fulfillment.condition_uri
+            return uri
+
     @classmethod
     def generate(cls, owners_after, amount):
         """Generates a Condition from a specifically formed tuple or list.
@@ -389,7 +547,7 @@ class Condition(object):
         return cls(fulfillment, cond['owners_after'], cond['amount'])
 
 
-class Asset(object):
+class Asset(_Revisioned):
     """An Asset is a fungible unit to spend and lock with Transactions.
 
         Note:
@@ -405,6 +563,7 @@ class Asset(object):
             updatable (bool): A flag indicating if an Asset can be updated.
             refillable (bool): A flag indicating if an Asset can be refilled.
     """
+    __slots__ = ('data', 'data_id', 'divisible', 'updatable', 'refillable')
 
     def __init__(self, data=None, data_id=None, divisible=False,
                  updatable=False, refillable=False):
@@ -424,6 +583,9 @@ class Asset(object):
             return False
         return self.to_dict() == other_dict
 
+    def __reduce__(self):
+        return self.__class__.from_dict, (self.to_dict(),)
+
     def to_dict(self):
         """Transforms the object to a Python dictionary.
 
@@ -527,6 +689,7 @@ class Asset(object):
 class AssetLink(Asset):
     """An object for unidirectional linking to a Asset.
     """
+    __slots__ = ()
 
     def __init__(self, data_id=None):
         """Used to point to a specific Asset.
@@ -572,7 +735,7 @@ class AssetLink(Asset):
             }
 
 
-class Transaction(object):
+class Transaction(_Revisioned):
     """A Transaction is used to create and transfer assets.
 
         Note:
@@ -590,6 +753,9 @@ class Transaction(object):
                 Metadata to be stored along with the Transaction.
             version (int): Defines the version number of a Transaction.
     """
+    __slots__ = ('operation', 'asset', 'fulfillments', 'conditions',
+                 'metadata', 'version')
+
     CREATE = 'CREATE'
     TRANSFER = 'TRANSFER'
     GENESIS = 'GENESIS'
@@ -774,6 +940,11 @@ class Transaction(object):
             return False
         return self.to_dict() == other
 
+    def __reduce__(self):
+        # NOTE: The dictionary representation was produced by this very
+        #       object, so there's no need to validate it again.
+        return self.__class__.from_dict, (self.to_dict(), True)
+
     def to_inputs(self, condition_indices=None):
         """Converts a Transaction's Conditions to spendable Fulfillments.
 
@@ -870,21 +1041,64 @@ class Transaction(object):
         key_pairs = {gen_public_key(PrivateKey(private_key)):
                      PrivateKey(private_key) for private_key in private_keys}
 
+        messages = self._fulfillment_messages()
         for index, fulfillment in enumerate(self.fulfillments):
-            # NOTE: We clone the current transaction but only add the condition
-            #       and fulfillment we're currently working on plus all
-            #       previously signed ones.
-            tx_partial = Transaction(self.operation, self.asset, [fulfillment],
-                                     self.conditions, self.metadata,
-                                     self.version)
-
-            tx_partial_dict = tx_partial.to_dict()
-            tx_partial_dict = Transaction._remove_signatures(tx_partial_dict)
-            tx_serialized = Transaction._to_str(tx_partial_dict)
-            self._sign_fulfillment(fulfillment, index, tx_serialized,
+            self._sign_fulfillment(fulfillment, index, messages[index],
                                    key_pairs)
         return self
 
+    def _fulfillment_messages(self):
+        """Builds the messages the Fulfillments of the Transaction sign.
+
+            Note:
+                Each Fulfillment signs a partial Transaction that only
+                contains this very Fulfillment (at index 0 and without its
+                signature), including the id of that partial Transaction. As
+                all other parts of the partial Transactions are the same, they
+                are serialized only once and each Fulfillment is spliced in,
+                which results in exactly the same messages as serializing
+                every partial Transaction on its own.
+
+            Returns:
+                :obj:`list` of :obj:`str`: The message of each Fulfillment.
+        """
+        if self.operation in (self.__class__.GENESIS, self.__class__.CREATE):
+            asset = self.asset.to_dict()
+        else:
+            # NOTE: An `asset` in a `TRANSFER` only contains the asset's id
+            asset = {'id': self.asset.data_id}
+        conditions = [condition.to_dict(cid) for cid, condition
+                      in enumerate(self.conditions)]
+
+        # NOTE: The keys below have to be concatenated in sorted order, as
+        #       that's how `serialize` outputs them.
+        prefix = ''.join(('{"asset":', Transaction._to_str(asset),
+                          ',"conditions":', Transaction._to_str(conditions),
+                          ',"fulfillments":['))
+        suffix = ''.join((',"metadata":', Transaction._to_str(self.metadata),
+                          ',"operation":',
+                          Transaction._to_str(str(self.operation)),
+                          ',"version":', Transaction._to_str(self.version),
+                          '}'))
+
+        messages = []
+        for fulfillment in self.fulfillments:
+            try:
+                tx_input = fulfillment.tx_input.to_dict()
+            except AttributeError:
+                tx_input = None
+            ffill = {
+                'owners_before': fulfillment.owners_before,
+                'input': tx_input,
+                'fulfillment': None,
+                'fid': 0,
+            }
+            tx_partial = prefix + Transaction._to_str(ffill) + ']'
+            tx_id = Transaction._to_hash(tx_partial + suffix)
+            messages.append(''.join((tx_partial, ',"id":',
+                                     Transaction._to_str(tx_id), suffix)))
+        return messages
+
     def _sign_fulfillment(self, fulfillment, index, tx_serialized, key_pairs):
         """Signs a single Fulfillment with a partial Transaction as message.
 
@@ -940,6 +1154,9 @@ class Transaction(object):
             raise KeypairMismatchException('Public key {} is not a pair to '
                                            'any of the private keys'
                                            .format(owner_before))
+        # NOTE: The Cryptoconditions Fulfillment was signed in place, so the
+        #       URI cached with the copy is stale.
+        fulfillment._touch()
         self.fulfillments[index] = fulfillment
 
     def _sign_threshold_signature_fulfillment(self, fulfillment, index,
@@ -982,6 +1199,8 @@ class Transaction(object):
             # cryptoconditions makes no assumptions of the encoding of the
             # message to sign or verify. It only accepts bytestrings
             subffill.sign(tx_serialized.encode(), private_key)
+        # NOTE: See `_sign_simple_signature_fulfillment`
+        fulfillment._touch()
         self.fulfillments[index] = fulfillment
 
     def fulfillments_valid(self, input_conditions=None):
@@ -1001,21 +1220,90 @@ class Transaction(object):
             Returns:
                 bool: If all Fulfillments are valid.
         """
+        return self._fulfillments_valid(
+            self._input_condition_uris(input_conditions))
+
+    def _input_condition_uris(self, input_conditions=None):
+        """Returns the Condition URIs the Fulfillments are validated against.
+
+            Args:
+                input_conditions (:obj:`list` of :class:`~bigchaindb.common.
+                    transaction.Condition`): A list of Conditions to check the
+                    Fulfillments against.
+
+            Returns:
+                :obj:`list` of :obj:`str`
+        """
         if self.operation in (Transaction.CREATE, Transaction.GENESIS):
             # NOTE: Since in the case of a `CREATE`-transaction we do not have
             #       to check for input_conditions, we're just submitting dummy
             #       values to the actual method. This simplifies it's logic
             #       greatly, as we do not have to check against `None` values.
-            return self._fulfillments_valid(['dummyvalue'
-                                             for cond in self.fulfillments])
+            return ['dummyvalue' for cond in self.fulfillments]
         elif self.operation == Transaction.TRANSFER:
-            return self._fulfillments_valid([cond.fulfillment.condition_uri
-                                             for cond in input_conditions])
+            return [cond._condition_uri() for cond in input_conditions]
         else:
             allowed_ops = ', '.join(self.__class__.ALLOWED_OPERATIONS)
             raise TypeError('`operation` must be one of {}'
                             .format(allowed_ops))
 
+    @staticmethod
+    def verify_many(transactions, input_conditions=None, executor=None):
+        """Validates the Fulfillments of many Transactions at once.
+
+            Note:
+                All Fulfillments of all `transactions` (e.g. of a whole Block)
+                are collected together with the message they have signed and
+                are then verified on a pool of threads. The cryptoconditions
+                library doesn't provide Ed25519 batch verification, but its
+                backend (libsodium) releases the GIL while verifying a
+                signature, so the signatures are checked in parallel.
+
+            Args:
+                transactions (:obj:`list` of :class:`~bigchaindb.common.
+                    transaction.Transaction`): The Transactions to validate.
+                input_conditions (:obj:`list` of :obj:`list` of
+                    :class:`~bigchaindb.common.transaction.Condition`,
+                    optional): For each Transaction, the Conditions to check
+                    its Fulfillments against (see `fulfillments_valid`).
+                executor (:class:`concurrent.futures.ThreadPoolExecutor`,
+                    optional): The pool of threads to use. Defaults to a
+                    pool shared by all calls, with a thread per CPU.
+
+            Returns:
+                :obj:`list` of bool: For each Transaction, if all its
+                Fulfillments are valid.
+        """
+        if input_conditions is None:
+            input_conditions = [None] * len(transactions)
+
+        checks = []
+        for index, tx in enumerate(transactions):
+            input_condition_uris = tx._input_condition_uris(
+                input_conditions[index])
+            if len(tx.fulfillments) != len(input_condition_uris):
+                raise ValueError('Fulfillments and '
+                                 'input_condition_uris must have the same '
+                                 'count')
+            checks.extend((index, fulfillment, tx.operation, message,
+                           input_condition_uri)
+                          for fulfillment, message, input_condition_uri
+                          in zip(tx.fulfillments, tx._fulfillment_messages(),
+                                 input_condition_uris))
+
+        def verify(check):
+            return Transaction._fulfillment_valid(*check[1:])
+
+        valid = [True] * len(transactions)
+        if not checks:
+            return valid
+
+        executor = executor or _get_verify_executor()
+        for check, check_valid in zip(checks, executor.map(verify, checks)):
+            if not check_valid:
+                valid[check[0]] = False
+        return valid
+
     def _fulfillments_valid(self, input_condition_uris):
         """Validates a Fulfillment against a given set of Conditions.
 
@@ -1033,28 +1321,16 @@ class Transaction(object):
         input_condition_uris_count = len(input_condition_uris)
         fulfillments_count = len(self.fulfillments)
 
-        def gen_tx(fulfillment, condition, input_condition_uri=None):
-            """Splits multiple IO Transactions into partial single IO
-            Transactions.
-            """
-            tx = Transaction(self.operation, self.asset, [fulfillment],
-                             self.conditions, self.metadata, self.version)
-            tx_dict = tx.to_dict()
-            tx_dict = Transaction._remove_signatures(tx_dict)
-            tx_serialized = Transaction._to_str(tx_dict)
-
-            # TODO: Use local reference to class, not `Transaction.`
-            return Transaction._fulfillment_valid(fulfillment, self.operation,
-                                                  tx_serialized,
-                                                  input_condition_uri)
-
         if not fulfillments_count == input_condition_uris_count:
             raise ValueError('Fulfillments and '
                              'input_condition_uris must have the same count')
 
-        partial_transactions = map(gen_tx, self.fulfillments,
-                                   self.conditions, input_condition_uris)
-        return all(partial_transactions)
+        messages = self._fulfillment_messages()
+        # TODO: Use local reference to class, not `Transaction.`
+        return all(Transaction._fulfillment_valid(fulfillment, self.operation,
+                                                  message, input_condition_uri)
+                   for fulfillment, message, input_condition_uri
+                   in zip(self.fulfillments, messages, input_condition_uris))
 
     @staticmethod
     def _fulfillment_valid(fulfillment, operation, tx_serialized,
@@ -1077,9 +1353,9 @@ class Transaction(object):
             Returns:
                 bool: If the Fulfillment is valid.
         """
-        ccffill = fulfillment.fulfillment
         try:
-            parsed_ffill = CCFulfillment.from_uri(ccffill.serialize_uri())
+            parsed_ffill, condition_uri = _parse_fulfillment_uri(
+                fulfillment._serialize_uri())
         except (TypeError, ValueError, ParsingError):
             return False
 
@@ -1088,7 +1364,7 @@ class Transaction(object):
             #       input condition is always validate to `True`.
             input_cond_valid = True
         else:
-            input_cond_valid = input_condition_uri == ccffill.condition_uri
+            input_cond_valid = input_condition_uri == condition_uri
 
         # NOTE: We pass a timestamp to `.validate`, as in case of a timeout
         #       condition we'll have to validate against it
@@ -1104,13 +1380,19 @@ class Transaction(object):
             Returns:
                 dict: The Transaction as an alternative serialization format.
         """
+        tx = self._to_body()
+        tx['id'] = self._canonical(tx)['id']
+        return tx
+
+    def _to_body(self):
+        """Transforms the object to a Python dictionary without an id."""
         if self.operation in (self.__class__.GENESIS, self.__class__.CREATE):
             asset = self.asset.to_dict()
         else:
             # NOTE: An `asset` in a `TRANSFER` only contains the asset's id
             asset = {'id': self.asset.data_id}
 
-        tx = {
+        return {
             'fulfillments': [fulfillment.to_dict(fid) for fid, fulfillment
                              in enumerate(self.fulfillments)],
             'conditions': [condition.to_dict(cid) for cid, condition
@@ -1121,12 +1403,37 @@ class Transaction(object):
             'version': self.version,
         }
 
-        tx_no_signatures = Transaction._remove_signatures(tx)
-        tx_serialized = Transaction._to_str(tx_no_signatures)
-        tx_id = Transaction._to_hash(tx_serialized)
+    def _revision_key(self):
+        return (self._revision, self.asset._revision_key(),
+                tuple(ffill._revision_key() for ffill in self.fulfillments),
+                tuple(cond._revision_key() for cond in self.conditions))
 
-        tx['id'] = tx_id
-        return tx
+    def _canonical(self, tx_body=None):
+        """Returns the cached signature-less serialization and id.
+
+            Note:
+                The cache is invalidated whenever the Transaction or one of
+                its Fulfillments, Conditions or its Asset is assigned a new
+                attribute value.
+
+            Args:
+                tx_body (dict, optional): The Transaction's dictionary
+                    representation, if already available.
+
+            Returns:
+                dict: The `serialized` canonical body and its `id`.
+        """
+        key = self._revision_key()
+        if self._cache.get('key') != key:
+            if tx_body is None:
+                tx_body = self._to_body()
+            tx_serialized = Transaction._to_str_without_signatures(tx_body)
+            self._cache = {
+                'key': key,
+                'serialized': tx_serialized,
+                'id': Transaction._to_hash(tx_serialized),
+            }
+        return self._cache
 
     @staticmethod
     # TODO: Remove `_dict` prefix of variable.
@@ -1151,6 +1458,30 @@ class Transaction(object):
             fulfillment['fulfillment'] = None
         return tx_dict
 
+    @staticmethod
+    def _to_str_without_signatures(tx_dict):
+        """Serializes a Transaction dictionary without its signatures.
+
+            Note:
+                The result is identical to
+                `_to_str(_remove_signatures(tx_dict))`, but instead of
+                deep-copying the whole Transaction (including potentially
+                large `metadata` and `asset` payloads), only the top-level
+                dictionary and the Fulfillment dictionaries are shallow-copied
+                so that the payloads are serialized in place.
+
+            Args:
+                tx_dict (dict): The Transaction to serialize.
+
+            Returns:
+                str
+        """
+        tx_dict = dict(tx_dict)
+        tx_dict['fulfillments'] = [dict(fulfillment, fulfillment=None)
+                                   for fulfillment
+                                   in tx_dict['fulfillments']]
+        return Transaction._to_str(tx_dict)
+
     @staticmethod
     def _to_hash(value):
         return hash_data(value)
@@ -1160,16 +1491,15 @@ class Transaction(object):
         return self.to_hash()
 
     def to_hash(self):
-        return self.to_dict()['id']
+        return self._canonical()['id']
 
     @staticmethod
     def _to_str(value):
         return serialize(value)
 
-    # TODO: This method shouldn't call `_remove_signatures`
+    # TODO: This method shouldn't remove the signatures
     def __str__(self):
-        tx = Transaction._remove_signatures(self.to_dict())
-        return Transaction._to_str(tx)
+        return Transaction._to_str_without_signatures(self.to_dict())
 
     @staticmethod
     def validate_structure(tx_body):
@@ -1179,32 +1509,40 @@ class Transaction(object):
                 tx_body (dict): The Transaction to be transformed.
         """
         # NOTE: Remove reference to avoid side effects
-        tx_body = deepcopy(tx_body)
+        tx_body = dict(tx_body)
         try:
             proposed_tx_id = tx_body.pop('id')
         except KeyError:
             raise InvalidHash()
 
-        tx_body_no_signatures = Transaction._remove_signatures(tx_body)
-        tx_body_serialized = Transaction._to_str(tx_body_no_signatures)
+        tx_body_serialized = Transaction._to_str_without_signatures(tx_body)
         valid_tx_id = Transaction._to_hash(tx_body_serialized)
 
         if proposed_tx_id != valid_tx_id:
             raise InvalidHash()
 
     @classmethod
-    def from_dict(cls, tx):
+    def from_dict(cls, tx, trusted=False):
         """Transforms a Python dictionary to a Transaction object.
 
+            Note:
+                A `trusted` Transaction, e.g. one read from a block this node
+                has already validated, is not checked against its id. Its id
+                is taken as is and its Fulfillment URIs are only parsed when
+                they're actually used.
+
             Args:
                 tx_body (dict): The Transaction to be transformed.
+                trusted (bool, optional): If the Transaction is known to be
+                    well-formed.
 
             Returns:
                 :class:`~bigchaindb.common.transaction.Transaction`
         """
-        cls.validate_structure(tx)
-        fulfillments = [Fulfillment.from_dict(fulfillment) for fulfillment
-                        in tx['fulfillments']]
+        if not trusted:
+            cls.validate_structure(tx)
+        fulfillments = [Fulfillment.from_dict(fulfillment, lazy=trusted)
+                        for fulfillment in tx['fulfillments']]
         conditions = [Condition.from_dict(condition) for condition
                       in tx['conditions']]
         if tx['operation'] in [cls.CREATE, cls.GENESIS]:
@@ -1212,5 +1550,14 @@ class Transaction(object):
         else:
             asset = AssetLink.from_dict(tx['asset'])
 
-        return cls(tx['operation'], asset, fulfillments, conditions,
-                   tx['metadata'], tx['version'])
+        transaction = cls(tx['operation'], asset, fulfillments, conditions,
+                          tx['metadata'], tx['version'])
+        if trusted:
+            tx_body = dict(tx)
+            tx_id = tx_body.pop('id')
+            transaction._cache = {
+                'key': transaction._revision_key(),
+                'serialized': cls._to_str_without_signatures(tx_body),
+                'id': tx_id,
+            }
+        return transaction
@@ -1,4 +1,5 @@
 from bigchaindb.util import verify_vote_signature
+from bigchaindb.models import Transaction
 
 
 class BaseConsensusRules():
@@ -13,6 +14,22 @@ class BaseConsensusRules():
         """
         return transaction.validate(bigchain)
 
+    @staticmethod
+    def validate_transactions(bigchain, transactions):
+        """See :meth:`bigchaindb.models.Transaction.validate_many`
+        for documentation.
+
+        """
+        return Transaction.validate_many(bigchain, transactions)
+
+    @staticmethod
+    def validate_each_transaction(bigchain, transactions):
+        """See :meth:`bigchaindb.models.Transaction.validate_each`
+        for documentation.
+
+        """
+        return Transaction.validate_each(bigchain, transactions)
+
     @staticmethod
     def validate_block(bigchain, block):
         """See :meth:`bigchaindb.models.Block.validate` for documentation."""
@@ -3,7 +3,7 @@ import math
 import collections
 from time import time
 
-from itertools import compress
+from itertools import compress, islice
 from bigchaindb.common import crypto, exceptions
 from bigchaindb.common.util import gen_timestamp, serialize
 from bigchaindb.common.transaction import TransactionLink, Asset
@@ -13,7 +13,25 @@ import bigchaindb
 from bigchaindb.db.utils import Connection, get_backend
 from bigchaindb import config_utils, util
 from bigchaindb.consensus import BaseConsensusRules
-from bigchaindb.models import Block, Transaction
+from bigchaindb.models import Block, Transaction, INVALID_TRANSACTION_ERRORS
+
+
+# The number of decided blocks whose status a Bigchain instance remembers
+DECIDED_BLOCKS_CACHE_SIZE = 2**14
+
+# The number of asset definitions a Bigchain instance remembers
+ASSETS_CACHE_SIZE = 2**14
+
+# The number of transactions of an asset read with each query
+ASSET_TRANSACTIONS_CHUNK_SIZE = 100
+
+# The number of transactions written to the backlog with each query
+WRITE_TRANSACTIONS_CHUNK_SIZE = 1000
+
+# How long before the last block a node voted on to look for the blocks it has
+# not voted on (in seconds), since the clocks of the nodes writing the blocks
+# may not be in sync
+UNVOTED_BLOCKS_CHECKPOINT_MARGIN = 60
 
 
 class Bigchain(object):
@@ -68,6 +86,12 @@ class Bigchain(object):
         self.consensus = BaseConsensusRules
         # change RethinkDB read mode to majority.  This ensures consistency in query results
         self.read_mode = 'majority'
+        # the status of the blocks that have been decided. Once a block is
+        # decided, its status never changes.
+        self.decided_blocks = collections.OrderedDict()
+        # the asset definitions used recently. Asset definitions are
+        # immutable.
+        self.assets = collections.OrderedDict()
 
         if not self.me or not self.me_private:
             raise exceptions.KeypairNotFoundException()
@@ -86,6 +110,44 @@ class Bigchain(object):
         Returns:
             dict: database response
         """
+        signed_transaction = self.assign_transaction(signed_transaction)
+
+        # write to the backlog
+        return self.backend.write_transaction(signed_transaction)
+
+    def write_transactions(self, signed_transactions, durability='soft'):
+        """Write many transactions to bigchain.
+
+        The transactions are written to the backlog in chunks, with one query per chunk (see
+        :meth:`write_transaction`).
+
+        Args:
+            signed_transactions (iterable): transactions (Transaction) with the `signature` included.
+            durability (str): the durability of the writes.
+
+        Returns:
+            :obj:`list` of :obj:`dict`: the database response for each chunk
+        """
+        signed_transactions = iter(signed_transactions)
+        responses = []
+        while True:
+            chunk = [self.assign_transaction(signed_transaction) for signed_transaction
+                     in islice(signed_transactions, WRITE_TRANSACTIONS_CHUNK_SIZE)]
+            if not chunk:
+                return responses
+
+            # write to the backlog
+            responses.append(self.backend.write_transactions(chunk, durability=durability))
+
+    def assign_transaction(self, signed_transaction):
+        """Assign a transaction to a node before writing it to the backlog.
+
+        Args:
+            signed_transaction (Transaction): transaction with the `signature` included.
+
+        Returns:
+            dict: the transaction, with its `assignee` and `assignment_timestamp`
+        """
         signed_transaction = signed_transaction.to_dict()
 
         # we will assign this transaction to `one` node. This way we make sure that there are no duplicate
@@ -98,9 +160,7 @@ class Bigchain(object):
 
         signed_transaction.update({'assignee': assignee})
         signed_transaction.update({'assignment_timestamp': time()})
-
-        # write to the backlog
-        return self.backend.write_transaction(signed_transaction)
+        return signed_transaction
 
     def reassign_transaction(self, transaction):
         """Assign a transaction to a new node
@@ -112,6 +172,35 @@ class Bigchain(object):
             dict: database response or None if no reassignment is possible
         """
 
+        return self.reassign_transactions([transaction])
+
+    def reassign_transactions(self, transactions):
+        """Assign many transactions to new nodes, with a single query.
+
+        Args:
+            transactions (:obj:`list` of :obj:`dict`): assigned transactions
+
+        Returns:
+            dict: database response
+        """
+
+        assignment_timestamp = time()
+        return self.backend.update_transactions([
+            {'id': transaction['id'],
+             'assignee': self._get_new_assignee(transaction),
+             'assignment_timestamp': assignment_timestamp}
+            for transaction in transactions])
+
+    def _get_new_assignee(self, transaction):
+        """Choose a new node to assign a transaction to.
+
+        Args:
+            transaction (dict): assigned transaction
+
+        Returns:
+            str: the public key of the new assignee
+        """
+
         if self.nodes_except_me:
             try:
                 federation_nodes = self.nodes_except_me + [self.me]
@@ -126,9 +215,7 @@ class Bigchain(object):
             # There is no other node to assign to
             new_assignee = self.me
 
-        return self.backend.update_transaction(
-                transaction['id'],
-                {'assignee': new_assignee, 'assignment_timestamp': time()})
+        return new_assignee
 
     def delete_transaction(self, *transaction_id):
         """Delete a transaction from the backlog.
@@ -164,6 +251,19 @@ class Bigchain(object):
 
         return self.consensus.validate_transaction(self, transaction)
 
+    def validate_transactions(self, transactions):
+        """Validate many transactions at once, e.g. the ones of a block.
+
+        Args:
+            transactions (list(Transaction)): transactions to validate.
+
+        Returns:
+            The transactions if all of them are valid else it raises an
+            exception describing the reason why a transaction is invalid.
+        """
+
+        return self.consensus.validate_transactions(self, transactions)
+
     def is_valid_transaction(self, transaction):
         """Check whether a transaction is valid or invalid.
 
@@ -182,13 +282,25 @@ class Bigchain(object):
 
         try:
             return self.validate_transaction(transaction)
-        except (ValueError, exceptions.OperationError,
-                exceptions.TransactionDoesNotExist,
-                exceptions.TransactionOwnerError, exceptions.DoubleSpend,
-                exceptions.InvalidHash, exceptions.InvalidSignature,
-                exceptions.TransactionNotInValidBlock, exceptions.AmountError):
+        except INVALID_TRANSACTION_ERRORS:
             return False
 
+    def validate_each_transaction(self, transactions):
+        """Validate many transactions independently of each other.
+
+        Unlike :meth:`validate_transactions`, an invalid transaction doesn't
+        make the others invalid.
+
+        Args:
+            transactions (list(Transaction)): transactions to validate.
+
+        Returns:
+            list: For each transaction, the transaction if it is valid, else
+            the exception describing the reason why it is invalid.
+        """
+
+        return self.consensus.validate_each_transaction(self, transactions)
+
     def get_block(self, block_id, include_status=False):
         """Get the block with the specified `block_id` (and optionally its status)
 
@@ -211,6 +323,16 @@ class Bigchain(object):
         else:
             return block
 
+    def get_block_voters(self, block_id):
+        """Get the voters of the block with the specified `block_id`
+
+        Only the voters are read, not the transactions of the block.
+
+        Returns:
+            The list of the voters, or None if the block does not exist.
+        """
+        return self.backend.get_block_voters(block_id)
+
     def get_transaction(self, txid, include_status=False):
         """Get the transaction with the specified `txid` (and optionally its status)
 
@@ -235,50 +357,78 @@ class Bigchain(object):
             transaction's status if the transaction was found.
         """
 
-        response, tx_status = None, None
-
-        validity = self.get_blocks_status_containing_tx(txid)
-        check_backlog = True
-
-        if validity:
-            # Disregard invalid blocks, and return if there are no valid or undecided blocks
-            validity = {_id: status for _id, status in validity.items()
-                        if status != Bigchain.BLOCK_INVALID}
-            if validity:
-
-                # The transaction _was_ found in an undecided or valid block,
-                # so there's no need to look in the backlog table
-                check_backlog = False
-
-                tx_status = self.TX_UNDECIDED
-                # If the transaction is in a valid or any undecided block, return it. Does not check
-                # if transactions in undecided blocks are consistent, but selects the valid block
-                # before undecided ones
-                for target_block_id in validity:
-                    if validity[target_block_id] == Bigchain.BLOCK_VALID:
-                        tx_status = self.TX_VALID
-                        break
-
-                # Query the transaction in the target block and return
-                response = self.backend.get_transaction_from_block(txid, target_block_id)
-
-        if check_backlog:
+        # get the blocks containing the transaction, together with the
+        # transaction and the votes on each block, in a single query
+        blocks = list(self.backend.get_blocks_status_from_transaction(
+            txid, include_transaction=True))
+        validity = self.get_blocks_status(txid, blocks)
+        tx_status, target_block_id = self.get_tx_status(validity)
+
+        if target_block_id is not None:
+            # The transaction _was_ found in an undecided or valid block,
+            # so there's no need to look in the backlog table
+            target_block = next(block for block in blocks
+                                if block['id'] == target_block_id)
+            # transactions read from validated blocks are not checked again
+            response = Transaction.from_dict(
+                target_block['transaction'],
+                trusted=self._validated_block(target_block, validity[target_block_id]))
+        else:
             response = self.backend.get_transaction_from_backlog(txid)
-
             if response:
                 tx_status = self.TX_IN_BACKLOG
-
-        if response:
-            response = Transaction.from_dict(response)
+                response = Transaction.from_dict(response)
 
         if include_status:
             return response, tx_status
         else:
             return response
 
+    def get_transactions(self, txids):
+        """Get many transactions with their status at once.
+
+        The transactions are looked up the same way as in
+        :meth:`get_transaction`, but the blocks containing them, with their
+        votes, are read in a single query, and so are the transactions found
+        in the backlog.
+
+        Args:
+            txids (:obj:`list` of :obj:`str`): transaction ids of the
+                transactions to get.
+
+        Returns:
+            dict: A ``(tx, status)`` tuple for each of the `txids`, or
+            ``(None, None)`` if the transaction was not found.
+        """
+        blocks = collections.defaultdict(dict)
+        for result in self.backend.get_blocks_status_from_transactions(list(txids)):
+            blocks[result['transaction']['id']][result['id']] = result
+
+        transactions = {}
+        for txid in txids:
+            validity = self.get_blocks_status(txid, list(blocks[txid].values()))
+            tx_status, target_block_id = self.get_tx_status(validity)
+            if target_block_id is not None:
+                target_block = blocks[txid][target_block_id]
+                # transactions read from validated blocks are not checked again
+                transaction = Transaction.from_dict(
+                    target_block['transaction'],
+                    trusted=self._validated_block(target_block, validity[target_block_id]))
+                transactions[txid] = transaction, tx_status
+
+        missing = [txid for txid in txids if txid not in transactions]
+        for transaction in self.backend.get_transactions_from_backlog(missing):
+            transactions[transaction['id']] = (Transaction.from_dict(transaction),
+                                               self.TX_IN_BACKLOG)
+
+        return {txid: transactions.get(txid, (None, None)) for txid in txids}
+
     def get_status(self, txid):
         """Retrieve the status of a transaction with `txid` from bigchain.
 
+        Unlike :meth:`get_transaction`, this never reads the transaction
+        itself.
+
         Args:
             txid (str): transaction id of the transaction to query
 
@@ -287,9 +437,61 @@ class Bigchain(object):
             or 'backlog'). If no transaction with that `txid` was found it
             returns `None`
         """
-        _, status = self.get_transaction(txid, include_status=True)
+        validity = self.get_blocks_status_containing_tx(txid)
+        status, _ = self.get_tx_status(validity)
+
+        if status is None and self.backend.is_transaction_in_backlog(txid):
+            status = self.TX_IN_BACKLOG
         return status
 
+    def get_tx_status(self, validity):
+        """Determine the status of a transaction from the statuses of the
+        blocks containing it.
+
+        Args:
+            validity (dict): the statuses of the blocks containing the
+                transaction (see :meth:`get_blocks_status_containing_tx`).
+
+        Returns:
+            tuple: The status of the transaction and the id of the block to
+            read it from, or ``(None, None)`` if it is only in invalid blocks
+            or in none.
+        """
+        # Disregard invalid blocks, and return if there are no valid or undecided blocks
+        validity = {_id: status for _id, status in (validity or {}).items()
+                    if status != Bigchain.BLOCK_INVALID}
+        if not validity:
+            return None, None
+
+        tx_status = self.TX_UNDECIDED
+        # If the transaction is in a valid or any undecided block, return it. Does not check
+        # if transactions in undecided blocks are consistent, but selects the valid block
+        # before undecided ones
+        for target_block_id in validity:
+            if validity[target_block_id] == Bigchain.BLOCK_VALID:
+                tx_status = self.TX_VALID
+                break
+
+        return tx_status, target_block_id
+
+    def _validated_block(self, block, status):
+        """Tell if the transactions of a block were validated, so that they can be read as trusted.
+
+        They were if the block is valid, or if this node voted it valid.
+
+        Args:
+            block (dict): the `id`, `voters` and `votes` of the block.
+            status (str): the status of the block.
+
+        Returns:
+            bool: ``True`` if the transactions of the block were validated.
+        """
+        if status == Bigchain.BLOCK_VALID:
+            return True
+        return any(vote['node_pubkey'] == self.me and vote['vote']['is_block_valid'] and
+                   util.verify_vote_signature(block['voters'], vote)
+                   for vote in block['votes'])
+
     def get_blocks_status_containing_tx(self, txid):
         """Retrieve block ids and statuses related to a transaction
 
@@ -303,14 +505,30 @@ class Bigchain(object):
             e.g. {block_id_1: 'valid', block_id_2: 'invalid' ...}, or None
         """
 
-        # First, get information on all blocks which contain this transaction
+        # First, get information on all blocks which contain this transaction,
+        # with the votes on them
         blocks = self.backend.get_blocks_status_from_transaction(txid)
+        return self.get_blocks_status(txid, blocks)
+
+    def get_blocks_status(self, txid, blocks):
+        """Determine the statuses of the blocks containing a transaction.
+
+        Args:
+            txid (str): transaction id of the transaction.
+            blocks (iterable): the blocks containing the transaction, with
+                their votes (see :meth:`get_blocks_status_containing_tx`).
+
+        Returns:
+            A dict of blocks containing the transaction,
+            e.g. {block_id_1: 'valid', block_id_2: 'invalid' ...}, or None
+        """
         if blocks:
             # Determine the election status of each block
             validity = {
                 block['id']: self.block_election_status(
                     block['id'],
-                    block['block']['voters']
+                    block['voters'],
+                    votes=block['votes']
                 ) for block in blocks
             }
 
@@ -330,7 +548,7 @@ class Bigchain(object):
         else:
             return None
 
-    def get_transactions_by_asset_id(self, asset_id):
+    def get_transactions_by_asset_id(self, asset_id, offset=0, limit=None):
         """Retrieves valid or undecided transactions related to a particular
         asset.
 
@@ -340,19 +558,63 @@ class Bigchain(object):
 
         Args:
             asset_id (str): the id for this particular asset.
+            offset (int): the number of transactions to skip.
+            limit (int): the maximum number of transactions to return.
 
         Returns:
             A list of valid or undecided transactions related to the asset.
             If no transaction exists for that asset it returns an empty list
             `[]`
         """
-        txids = self.backend.get_txids_by_asset_id(asset_id)
-        transactions = []
-        for txid in txids:
-            tx = self.get_transaction(txid)
-            if tx:
-                transactions.append(tx)
-        return transactions
+        return list(self.iter_transactions_by_asset_id(asset_id, offset, limit))
+
+    def iter_transactions_by_asset_id(self, asset_id, offset=0, limit=None):
+        """Iterate over the valid or undecided transactions related to a particular asset.
+
+        The transactions are ordered by the timestamp of the block they are read from, and then
+        by their position in the block. The ids of the transactions and the statuses of the
+        blocks containing them are read in a single query, and the transactions themselves are
+        then read in chunks, as the iteration goes.
+
+        Args:
+            asset_id (str): the id for this particular asset.
+            offset (int): the number of transactions to skip.
+            limit (int): the maximum number of transactions to yield.
+
+        Yields:
+            The valid or undecided transactions (Transaction) related to the asset.
+        """
+        blocks = collections.defaultdict(list)
+        positions = {}
+        for block in self.backend.get_blocks_status_from_asset_id(asset_id):
+            for position, txid in enumerate(block['transaction_ids']):
+                blocks[txid].append(block)
+                positions[(txid, block['id'])] = int(block['timestamp']), block['id'], position
+
+        # the block to read each transaction from
+        targets = []
+        trusted = set()
+        for txid, tx_blocks in blocks.items():
+            validity = self.get_blocks_status(txid, tx_blocks)
+            _, target_block_id = self.get_tx_status(validity)
+            if target_block_id is not None:
+                targets.append((txid, target_block_id))
+                target_block = next(block for block in tx_blocks if block['id'] == target_block_id)
+                if self._validated_block(target_block, validity[target_block_id]):
+                    trusted.add(txid)
+        targets.sort(key=lambda target: positions[target])
+
+        stop = offset + limit if limit is not None else None
+        targets = targets[offset:stop]
+        for start in range(0, len(targets), ASSET_TRANSACTIONS_CHUNK_SIZE):
+            chunk = targets[start:start + ASSET_TRANSACTIONS_CHUNK_SIZE]
+            transactions = {
+                transaction['id']: transaction for transaction in self.backend.get_transactions_from_blocks(
+                    list({block_id for _, block_id in chunk}), [txid for txid, _ in chunk])
+            }
+            for txid, _ in chunk:
+                # transactions read from validated blocks are not checked again
+                yield Transaction.from_dict(transactions[txid], trusted=txid in trusted)
 
     def get_asset_by_id(self, asset_id):
         """Returns the asset associated with an asset_id.
@@ -364,10 +626,44 @@ class Bigchain(object):
                 :class:`~bigchaindb.common.transaction.Asset` if the asset
                 exists else None.
         """
-        cursor = self.backend.get_asset_by_id(asset_id)
-        cursor = list(cursor)
-        if cursor:
-            return Asset.from_dict(cursor[0]['asset'])
+        return self.get_assets_by_ids([asset_id]).get(asset_id)
+
+    def get_assets_by_ids(self, asset_ids):
+        """Returns the assets associated with many asset_ids.
+
+        The assets used recently are remembered. The others are read from the
+        assets table in a single query, and the assets created before the
+        assets table existed are looked up in the blocks.
+
+            Args:
+                asset_ids (:obj:`list` of :obj:`str`): The asset ids.
+
+            Returns:
+                dict: The :class:`~bigchaindb.common.transaction.Asset` of
+                each asset id that exists.
+        """
+        assets = {}
+        for asset_id in asset_ids:
+            if asset_id in self.assets:
+                self.assets.move_to_end(asset_id)
+                assets[asset_id] = self.assets[asset_id]
+
+        missing = [asset_id for asset_id in asset_ids if asset_id not in assets]
+        if missing:
+            for result in self.backend.get_asset_definitions(missing):
+                assets[result['id']] = Asset.from_dict(result)
+
+            missing = [asset_id for asset_id in missing if asset_id not in assets]
+        if missing:
+            for result in self.backend.get_assets_by_ids(missing):
+                assets[result['asset']['id']] = Asset.from_dict(result['asset'])
+
+        for asset_id, asset in assets.items():
+            if asset_id not in self.assets:
+                self.assets[asset_id] = asset
+                if len(self.assets) > ASSETS_CACHE_SIZE:
+                    self.assets.popitem(last=False)
+        return assets
 
     def get_spent(self, txid, cid):
         """Check if a `txid` was already used as an input.
@@ -383,19 +679,68 @@ class Bigchain(object):
             The transaction (Transaction) that used the `txid` as an input else
             `None`
         """
-        # checks if an input was already spent
-        # checks if the bigchain has any transaction with input {'txid': ..., 'cid': ...}
-        transactions = list(self.backend.get_spent(txid, cid))
+        return self.get_spent_many([(txid, cid)])[(txid, cid)]
+
+    def get_spent_many(self, tx_inputs):
+        """Check which of many conditions were already used as inputs.
 
-        # a transaction_id should have been spent at most one time
-        if transactions:
+        All the conditions are checked with a single query (see
+        :meth:`get_spent`).
+
+        Args:
+            tx_inputs (:obj:`list` of :obj:`tuple`): the `(txid, cid)` pairs
+                of the conditions to check.
+
+        Returns:
+            dict: The transaction (Transaction) that used each `(txid, cid)`
+            as an input, else `None`.
+        """
+        # checks if the bigchain has any transaction with input {'txid': ..., 'cid': ...}
+        spent = collections.defaultdict(list)
+        seen = set()
+        for result in self.backend.get_spent_many(tx_inputs):
+            tx_input = tuple(result['input'])
+            key = tx_input, result['id'], result['transaction']['id']
+            if key not in seen:
+                seen.add(key)
+                spent[tx_input].append(result)
+
+        statuses = {}
+        backlog = {}
+
+        def not_invalid(result):
+            block_id = result['id']
+            if block_id not in statuses:
+                statuses[block_id] = self.block_election_status(
+                    block_id, result['voters'], result['votes'])
+            return statuses[block_id] != Bigchain.BLOCK_INVALID
+
+        def in_backlog(transaction_id):
+            if transaction_id not in backlog:
+                backlog[transaction_id] = \
+                    self.backend.is_transaction_in_backlog(transaction_id)
+            return backlog[transaction_id]
+
+        spent_by = {}
+        for txid, cid in tx_inputs:
+            results = spent[(txid, cid)]
+            # the transactions appearing in a valid or undecided block
+            valid_transaction_ids = {result['transaction']['id']
+                                     for result in results
+                                     if not_invalid(result)}
+
+            # a transaction_id should have been spent at most one time
             # determine if these valid transactions appear in more than one valid block
             num_valid_transactions = 0
-            for transaction in transactions:
-                # ignore invalid blocks
-                # FIXME: Isn't there a faster solution than doing I/O again?
-                if self.get_transaction(transaction['id']):
+            spending = None
+            for result in results:
+                transaction_id = result['transaction']['id']
+                # ignore invalid blocks, unless the transaction went back
+                # to the backlog
+                if (transaction_id in valid_transaction_ids or
+                        in_backlog(transaction_id)):
                     num_valid_transactions += 1
+                    spending = spending or result
                 if num_valid_transactions > 1:
                     raise exceptions.DoubleSpend(('`{}` was spent more than'
                                                   ' once. There is a problem'
@@ -403,12 +748,15 @@ class Bigchain(object):
                                                  .format(txid))
 
             if num_valid_transactions:
-                return Transaction.from_dict(transactions[0])
+                # transactions read from validated blocks are not checked again
+                spent_by[(txid, cid)] = Transaction.from_dict(
+                    spending['transaction'],
+                    trusted=self._validated_block(spending, statuses[spending['id']]))
             else:
-                # all queried transactions were invalid
-                return None
-        else:
-            return None
+                # all queried transactions were invalid, or none was found
+                spent_by[(txid, cid)] = None
+
+        return spent_by
 
     def get_owned_ids(self, owner):
         """Retrieve a list of `txid`s that can be used as inputs.
@@ -421,38 +769,149 @@ class Bigchain(object):
             pointing to another transaction's condition
         """
 
-        # get all transactions in which owner is in the `owners_after` list
-        response = self.backend.get_owned_ids(owner)
-        owned = []
-
-        for tx in response:
-            # disregard transactions from invalid blocks
-            validity = self.get_blocks_status_containing_tx(tx['id'])
-            if Bigchain.BLOCK_VALID not in validity.values():
-                if Bigchain.BLOCK_UNDECIDED not in validity.values():
-                    continue
-
-            # NOTE: It's OK to not serialize the transaction here, as we do not
-            # use it after the execution of this function.
-            # a transaction can contain multiple outputs (conditions) so we need to iterate over all of them
-            # to get a list of outputs available to spend
-            for index, cond in enumerate(tx['conditions']):
-                # for simple signature conditions there are no subfulfillments
-                # check if the owner is in the condition `owners_after`
-                if len(cond['owners_after']) == 1:
-                    if cond['condition']['details']['public_key'] == owner:
-                        tx_link = TransactionLink(tx['id'], index)
-                else:
-                    # for transactions with multiple `owners_after` there will be several subfulfillments nested
-                    # in the condition. We need to iterate the subfulfillments to make sure there is a
-                    # subfulfillment for `owner`
-                    if util.condition_details_has_owner(cond['condition']['details'], owner):
-                        tx_link = TransactionLink(tx['id'], index)
-                # check if input was already spent
-                if not self.get_spent(tx_link.txid, tx_link.cid):
-                    owned.append(tx_link)
-
-        return owned
+        # get all the outputs in which owner is in the `owners_after` list
+        outputs = self._resolve_outputs(self.backend.get_outputs_by_owner(owner))
+
+        # disregard outputs from invalid blocks, and outputs already spent
+        tx_links = [TransactionLink(*output_id) for output_id, output in outputs.items()
+                    if output['status'] != Bigchain.BLOCK_INVALID and not output['spent_by']]
+
+        # keep the outputs of a transaction together, ordered by `cid`
+        positions = {}
+        for tx_link in tx_links:
+            positions.setdefault(tx_link.txid, len(positions))
+        return sorted(tx_links, key=lambda tx_link: (positions[tx_link.txid], tx_link.cid))
+
+    def get_outputs(self, tx_links):
+        """Retrieve outputs of transactions in valid blocks from the utxo table.
+
+        Args:
+            tx_links (:obj:`list` of TransactionLink): the outputs to retrieve.
+
+        Returns:
+            dict: For each `(txid, cid)` of an output that is in a valid block, a dict with its
+            `condition` and `asset_id`, and the ids of the transactions it is `spent_by` (in valid or
+            undecided blocks). Outputs that are not known to be in a valid block are left out.
+        """
+        outputs = self._resolve_outputs(self.backend.get_outputs(
+            [[tx_link.txid, tx_link.cid] for tx_link in tx_links]))
+        return {output_id: output for output_id, output in outputs.items()
+                if output['status'] == Bigchain.BLOCK_VALID}
+
+    def _resolve_outputs(self, outputs):
+        """Determine the status of outputs of the utxo table, and the transactions spending them.
+
+        Blocks that are not yet decided in the utxo table have their votes tallied, all of them at
+        once. Entries of the utxo table that only record spends, because the output itself was not
+        written yet, are left out.
+
+        Args:
+            outputs (iterable): outputs of the utxo table.
+
+        Returns:
+            dict: For each `(txid, cid)`, the output with the `status` of the block it is in, and
+            with the ids of the transactions it is `spent_by` that are not in an invalid block.
+        """
+        outputs = [output for output in outputs if 'block' in output]
+
+        undecided = {}
+        for output in outputs:
+            if not output['block']['valid'] and not output['block'].get('invalid'):
+                undecided[output['block']['id']] = output['block']['voters']
+            # an output spent by a valid block stays spent
+            if not output['spent']:
+                for spent_by in output['spent_by']:
+                    undecided[spent_by['block_id']] = spent_by['voters']
+
+        # no need to query the votes on blocks known to be decided
+        votes = collections.defaultdict(list)
+        to_query = [block_id for block_id in undecided if block_id not in self.decided_blocks]
+        for vote in self.backend.get_votes_by_block_ids(to_query):
+            votes[vote['vote']['voting_for_block']].append(vote)
+        statuses = {block_id: self.block_election_status(block_id, voters, votes[block_id])
+                    for block_id, voters in undecided.items()}
+
+        resolved = collections.OrderedDict()
+        for output in outputs:
+            if output['block']['valid']:
+                status = Bigchain.BLOCK_VALID
+            elif output['block'].get('invalid'):
+                status = Bigchain.BLOCK_INVALID
+            else:
+                status = statuses[output['block']['id']]
+            spent_by = [spent_by['txid'] for spent_by in output['spent_by']
+                        if output['spent'] or statuses[spent_by['block_id']] != Bigchain.BLOCK_INVALID]
+            resolved[tuple(output['id'])] = dict(output, status=status, spent_by=spent_by)
+        return resolved
+
+    def write_block_outputs(self, block, durability='soft'):
+        """Add the outputs a block creates to the utxo table, and record the outputs it spends.
+
+        Everything is read from the contents of the block. The outputs of a block are written
+        before anything is validated against it: by the node creating the block, before writing
+        it, and by every voter, before validating its transactions (see
+        :meth:`bigchaindb.pipelines.vote.Vote.validate_block`). Writing them more than once is
+        harmless, and nothing is ever removed from the utxo table, so an output that is written
+        late can't be unspent again. The utxo table is updated once the block is decided (see
+        :meth:`update_outputs`).
+
+        Args:
+            block (dict): the block, as written to bigchain.
+            durability (str): the durability of the write.
+        """
+        block_id = block['id']
+        voters = block['block']['voters']
+        outputs, spends = [], []
+        for tx in block['block']['transactions']:
+            for condition in tx['conditions']:
+                outputs.append({
+                    'id': [tx['id'], condition['cid']],
+                    'owners_after': condition['owners_after'],
+                    'amount': condition['amount'],
+                    'condition': condition,
+                    'asset_id': tx['asset']['id'],
+                    'block': {'id': block_id, 'voters': voters, 'valid': False},
+                    'spent': False,
+                    'spent_by': [],
+                })
+            for ffill in tx['fulfillments']:
+                if ffill['input']:
+                    spends.append({
+                        'id': [ffill['input']['txid'], ffill['input']['cid']],
+                        'spent_by': [{'txid': tx['id'], 'block_id': block_id, 'voters': voters}],
+                    })
+
+        self.backend.write_outputs(outputs, durability=durability)
+        if spends:
+            self.backend.spend_outputs(spends, durability=durability)
+
+    def write_block_assets(self, block, durability='soft'):
+        """Write the assets created by the transactions of a block to the assets table.
+
+        Args:
+            block (dict): the block, as written to bigchain.
+            durability (str): the durability of the write.
+        """
+        assets = [tx['asset'] for tx in block['block']['transactions']
+                  if tx['operation'] == Transaction.CREATE]
+        if assets:
+            self.backend.write_assets(assets, durability=durability)
+
+    def update_outputs(self, block_id, status):
+        """Update the utxo table once a block is decided.
+
+        The outputs created by a valid block are marked valid, and those it spends are marked
+        spent. The outputs created by an invalid block are marked invalid, and those it spends are
+        not spent by it anymore.
+
+        Args:
+            block_id (str): the id of the block.
+            status (str): the status of the block.
+        """
+        if status == Bigchain.BLOCK_VALID:
+            self.backend.validate_outputs(block_id)
+        elif status == Bigchain.BLOCK_INVALID:
+            self.backend.revert_outputs(block_id)
 
     def create_block(self, validated_transactions):
         """Creates a block given a list of `validated_transactions`.
@@ -529,6 +988,11 @@ class Bigchain(object):
             block (Block): block to write to bigchain.
         """
 
+        # the outputs are written first, so that no transaction can be
+        # validated against the block before the utxo table knows about it
+        block_dict = block.to_dict()
+        self.write_block_outputs(block_dict, durability=durability)
+        self.write_block_assets(block_dict, durability=durability)
         return self.backend.write_block(block.to_str(), durability=durability)
 
     def transaction_exists(self, transaction_id):
@@ -608,6 +1072,10 @@ class Bigchain(object):
         """Write the vote to the database."""
         return self.backend.write_vote(vote)
 
+    def get_votes(self, block_id):
+        """Return the votes cast on the block with the specified `block_id`."""
+        return list(self.backend.get_votes_by_block_id(block_id))
+
     def get_last_voted_block(self):
         """Returns the last block that this node voted on."""
 
@@ -616,17 +1084,52 @@ class Bigchain(object):
     def get_unvoted_blocks(self):
         """Return all the blocks that have not been voted on by this node.
 
+        The blocks are looked up from the timestamp of the last block this node voted on (the
+        voting checkpoint), so that only the recent blocks are read. If this node is missing votes
+        on older blocks, which the counts of blocks and of votes tell, all the blocks are read.
+
         Returns:
             :obj:`list` of :obj:`dict`: a list of unvoted blocks
         """
 
+        last_voted = self.backend.get_last_voted_block(self.me)
+        checkpoint = int(last_voted['block']['timestamp']) - UNVOTED_BLOCKS_CHECKPOINT_MARGIN
+
         # XXX: should this return instaces of Block?
-        return self.backend.get_unvoted_blocks(self.me)
+        unvoted = list(self.backend.get_unvoted_blocks(self.me, since=checkpoint))
+
+        # every block but the genesis block has a vote from this node, unless it is unvoted
+        n_unvoted = self.backend.count_blocks() - 1 - self.backend.count_votes(self.me)
+        if len(unvoted) != n_unvoted:
+            unvoted = list(self.backend.get_unvoted_blocks(self.me))
+        return unvoted
+
+    def block_election_status(self, block_id, voters, votes=None):
+        """Tally the votes on a block, and return the status: valid, invalid, or undecided.
+
+        The `votes` on the block can be given if they were already queried. The status of a
+        decided block is final, so it is remembered, and returned without querying or tallying
+        the votes again.
+        """
+
+        try:
+            return self.decided_blocks[block_id]
+        except KeyError:
+            pass
+
+        if votes is None:
+            votes = list(self.backend.get_votes_by_block_id(block_id))
+
+        status = self._tally_votes(block_id, voters, votes)
+        if status != Bigchain.BLOCK_UNDECIDED:
+            self.decided_blocks[block_id] = status
+            if len(self.decided_blocks) > DECIDED_BLOCKS_CACHE_SIZE:
+                self.decided_blocks.popitem(last=False)
+        return status
 
-    def block_election_status(self, block_id, voters):
+    def _tally_votes(self, block_id, voters, votes):
         """Tally the votes on a block, and return the status: valid, invalid, or undecided."""
 
-        votes = list(self.backend.get_votes_by_block_id(block_id))
         n_voters = len(voters)
 
         voter_counts = collections.Counter([vote['node_pubkey'] for vote in votes])
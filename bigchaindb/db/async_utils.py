@@ -0,0 +1,128 @@
+"""Utils to query the database from an asyncio event loop."""
+
+import asyncio
+import inspect
+
+import rethinkdb as r
+
+import bigchaindb
+
+try:
+    from rethinkdb.net import make_connection
+except ImportError:
+    # NOTE: rethinkdb < 2.4 has no `make_connection`, this is the same
+    #       thing: `r.connect`, with the defaults of the driver, but for
+    #       the given type of connection
+    def make_connection(connection_type, **kwargs):
+        params = inspect.signature(r.net.connect).parameters
+        for name, param in params.items():
+            if param.default is not param.empty:
+                kwargs.setdefault(name, param.default)
+        conn = connection_type(**kwargs)
+        return conn.reconnect(timeout=kwargs['timeout'])
+
+
+class AsyncConnection:
+    """This class is a proxy to run queries against the database from an
+    asyncio event loop. Like :class:`~bigchaindb.db.utils.Connection`, it is
+    lazy and resilient, and it also keeps a pool of connections, so that many
+    queries can wait for the database at the same time.
+    """
+
+    def __init__(self, host=None, port=None, db=None, size=4, max_tries=3):
+        """Create a new AsyncConnection instance.
+
+        Args:
+            host (str, optional): the host to connect to.
+            port (int, optional): the port to connect to.
+            db (str, optional): the database to use.
+            size (int, optional): the maximum number of connections to open.
+            max_tries (int, optional): how many tries before giving up.
+        """
+
+        self.host = host or bigchaindb.config['database']['host']
+        self.port = port or bigchaindb.config['database']['port']
+        self.db = db or bigchaindb.config['database']['name']
+        self.size = size
+        self.max_tries = max_tries
+        self.conns = None
+
+    @asyncio.coroutine
+    def run(self, query):
+        """Run a query.
+
+        Cursors are read to the end before the connection is given back to
+        the pool, so sequences are returned as lists. A broken connection is
+        closed, and the query is run again on a new one, unless it is an
+        insert: it may have been written before the connection broke.
+
+        Args:
+            query: the RethinkDB query.
+        """
+
+        conn = yield from self._acquire()
+        tries = 1 if isinstance(query, r.ast.Insert) else self.max_tries
+        try:
+            for i in range(tries):
+                try:
+                    result = yield from query.run(conn)
+                    if isinstance(result, r.Cursor):
+                        items = []
+                        while (yield from result.fetch_next()):
+                            items.append((yield from result.next()))
+                        result = items
+                    return result
+                except r.ReqlDriverError:
+                    # the connection is broken, if a new one can't be opened
+                    # the next query will try again
+                    yield from self._close(conn)
+                    conn = None
+                    if i + 1 == tries:
+                        raise
+                    else:
+                        conn = yield from self._connect()
+        finally:
+            self.conns.put_nowait(conn)
+
+    @asyncio.coroutine
+    def _acquire(self):
+        # the queue is created lazily, so that it belongs to the loop the
+        # queries are run from. It starts with a placeholder for each
+        # connection, which is opened when it is first needed.
+        if self.conns is None:
+            self.conns = asyncio.Queue()
+            for _ in range(self.size):
+                self.conns.put_nowait(None)
+
+        conn = yield from self.conns.get()
+        if conn is None:
+            try:
+                conn = yield from self._connect()
+            except r.ReqlDriverError:
+                self.conns.put_nowait(None)
+                raise
+        return conn
+
+    @asyncio.coroutine
+    def _connect(self):
+        # NOTE: `r.set_loop_type('asyncio')` would switch every connection of
+        #       the process to asyncio, so the type of connection is given
+        #       explicitly instead.
+        from rethinkdb.asyncio_net.net_asyncio import Connection as AsyncioConnection
+
+        for i in range(self.max_tries):
+            try:
+                return (yield from make_connection(AsyncioConnection, host=self.host,
+                                                   port=self.port, db=self.db))
+            except r.ReqlDriverError:
+                if i + 1 == self.max_tries:
+                    raise
+                else:
+                    yield from asyncio.sleep(2**i)
+
+    @asyncio.coroutine
+    def _close(self, conn):
+        try:
+            yield from conn.close(noreply_wait=False)
+        except (r.ReqlDriverError, OSError):
+            pass
@@ -7,25 +7,27 @@ from time import time
 
 import rethinkdb as r
 
-from bigchaindb import util
 from bigchaindb.db.utils import Connection
 from bigchaindb.common import exceptions
 
 
 class RethinkDBBackend:
 
-    def __init__(self, host=None, port=None, db=None):
+    def __init__(self, host=None, port=None, db=None, connection=None):
         """Initialize a new RethinkDB Backend instance.
 
         Args:
             host (str): the host to connect to.
             port (int): the port to connect to.
             db (str): the name of the database to use.
+            connection (optional): the connection to run the queries on. With an
+                :class:`~bigchaindb.db.async_utils.AsyncConnection`, the methods that return the result of
+                their query as is return coroutines instead.
         """
 
         self.read_mode = 'majority'
         self.durability = 'soft'
-        self.connection = Connection(host=host, port=port, db=db)
+        self.connection = connection or Connection(host=host, port=port, db=db)
 
     def write_transaction(self, signed_transaction):
         """Write a transaction to the backlog table.
@@ -41,12 +43,12 @@ class RethinkDBBackend:
                 r.table('backlog')
                 .insert(signed_transaction, durability=self.durability))
 
-    def update_transaction(self, transaction_id, doc):
-        """Update a transaction in the backlog table.
+    def write_transactions(self, signed_transactions, durability='soft'):
+        """Write many transactions to the backlog table, with a single query.
 
         Args:
-            transaction_id (str): the id of the transaction.
-            doc (dict): the values to update.
+            signed_transactions (:obj:`list` of :obj:`dict`): the signed transactions.
+            durability (str): the durability of the write.
 
         Returns:
             The result of the operation.
@@ -54,8 +56,26 @@ class RethinkDBBackend:
 
         return self.connection.run(
                 r.table('backlog')
-                .get(transaction_id)
-                .update(doc))
+                .insert(signed_transactions, durability=durability))
+
+    def update_transactions(self, docs):
+        """Update many transactions in the backlog table, with a single query.
+
+        The transactions that are not in the backlog anymore are left out.
+
+        Args:
+            docs (:obj:`list` of :obj:`dict`): for each transaction, its `id`
+                and the values to update.
+
+        Returns:
+            The result of the operation.
+        """
+
+        return self.connection.run(
+                r.expr(docs)
+                .for_each(lambda doc: r.table('backlog')
+                          .get(doc['id'])
+                          .update(doc.without('id'))))
 
     def delete_transaction(self, *transaction_id):
         """Delete a transaction from the backlog.
@@ -88,7 +108,7 @@ class RethinkDBBackend:
 
         return self.connection.run(
                 r.table('backlog')
-                .filter(lambda tx: time() - tx['assignment_timestamp'] > reassign_delay))
+                .between(r.minval, time() - reassign_delay, index='assignment_timestamp'))
 
     def get_transaction_from_block(self, transaction_id, block_id):
         """Get a transaction from a specific block.
@@ -122,45 +142,132 @@ class RethinkDBBackend:
                 .without('assignee', 'assignment_timestamp')
                 .default(None))
 
-    def get_blocks_status_from_transaction(self, transaction_id):
-        """Retrieve block election information given a secondary index and value
+    def get_transactions_from_backlog(self, transaction_ids):
+        """Get many transactions from backlog.
 
         Args:
-            value: a value to search (e.g. transaction id string, payload hash string)
-            index (str): name of a secondary index, e.g. 'transaction_id'
+            transaction_ids (:obj:`list` of :obj:`str`): the ids of the transactions.
 
         Returns:
-            :obj:`list` of :obj:`dict`: A list of blocks with with only election information
+            A cursor for the matching transactions.
         """
+        if not transaction_ids:
+            return []
+
+        return self.connection.run(
+                r.table('backlog')
+                .get_all(*transaction_ids)
+                .without('assignee', 'assignment_timestamp'))
+
+    def is_transaction_in_backlog(self, transaction_id):
+        """Check if a transaction is in the backlog, without reading it.
+
+        Args:
+            transaction_id (str): the id of the transaction.
+
+        Returns:
+            ``True`` if the transaction is in the backlog, ``False`` otherwise.
+        """
+        return self.connection.run(
+                r.table('backlog')
+                .get(transaction_id)
+                .ne(None))
+
+    def get_blocks_status_from_transaction(self, transaction_id, include_transaction=False):
+        """Retrieve the election information of the blocks containing a transaction.
+
+        The votes on each block are joined in the same query.
+
+        Args:
+            transaction_id (str): the id of the transaction.
+            include_transaction (bool): also return the transaction.
+
+        Returns:
+            :obj:`list` of :obj:`dict`: A list of blocks with only their `id`, `voters` and `votes`,
+            and the `transaction` if :attr:`include_transaction` is ``True``.
+        """
+
+        def election_information(block):
+            data = {}
+            if include_transaction:
+                data['transaction'] = (block['block']['transactions']
+                                       .filter(lambda tx: tx['id'] == transaction_id)
+                                       .nth(0))
+            return self._with_block_votes(block, data)
 
         return self.connection.run(
                 r.table('bigchain', read_mode=self.read_mode)
                 .get_all(transaction_id, index='transaction_id')
-                .pluck('votes', 'id', {'block': ['voters']}))
+                .map(election_information))
 
-    def get_txids_by_asset_id(self, asset_id):
-        """Retrieves transactions ids related to a particular asset.
+    def get_blocks_status_from_transactions(self, transaction_ids):
+        """Retrieve many transactions, with the election information of the blocks containing them.
 
-        A digital asset in bigchaindb is identified by an uuid. This allows us
-        to query all the transactions related to a particular digital asset,
-        knowing the id.
+        The votes on each block are joined in the same query.
 
         Args:
-            asset_id (str): the id for this particular metadata.
+            transaction_ids (:obj:`list` of :obj:`str`): the ids of the transactions.
 
         Returns:
-            A list of transactions ids related to the asset. If no transaction
-            exists for that asset it returns an empty list `[]`
+            A cursor yielding, for each transaction and each block containing it, a dict with the
+            `transaction`, and the `id`, `voters` and `votes` of the block. A result may be repeated
+            if a block contains several of the transactions.
         """
+        if not transaction_ids:
+            return []
 
-        # here we only want to return the transaction ids since later on when
-        # we are going to retrieve the transaction with status validation
         return self.connection.run(
-            r.table('bigchain', read_mode=self.read_mode)
-             .get_all(asset_id, index='asset_id')
-             .concat_map(lambda block: block['block']['transactions'])
-             .filter(lambda transaction: transaction['asset']['id'] == asset_id)
-             .get_field('id'))
+                r.table('bigchain', read_mode=self.read_mode)
+                .get_all(*transaction_ids, index='transaction_id')
+                .concat_map(lambda block: block['block']['transactions']
+                            .filter(lambda transaction: r.expr(transaction_ids).contains(transaction['id']))
+                            .map(lambda transaction: self._with_block_votes(block, {
+                                'transaction': transaction,
+                            }))))
+
+    def get_blocks_status_from_asset_id(self, asset_id):
+        """Retrieve the election information of the blocks containing transactions related to an asset.
+
+        The votes on each block are joined in the same query, and only the ids of the transactions
+        are read.
+
+        Args:
+            asset_id (str): the id of the asset.
+
+        Returns:
+            A cursor yielding, for each block, a dict with its `id`, `timestamp`, `voters` and `votes`,
+            and the ids of the transactions related to the asset, in the order they appear in the
+            block, as `transaction_ids`.
+        """
+        return self.connection.run(
+                r.table('bigchain', read_mode=self.read_mode)
+                .get_all(asset_id, index='asset_id')
+                .map(lambda block: self._with_block_votes(block, {
+                    'timestamp': block['block']['timestamp'],
+                    'transaction_ids': (block['block']['transactions']
+                                        .filter(lambda transaction: transaction['asset']['id'] == asset_id)
+                                        .get_field('id')),
+                })))
+
+    def get_transactions_from_blocks(self, block_ids, transaction_ids):
+        """Get transactions from some blocks.
+
+        Args:
+            block_ids (:obj:`list` of :obj:`str`): the ids of the blocks to read the transactions from.
+            transaction_ids (:obj:`list` of :obj:`str`): the ids of the transactions.
+
+        Returns:
+            A cursor for the matching transactions. A transaction may be repeated if several of the
+            blocks contain it.
+        """
+        if not block_ids:
+            return []
+
+        return self.connection.run(
+                r.table('bigchain', read_mode=self.read_mode)
+                .get_all(*block_ids)
+                .concat_map(lambda block: block['block']['transactions'])
+                .filter(lambda transaction: r.expr(transaction_ids).contains(transaction['id'])))
 
     def get_asset_by_id(self, asset_id):
         """Returns the asset associated with an asset_id.
@@ -181,6 +288,77 @@ class RethinkDBBackend:
                      transaction['operation'] == 'CREATE')
              .pluck('asset'))
 
+    def get_assets_by_ids(self, asset_ids):
+        """Returns the assets associated with many asset_ids.
+
+            Args:
+                asset_ids (:obj:`list` of :obj:`str`): The asset ids.
+
+            Returns:
+                Returns a rethinkdb cursor.
+        """
+        if not asset_ids:
+            return []
+
+        return self.connection.run(
+            r.table('bigchain', read_mode=self.read_mode)
+             .get_all(*asset_ids, index='asset_id')
+             .concat_map(lambda block: block['block']['transactions'])
+             .filter(lambda transaction:
+                     r.expr(asset_ids).contains(transaction['asset']['id']))
+             .filter(lambda transaction:
+                     transaction['operation'] == 'CREATE')
+             .pluck('asset'))
+
+    def write_assets(self, assets, durability='soft'):
+        """Write asset definitions to the assets table.
+
+        Asset definitions are immutable, so an asset that is already in the
+        table is left unchanged.
+
+        Args:
+            assets (:obj:`list` of :obj:`dict`): the asset definitions to
+                write.
+
+        Returns:
+            The database response.
+        """
+        return self.connection.run(
+                r.table('assets')
+                .insert(assets, conflict='error', durability=durability))
+
+    def get_asset_definitions(self, asset_ids):
+        """Get asset definitions from the assets table.
+
+        Args:
+            asset_ids (:obj:`list` of :obj:`str`): The asset ids.
+
+        Returns:
+            A cursor for the matching assets.
+        """
+        if not asset_ids:
+            return []
+
+        return self.connection.run(
+                r.table('assets', read_mode=self.read_mode)
+                .get_all(*asset_ids))
+
+    def _with_block_votes(self, block, data):
+        """Add the `id`, `voters` and `votes` of `block` to `data`, so that the status of the block can be
+        determined without querying the votes again.
+
+        Args:
+            block: the block (a ReQL term).
+            data (dict): the data to extend.
+
+        Returns:
+            dict: the extended `data`.
+        """
+        votes = (r.table('votes', read_mode=self.read_mode)
+                 .between([block['id'], r.minval], [block['id'], r.maxval], index='block_and_voter')
+                 .coerce_to('array'))
+        return dict(data, id=block['id'], voters=block['block']['voters'], votes=votes)
+
     def get_spent(self, transaction_id, condition_id):
         """Check if a `txid` was already used as an input.
 
@@ -192,32 +370,43 @@ class RethinkDBBackend:
             condition_id (int): The index of the condition in the respective transaction.
 
         Returns:
-            The transaction that used the `txid` as an input else `None`
+            A cursor yielding, for each transaction that used the `txid` as an input, a dict with the
+            `transaction`, and the `id`, `voters` and `votes` of the block it is in.
         """
 
-        # TODO: use index!
-        return self.connection.run(
-                r.table('bigchain', read_mode=self.read_mode)
-                .concat_map(lambda doc: doc['block']['transactions'])
-                .filter(lambda transaction: transaction['fulfillments'].contains(
-                    lambda fulfillment: fulfillment['input'] == {'txid': transaction_id, 'cid': condition_id})))
+        return self.get_spent_many([(transaction_id, condition_id)])
 
-    def get_owned_ids(self, owner):
-        """Retrieve a list of `txids` that can we used has inputs.
+    def get_spent_many(self, tx_inputs):
+        """Check which of many conditions were already used as inputs.
 
         Args:
-            owner (str): base58 encoded public key.
+            tx_inputs (:obj:`list` of :obj:`tuple`): the `(txid, cid)` pairs of the conditions.
 
         Returns:
-            A cursor for the matching transactions.
+            A cursor yielding, for each transaction that used one of the conditions as an input, a dict
+            with the `input` (as `[txid, cid]`), the `transaction`, and the `id`, `voters` and `votes` of
+            the block it is in. A result may be repeated if a block spends several of the conditions.
         """
 
-        # TODO: use index!
+        tx_inputs = [[txid, cid] for txid, cid in tx_inputs]
+        if not tx_inputs:
+            return []
+
+        def spending_transactions(block):
+            return block['block']['transactions'].concat_map(
+                lambda transaction: transaction['fulfillments']
+                .filter(lambda fulfillment: fulfillment['input'].ne(None))
+                .map(lambda fulfillment: [fulfillment['input']['txid'], fulfillment['input']['cid']])
+                .set_intersection(tx_inputs)
+                .map(lambda tx_input: self._with_block_votes(block, {
+                    'input': tx_input,
+                    'transaction': transaction,
+                })))
+
         return self.connection.run(
                 r.table('bigchain', read_mode=self.read_mode)
-                .concat_map(lambda doc: doc['block']['transactions'])
-                .filter(lambda tx: tx['conditions'].contains(
-                    lambda c: c['owners_after'].contains(owner))))
+                .get_all(*tx_inputs, index='inputs')
+                .concat_map(spending_transactions))
 
     def get_votes_by_block_id(self, block_id):
         """Get all the votes casted for a specific block.
@@ -232,6 +421,24 @@ class RethinkDBBackend:
                 r.table('votes', read_mode=self.read_mode)
                 .between([block_id, r.minval], [block_id, r.maxval], index='block_and_voter'))
 
+    def get_votes_by_block_ids(self, block_ids):
+        """Get all the votes casted for some blocks.
+
+        Args:
+            block_ids (:obj:`list` of :obj:`str`): the block ids to use.
+
+        Returns:
+            A cursor for the matching votes.
+        """
+        if not block_ids:
+            return []
+
+        return self.connection.run(
+                r.expr(list(block_ids))
+                .concat_map(lambda block_id: r.table('votes', read_mode=self.read_mode)
+                            .between([block_id, r.minval], [block_id, r.maxval], index='block_and_voter')
+                            .coerce_to('array')))
+
     def get_votes_by_block_id_and_voter(self, block_id, node_pubkey):
         """Get all the votes casted for a specific block by a specific voter.
 
@@ -270,6 +477,21 @@ class RethinkDBBackend:
         """
         return self.connection.run(r.table('bigchain').get(block_id))
 
+    def get_block_voters(self, block_id):
+        """Get the voters of a block from the bigchain table, without the
+        transactions of the block.
+
+        Args:
+            block_id (str): block id of the block
+
+        Returns:
+            voters (list): the public keys of the voters or `None`
+        """
+        return self.connection.run(
+                r.table('bigchain')
+                .get(block_id)['block']['voters']
+                .default(None))
+
     def has_transaction(self, transaction_id):
         """Check if a transaction exists in the bigchain table.
 
@@ -294,6 +516,21 @@ class RethinkDBBackend:
                 r.table('bigchain', read_mode=self.read_mode)
                 .count())
 
+    def count_votes(self, node_pubkey):
+        """Count the number of votes cast by a node.
+
+        Args:
+            node_pubkey (str): base58 encoded public key.
+
+        Returns:
+            The number of votes of the node.
+        """
+
+        return self.connection.run(
+                r.table('votes', read_mode=self.read_mode)
+                .between([node_pubkey, r.minval], [node_pubkey, r.maxval], index='node_pubkey__timestamp')
+                .count())
+
     def count_backlog(self):
         """Count the number of transactions in the backlog table.
 
@@ -305,6 +542,119 @@ class RethinkDBBackend:
                 r.table('backlog', read_mode=self.read_mode)
                 .count())
 
+    def write_outputs(self, outputs, durability='soft'):
+        """Write outputs to the utxo table.
+
+        An output that is already in the table is left unchanged, as it may
+        have been spent or decided since it was first written. The spends
+        recorded before the output itself was written are kept.
+
+        Args:
+            outputs (:obj:`list` of :obj:`dict`): the outputs to write.
+
+        Returns:
+            The database response.
+        """
+        return self.connection.run(
+                r.table('utxo')
+                .insert(outputs, durability=durability,
+                        conflict=lambda output_id, old_output, new_output:
+                        r.branch(old_output.has_fields('block'),
+                                 old_output,
+                                 new_output.merge({
+                                     'spent': old_output['spent'].default(False),
+                                     'spent_by': old_output['spent_by']}))))
+
+    def spend_outputs(self, spends, durability='soft'):
+        """Record that outputs of the utxo table are spent.
+
+        The spend is recorded even if the output was not written yet.
+
+        Args:
+            spends (:obj:`list` of :obj:`dict`): for each output, its `id`
+                and the `spent_by` entries to add to it.
+
+        Returns:
+            The database response.
+        """
+        return self.connection.run(
+                r.table('utxo')
+                .insert(spends, durability=durability,
+                        conflict=lambda output_id, old_output, new_output:
+                        old_output.merge({
+                            'spent_by': old_output['spent_by'].set_union(new_output['spent_by'])})))
+
+    def get_outputs(self, output_ids):
+        """Get outputs from the utxo table.
+
+        Args:
+            output_ids (:obj:`list`): the `[txid, cid]` ids of the outputs.
+
+        Returns:
+            A cursor for the matching outputs.
+        """
+        if not output_ids:
+            return []
+
+        return self.connection.run(
+                r.table('utxo', read_mode=self.read_mode)
+                .get_all(*output_ids))
+
+    def get_outputs_by_owner(self, owner):
+        """Get the outputs of the utxo table owned by a public key.
+
+        The outputs spent by a valid block are left out.
+
+        Args:
+            owner (str): base58 encoded public key.
+
+        Returns:
+            A cursor for the matching outputs.
+        """
+        return self.connection.run(
+                r.table('utxo', read_mode=self.read_mode)
+                .get_all(owner, index='owners_after')
+                .filter({'spent': False}))
+
+    def validate_outputs(self, block_id):
+        """Update the utxo table for a block that was decided valid.
+
+        The outputs created by the block are marked valid, and the outputs
+        it spends are marked spent.
+
+        Args:
+            block_id (str): the id of the block.
+        """
+        self.connection.run(
+                r.table('utxo')
+                .get_all(block_id, index='block_id')
+                .update({'block': {'valid': True}}))
+        self.connection.run(
+                r.table('utxo')
+                .get_all(block_id, index='spent_by_block_id')
+                .update({'spent': True}))
+
+    def revert_outputs(self, block_id):
+        """Update the utxo table for a block that was decided invalid.
+
+        The outputs created by the block are marked invalid, and the outputs
+        it spends are not spent by it anymore.
+
+        Args:
+            block_id (str): the id of the block.
+        """
+        self.connection.run(
+                r.table('utxo')
+                .get_all(block_id, index='block_id')
+                .update({'block': {'invalid': True}}))
+        self.connection.run(
+                r.table('utxo')
+                .get_all(block_id, index='spent_by_block_id')
+                .update(lambda output: {
+                    'spent_by': output['spent_by'].filter(
+                        lambda spent_by: spent_by['block_id'].ne(block_id))
+                }))
+
     def write_vote(self, vote):
         """Write a vote to the votes table.
 
@@ -326,7 +676,7 @@ class RethinkDBBackend:
         """
         return self.connection.run(
             r.table('bigchain', read_mode=self.read_mode)
-            .filter(util.is_genesis_block)
+            .get_all('GENESIS', index='block_operation')
             .nth(0))
 
     def get_last_voted_block(self, node_pubkey):
@@ -340,16 +690,16 @@ class RethinkDBBackend:
             any vote then the genesis block is returned.
         """
         try:
-            # get the latest value for the vote timestamp (over all votes)
+            # get the latest value for the vote timestamp (over the votes of the node)
             max_timestamp = self.connection.run(
                     r.table('votes', read_mode=self.read_mode)
-                    .filter(r.row['node_pubkey'] == node_pubkey)
-                    .max(r.row['vote']['timestamp']))['vote']['timestamp']
+                    .between([node_pubkey, r.minval], [node_pubkey, r.maxval], index='node_pubkey__timestamp')
+                    .order_by(index=r.desc('node_pubkey__timestamp'))
+                    .nth(0))['vote']['timestamp']
 
             last_voted = list(self.connection.run(
                 r.table('votes', read_mode=self.read_mode)
-                .filter(r.row['vote']['timestamp'] == max_timestamp)
-                .filter(r.row['node_pubkey'] == node_pubkey)))
+                .get_all([node_pubkey, max_timestamp], index='node_pubkey__timestamp')))
 
         except r.ReqlNonExistenceError:
             # return last vote if last vote exists else return Genesis block
@@ -389,24 +739,22 @@ class RethinkDBBackend:
                 r.table('bigchain', read_mode=self.read_mode)
                 .get(last_block_id))
 
-    def get_unvoted_blocks(self, node_pubkey):
+    def get_unvoted_blocks(self, node_pubkey, since=None):
         """Return all the blocks that have not been voted by the specified node.
 
         Args:
             node_pubkey (str): base58 encoded public key
+            since (int): if given, only the blocks with a timestamp from `since` on are considered.
 
         Returns:
-            :obj:`list` of :obj:`dict`: a list of unvoted blocks
+            A cursor of the unvoted blocks, ordered by timestamp, without the genesis block.
         """
 
-        unvoted = self.connection.run(
+        return self.connection.run(
                 r.table('bigchain', read_mode=self.read_mode)
+                .between(r.minval if since is None else since, r.maxval, index='block_timestamp_number')
+                .order_by(index=r.asc('block_timestamp_number'))
+                .filter(lambda block: block['block']['transactions'].nth(0)['operation'] != 'GENESIS')
                 .filter(lambda block: r.table('votes', read_mode=self.read_mode)
                                        .get_all([block['id'], node_pubkey], index='block_and_voter')
-                                       .is_empty())
-                .order_by(r.asc(r.row['block']['timestamp'])))
-
-        # FIXME: I (@vrde) don't like this solution. Filtering should be done at a
-        #        database level. Solving issue #444 can help untangling the situation
-        unvoted_blocks = filter(lambda block: not util.is_genesis_block(block), unvoted)
-        return unvoted_blocks
+                                       .is_empty()))
@@ -99,28 +99,48 @@ def create_database(conn, dbname):
     r.db_create(dbname).run(conn)
 
 
+TABLE_NAMES = ['bigchain', 'backlog', 'votes', 'utxo', 'assets']
+
+
 def create_table(conn, dbname, table_name):
     logger.info('Create `%s` table.', table_name)
     # create the table
     r.db(dbname).table_create(table_name).run(conn)
 
 
+def create_index(conn, dbname, table_name, index_name, *args, **kwargs):
+    """Create a secondary index, unless the table already has it."""
+    table = r.db(dbname).table(table_name)
+    if not table.index_list().contains(index_name).run(conn):
+        table.index_create(index_name, *args, **kwargs).run(conn)
+
+
 def create_bigchain_secondary_index(conn, dbname):
     logger.info('Create `bigchain` secondary index.')
     # to order blocks by timestamp
-    r.db(dbname).table('bigchain')\
-        .index_create('block_timestamp', r.row['block']['timestamp'])\
-        .run(conn)
+    create_index(conn, dbname, 'bigchain', 'block_timestamp',
+                 r.row['block']['timestamp'])
+    # to look blocks up from a timestamp, compared as a number
+    create_index(conn, dbname, 'bigchain', 'block_timestamp_number',
+                 r.row['block']['timestamp'].coerce_to('number'))
+    # to find the genesis block, by the operation of the first transaction
+    # of the blocks
+    create_index(conn, dbname, 'bigchain', 'block_operation',
+                 r.row['block']['transactions'].nth(0)['operation'])
     # to query the bigchain for a transaction id
-    r.db(dbname).table('bigchain')\
-        .index_create('transaction_id',
-                      r.row['block']['transactions']['id'], multi=True)\
-        .run(conn)
+    create_index(conn, dbname, 'bigchain', 'transaction_id',
+                 r.row['block']['transactions']['id'], multi=True)
     # secondary index for asset uuid
-    r.db(dbname).table('bigchain')\
-                .index_create('asset_id',
-                              r.row['block']['transactions']['asset']['id'], multi=True)\
-                .run(conn)
+    create_index(conn, dbname, 'bigchain', 'asset_id',
+                 r.row['block']['transactions']['asset']['id'], multi=True)
+    # to query the bigchain for the transactions spending a condition
+    create_index(conn, dbname, 'bigchain', 'inputs',
+                 r.row['block']['transactions']
+                 .concat_map(lambda tx: tx['fulfillments']['input'])
+                 .filter(lambda tx_input: tx_input.ne(None))
+                 .map(lambda tx_input: [tx_input['txid'], tx_input['cid']])
+                 .distinct(),
+                 multi=True)
 
     # wait for rethinkdb to finish creating secondary indexes
     r.db(dbname).table('bigchain').index_wait().run(conn)
@@ -129,10 +149,11 @@ def create_bigchain_secondary_index(conn, dbname):
 def create_backlog_secondary_index(conn, dbname):
     logger.info('Create `backlog` secondary index.')
     # compound index to read transactions from the backlog per assignee
-    r.db(dbname).table('backlog')\
-        .index_create('assignee__transaction_timestamp',
-                      [r.row['assignee'], r.row['assignment_timestamp']])\
-        .run(conn)
+    create_index(conn, dbname, 'backlog', 'assignee__transaction_timestamp',
+                 [r.row['assignee'], r.row['assignment_timestamp']])
+
+    # to find the stale transactions
+    create_index(conn, dbname, 'backlog', 'assignment_timestamp')
 
     # wait for rethinkdb to finish creating secondary indexes
     r.db(dbname).table('backlog').index_wait().run(conn)
@@ -141,28 +162,95 @@ def create_backlog_secondary_index(conn, dbname):
 def create_votes_secondary_index(conn, dbname):
     logger.info('Create `votes` secondary index.')
     # compound index to order votes by block id and node
-    r.db(dbname).table('votes')\
-        .index_create('block_and_voter',
-                      [r.row['vote']['voting_for_block'],
-                       r.row['node_pubkey']])\
-        .run(conn)
+    create_index(conn, dbname, 'votes', 'block_and_voter',
+                 [r.row['vote']['voting_for_block'], r.row['node_pubkey']])
+
+    # compound index to find the last votes of a node
+    create_index(conn, dbname, 'votes', 'node_pubkey__timestamp',
+                 [r.row['node_pubkey'], r.row['vote']['timestamp']])
 
     # wait for rethinkdb to finish creating secondary indexes
     r.db(dbname).table('votes').index_wait().run(conn)
 
 
+def create_utxo_secondary_index(conn, dbname):
+    logger.info('Create `utxo` secondary index.')
+    # to query the unspent outputs of a public key
+    create_index(conn, dbname, 'utxo', 'owners_after',
+                 r.row['owners_after'], multi=True)
+    # to update the outputs created and spent by a block once it is decided
+    create_index(conn, dbname, 'utxo', 'block_id', r.row['block']['id'])
+    create_index(conn, dbname, 'utxo', 'spent_by_block_id',
+                 r.row['spent_by']['block_id'], multi=True)
+
+    # wait for rethinkdb to finish creating secondary indexes
+    r.db(dbname).table('utxo').index_wait().run(conn)
+
+
+def create_secondary_indexes(conn, dbname):
+    create_bigchain_secondary_index(conn, dbname)
+    create_backlog_secondary_index(conn, dbname)
+    create_votes_secondary_index(conn, dbname)
+    create_utxo_secondary_index(conn, dbname)
+
+
 def init_database():
     conn = get_conn()
     dbname = get_database_name()
     create_database(conn, dbname)
 
-    table_names = ['bigchain', 'backlog', 'votes']
-    for table_name in table_names:
+    for table_name in TABLE_NAMES:
         create_table(conn, dbname, table_name)
 
-    create_bigchain_secondary_index(conn, dbname)
-    create_backlog_secondary_index(conn, dbname)
-    create_votes_secondary_index(conn, dbname)
+    create_secondary_indexes(conn, dbname)
+
+
+def fill_derived_tables(conn, dbname, table_names):
+    """Fill the tables derived from the blocks in bigchain.
+
+    Args:
+        table_names (list): the tables to fill, among ``utxo`` and
+            ``assets``.
+    """
+    logger.info('Fill the `%s` tables from bigchain.', '`, `'.join(table_names))
+    b = bigchaindb.Bigchain()
+    blocks = r.db(dbname).table('bigchain').order_by(index='block_timestamp')
+
+    for block in blocks.run(conn):
+        if 'utxo' in table_names:
+            b.write_block_outputs(block)
+        if 'assets' in table_names:
+            b.write_block_assets(block)
+
+    if 'utxo' in table_names:
+        # once all the outputs are in, update those of the decided blocks
+        for block in blocks.run(conn):
+            status = b.block_election_status(block['id'],
+                                             block['block']['voters'])
+            b.update_outputs(block['id'], status)
+
+
+def upgrade():
+    """Bring an existing database up to date.
+
+    The tables and secondary indexes the database is missing are created, and
+    the tables derived from bigchain are filled if they had to be created.
+    """
+    conn = get_conn()
+    dbname = get_database_name()
+
+    table_names = r.db(dbname).table_list().run(conn)
+    missing = [table_name for table_name in TABLE_NAMES
+               if table_name not in table_names]
+    for table_name in missing:
+        create_table(conn, dbname, table_name)
+
+    create_secondary_indexes(conn, dbname)
+
+    derived = [table_name for table_name in ('utxo', 'assets')
+               if table_name in missing]
+    if derived:
+        fill_derived_tables(conn, dbname, derived)
 
 
 def init():
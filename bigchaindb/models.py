@@ -2,14 +2,25 @@ from bigchaindb.common.crypto import hash_data, PublicKey, PrivateKey
 from bigchaindb.common.exceptions import (InvalidHash, InvalidSignature,
                                           OperationError, DoubleSpend,
                                           TransactionDoesNotExist,
+                                          TransactionOwnerError,
                                           TransactionNotInValidBlock,
                                           AssetIdMismatch, AmountError)
-from bigchaindb.common.transaction import Transaction, Asset
+from bigchaindb.common.transaction import Transaction, Condition
 from bigchaindb.common.util import gen_timestamp, serialize
 from bigchaindb.common.schema import validate_transaction_schema
 
 
+# The errors raised when validating an invalid transaction
+INVALID_TRANSACTION_ERRORS = (ValueError, OperationError,
+                              TransactionDoesNotExist, TransactionOwnerError,
+                              DoubleSpend, InvalidHash, InvalidSignature,
+                              TransactionNotInValidBlock, AssetIdMismatch,
+                              AmountError)
+
+
 class Transaction(Transaction):
+    __slots__ = ()
+
     def validate(self, bigchain):
         """Validate a transaction.
 
@@ -33,6 +44,151 @@ class Transaction(Transaction):
             InvalidHash: if the hash of the transaction is wrong
             InvalidSignature: if the signature of the transaction is wrong
         """
+        input_conditions = self._validate_inputs(
+            bigchain, self.resolve_inputs(bigchain, [self]))
+
+        if not self.fulfillments_valid(input_conditions):
+            raise InvalidSignature()
+        else:
+            return self
+
+    @classmethod
+    def validate_many(cls, bigchain, transactions):
+        """Validate many transactions, e.g. all transactions of a block.
+
+        Note:
+            The inputs of all transactions are resolved in bulk (see
+            :meth:`~.Transaction.resolve_inputs`) and validated one after the
+            other, while the signatures of all transactions are then verified
+            in one batch (see :meth:`~.Transaction.verify_many`).
+
+        Args:
+            bigchain (Bigchain): an instantiated bigchaindb.Bigchain object.
+            transactions (:obj:`list` of :class:`~.Transaction`): the
+                transactions to validate.
+
+        Returns:
+            The transactions if all of them are valid, else an exception
+            describing the reason why a transaction is invalid is raised.
+
+        Raises:
+            See :meth:`~.Transaction.validate`.
+        """
+        resolved = cls.resolve_inputs(bigchain, transactions)
+        input_conditions = [tx._validate_inputs(bigchain, resolved)
+                            for tx in transactions]
+
+        if not all(cls.verify_many(transactions, input_conditions)):
+            raise InvalidSignature()
+        else:
+            return transactions
+
+    @classmethod
+    def validate_each(cls, bigchain, transactions):
+        """Validate many transactions independently of each other, e.g. the
+        transactions submitted together by a client.
+
+        Note:
+            As in :meth:`~.Transaction.validate_many`, the inputs of all
+            transactions are resolved in bulk and their signatures are
+            verified in one batch, but an invalid transaction doesn't make the
+            others invalid.
+
+        Args:
+            bigchain (Bigchain): an instantiated bigchaindb.Bigchain object.
+            transactions (:obj:`list` of :class:`~.Transaction`): the
+                transactions to validate.
+
+        Returns:
+            list: For each transaction, the transaction if it is valid, else
+            the exception describing the reason why it is invalid.
+        """
+        resolved = cls.resolve_inputs(bigchain, transactions)
+
+        results = []
+        checked = []
+        for tx in transactions:
+            try:
+                input_conditions = tx._validate_inputs(bigchain, resolved)
+            except INVALID_TRANSACTION_ERRORS as exc:
+                results.append(exc)
+            else:
+                checked.append((len(results), tx, input_conditions))
+                results.append(tx)
+
+        valid = cls.verify_many([tx for _, tx, _ in checked],
+                                [conditions for _, _, conditions in checked])
+        for (index, _, _), fulfillments_valid in zip(checked, valid):
+            if not fulfillments_valid:
+                results[index] = InvalidSignature()
+        return results
+
+    @staticmethod
+    def resolve_inputs(bigchain, transactions):
+        """Fetch everything needed to validate the inputs of transactions.
+
+        The inputs of all the transactions are looked up in the utxo table
+        at once. The inputs that can't be spent from there are resolved
+        against the bigchain: the input transactions, with their status, and
+        the transactions spending them are read in bulk. The assets of the
+        transactions are read at once too.
+
+        Args:
+            bigchain (Bigchain): an instantiated bigchaindb.Bigchain object.
+            transactions (:obj:`list` of :class:`~.Transaction`): the
+                transactions whose inputs to resolve.
+
+        Returns:
+            dict: The `outputs` from the utxo table, the input `transactions`
+            with their status, the transactions having `spent` the inputs,
+            and the `assets`, to be passed to
+            :meth:`~.Transaction._validate_inputs`.
+        """
+        transfers = [tx for tx in transactions
+                     if tx.operation == Transaction.TRANSFER and
+                     tx.fulfillments and
+                     all(ffill.tx_input for ffill in tx.fulfillments)]
+        outputs = bigchain.get_outputs([ffill.tx_input for tx in transfers
+                                        for ffill in tx.fulfillments])
+
+        # the inputs that can't be spent from the utxo table
+        unresolved = set()
+        for tx in transfers:
+            for ffill in tx.fulfillments:
+                tx_input = (ffill.tx_input.txid, ffill.tx_input.cid)
+                output = outputs.get(tx_input)
+                if not output or any(txid != tx.id
+                                     for txid in output['spent_by']):
+                    unresolved.add(tx_input)
+
+        input_txs = bigchain.get_transactions(
+            list({txid for txid, _ in unresolved}))
+        spent = bigchain.get_spent_many(list(unresolved))
+        assets = bigchain.get_assets_by_ids(
+            list({tx.asset.data_id for tx in transfers}))
+
+        return {
+            'outputs': outputs,
+            'transactions': input_txs,
+            'spent': spent,
+            'assets': assets,
+        }
+
+    def _validate_inputs(self, bigchain, resolved):
+        """Validate everything about a transaction except its signatures.
+
+        Args:
+            bigchain (Bigchain): an instantiated bigchaindb.Bigchain object.
+            resolved (dict): the resolved inputs (see
+                :meth:`~.Transaction.resolve_inputs`).
+
+        Returns:
+            :obj:`list` of :class:`~bigchaindb.common.transaction.Condition`:
+            The conditions the fulfillments of the transaction spend.
+
+        Raises:
+            See :meth:`~.Transaction.validate`.
+        """
         if len(self.fulfillments) == 0:
             raise ValueError('Transaction contains no fulfillments')
 
@@ -51,44 +207,60 @@ class Transaction(Transaction):
                 raise ValueError('Only `CREATE` transactions can have null '
                                  'inputs')
             # check inputs
-            # store the inputs so that we can check if the asset ids match
-            input_txs = []
+            # look the inputs up in the utxo table first. Inputs that are not
+            # there, or that are spent, are checked against the bigchain,
+            # which also tells why they can't be spent.
+            outputs = resolved['outputs']
+            # store the asset ids of the inputs so that we can check if they
+            # match
+            asset_ids = set()
             input_amount = 0
             for ffill in self.fulfillments:
                 input_txid = ffill.tx_input.txid
                 input_cid = ffill.tx_input.cid
-                input_tx, status = bigchain.\
-                    get_transaction(input_txid, include_status=True)
-
-                if input_tx is None:
-                    raise TransactionDoesNotExist("input `{}` doesn't exist"
-                                                  .format(input_txid))
-
-                if status != bigchain.TX_VALID:
-                    raise TransactionNotInValidBlock(
-                        'input `{}` does not exist in a valid block'.format(
-                            input_txid))
-
-                spent = bigchain.get_spent(input_txid, ffill.tx_input.cid)
-                if spent and spent.id != self.id:
-                    raise DoubleSpend('input `{}` was already spent'
-                                      .format(input_txid))
-
-                input_conditions.append(input_tx.conditions[input_cid])
-                input_txs.append(input_tx)
-                if input_tx.conditions[input_cid].amount < 1:
+                output = outputs.get((input_txid, input_cid))
+
+                if output and all(txid == self.id
+                                  for txid in output['spent_by']):
+                    input_condition = Condition.from_dict(output['condition'])
+                    asset_ids.add(output['asset_id'])
+                else:
+                    input_tx, status = resolved['transactions'][input_txid]
+
+                    if input_tx is None:
+                        raise TransactionDoesNotExist(
+                            "input `{}` doesn't exist".format(input_txid))
+
+                    if status != bigchain.TX_VALID:
+                        raise TransactionNotInValidBlock(
+                            'input `{}` does not exist in a valid block'
+                            .format(input_txid))
+
+                    input_condition = input_tx.conditions[input_cid]
+                    asset_ids.add(input_tx.asset.data_id)
+
+                    spent = resolved['spent'][(input_txid, input_cid)]
+                    if spent and spent.id != self.id:
+                        raise DoubleSpend('input `{}` was already spent'
+                                          .format(input_txid))
+
+                input_conditions.append(input_condition)
+                if input_condition.amount < 1:
                     raise AmountError('`amount` needs to be greater than zero')
-                input_amount += input_tx.conditions[input_cid].amount
+                input_amount += input_condition.amount
 
             # validate asset id
-            asset_id = Asset.get_asset_id(input_txs)
+            if len(asset_ids) > 1:
+                raise AssetIdMismatch(('All inputs of all transactions passed'
+                                       ' need to have the same asset id'))
+            asset_id = asset_ids.pop()
             if asset_id != self.asset.data_id:
                 raise AssetIdMismatch(('The asset id of the input does not'
                                        ' match the asset id of the'
                                        ' transaction'))
 
             # get the asset creation to see if its divisible or not
-            asset = bigchain.get_asset_by_id(asset_id)
+            asset = resolved['assets'].get(asset_id)
             # validate the asset
             asset.validate_asset(amount=input_amount)
             # validate the amounts
@@ -109,15 +281,34 @@ class Transaction(Transaction):
             raise TypeError('`operation`: `{}` must be either {}.'
                             .format(self.operation, allowed_operations))
 
-        if not self.fulfillments_valid(input_conditions):
-            raise InvalidSignature()
-        else:
-            return self
+        return input_conditions
 
     @classmethod
-    def from_dict(cls, tx_body):
-        validate_transaction_schema(tx_body)
-        return super().from_dict(tx_body)
+    def from_dict(cls, tx_body, trusted=False):
+        """Transform a Python dictionary to a Transaction object.
+
+        Args:
+            tx_body (dict): The transaction to be transformed.
+            trusted (bool, optional): If ``True``, the transaction is known
+                to be valid (e.g. it was read from a valid block, or from a
+                block this node voted valid), so
+                neither its schema nor its id is checked and parsing its
+                fulfillments is deferred until they are used.
+
+        Returns:
+            :class:`~.Transaction`
+        """
+        if not trusted:
+            validate_transaction_schema(tx_body)
+        return super().from_dict(tx_body, trusted)
+
+
+# The number of transactions `Block.from_dict` deserializes in a single task
+BLOCK_DESERIALIZATION_CHUNK_SIZE = 100
+
+
+def _transactions_from_dicts(tx_dicts):
+    return [Transaction.from_dict(tx) for tx in tx_dicts]
 
 
 class Block(object):
@@ -168,6 +359,8 @@ class Block(object):
 
         self.node_pubkey = node_pubkey
         self.signature = signature
+        self._cache = {}
+        self._serialized_transactions = {}
 
     def __eq__(self, other):
         try:
@@ -207,10 +400,9 @@ class Block(object):
 
         # Finally: Tentative assumption that every blockchain will want to
         # validate all transactions in each block
-        for tx in self.transactions:
-            # NOTE: If a transaction is not valid, `is_valid` will throw an
-            #       an exception and block validation will be canceled.
-            bigchain.validate_transaction(tx)
+        # NOTE: If a transaction is not valid, `validate_transactions` will
+        #       throw an exception and block validation will be canceled.
+        bigchain.validate_transactions(self.transactions)
 
         return self
 
@@ -224,8 +416,7 @@ class Block(object):
         Returns:
             :class:`~.Block`
         """
-        block_body = self.to_dict()
-        block_serialized = serialize(block_body['block'])
+        block_serialized = self._canonical()['serialized']
         private_key = PrivateKey(private_key)
         self.signature = private_key.sign(block_serialized.encode()).decode()
         return self
@@ -236,23 +427,43 @@ class Block(object):
         Returns:
             bool: Stating the validity of the Block's signature.
         """
-        block = self.to_dict()['block']
+        canonical = self._canonical()
+        if (self.signature is not None and
+                canonical.get('verified_signature') == self.signature):
+            return True
+
         # cc only accepts bytestring messages
-        block_serialized = serialize(block).encode()
-        public_key = PublicKey(block['node_pubkey'])
+        block_serialized = canonical['serialized'].encode()
+        public_key = PublicKey(self.node_pubkey)
         try:
             # NOTE: CC throws a `ValueError` on some wrong signatures
             #       https://github.com/bigchaindb/cryptoconditions/issues/27
-            return public_key.verify(block_serialized, self.signature)
+            signature_valid = public_key.verify(block_serialized,
+                                                self.signature)
         except (ValueError, AttributeError):
             return False
+        if signature_valid:
+            canonical['verified_signature'] = self.signature
+        return signature_valid
 
     @classmethod
-    def from_dict(cls, block_body):
+    def from_dict(cls, block_body, executor=None,
+                  chunk_size=BLOCK_DESERIALIZATION_CHUNK_SIZE):
         """Transform a Python dictionary to a Block object.
 
+        Note:
+            If an `executor` is given, the Block's transactions are
+            deserialized on it in chunks of `chunk_size`, while the Block's
+            signature is being verified. The result, and the exception
+            raised for an invalid Block, are the same as when deserializing
+            serially.
+
         Args:
             block_body (dict): A block dictionary to be transformed.
+            executor (:class:`concurrent.futures.Executor`, optional): An
+                executor to deserialize the Block's transactions on.
+            chunk_size (int): The number of transactions to deserialize in
+                a single task of the `executor`.
 
         Returns:
             :class:`~Block`
@@ -277,6 +488,12 @@ class Block(object):
         if block_id != block_body['id']:
             raise InvalidHash()
 
+        if executor is not None:
+            tx_dicts = block['transactions']
+            futures = [executor.submit(_transactions_from_dicts,
+                                       tx_dicts[i:i + chunk_size])
+                       for i in range(0, len(tx_dicts), chunk_size)]
+
         if signature is not None:
             # NOTE: CC throws a `ValueError` on some wrong signatures
             #       https://github.com/bigchaindb/cryptoconditions/issues/27
@@ -286,17 +503,91 @@ class Block(object):
             except ValueError:
                 signature_valid = False
             if signature_valid is False:
+                if executor is not None:
+                    for future in futures:
+                        future.cancel()
                 raise InvalidSignature('Invalid block signature')
 
-        transactions = [Transaction.from_dict(tx) for tx
-                        in block['transactions']]
+        if executor is None:
+            transactions = _transactions_from_dicts(block['transactions'])
+        else:
+            # NOTE: Chunks are collected in order, so the first invalid
+            #       transaction raises its exception, like it would serially.
+            transactions = [tx for future in futures
+                            for tx in future.result()]
+
+        block = cls(transactions, block['node_pubkey'], block['timestamp'],
+                    block['voters'], signature)
+        # NOTE: The block's id and signature were just checked against its
+        #       serialization, so there's no need to compute them again.
+        block._cache = {
+            'key': block._revision_key(),
+            'serialized': block_serialized,
+            'id': block_id,
+            'verified_signature': signature,
+        }
+        return block
+
+    def __getstate__(self):
+        # NOTE: Cache keys are built from revisions, which are only unique
+        #       within a process, so caches are not carried over.
+        state = self.__dict__.copy()
+        state['_cache'] = {}
+        state['_serialized_transactions'] = {}
+        return state
+
+    def _revision_key(self):
+        return (self.node_pubkey, self.timestamp, tuple(self.voters),
+                tuple(tx._revision_key() for tx in self.transactions))
+
+    def _canonical(self):
+        """Returns the cached serialization and id of the Block.
+
+        Note:
+            Transactions are serialized once each and reused, so appending
+            a Transaction only requires serializing that Transaction. The
+            cache is invalidated whenever one of the Block's attributes or
+            Transactions changes.
+
+        Returns:
+            dict: The `serialized` block body and its `id`.
+
+        Raises:
+            OperationError: If the Block doesn't contain any transactions.
+        """
+        if len(self.transactions) == 0:
+            raise OperationError('Empty block creation is not allowed')
 
-        return cls(transactions, block['node_pubkey'],
-                   block['timestamp'], block['voters'], signature)
+        key = self._revision_key()
+        if self._cache.get('key') != key:
+            serialized_transactions = {}
+            for tx_key, tx in zip(key[3], self.transactions):
+                try:
+                    tx_serialized = self._serialized_transactions[tx_key]
+                except KeyError:
+                    tx_serialized = serialize(tx.to_dict())
+                serialized_transactions[tx_key] = tx_serialized
+            self._serialized_transactions = serialized_transactions
+
+            # NOTE: Keys are in the order `serialize` sorts them in.
+            block_serialized = (
+                '{{"node_pubkey":{},"timestamp":{},"transactions":[{}],'
+                '"voters":{}}}'.format(
+                    serialize(self.node_pubkey),
+                    serialize(self.timestamp),
+                    ','.join(serialized_transactions[tx_key]
+                             for tx_key in key[3]),
+                    serialize(self.voters)))
+            self._cache = {
+                'key': key,
+                'serialized': block_serialized,
+                'id': hash_data(block_serialized),
+            }
+        return self._cache
 
     @property
     def id(self):
-        return self.to_dict()['id']
+        return self._canonical()['id']
 
     def to_dict(self):
         """Transform the Block to a Python dictionary.
@@ -307,17 +598,13 @@ class Block(object):
         Raises:
             OperationError: If the Block doesn't contain any transactions.
         """
-        if len(self.transactions) == 0:
-            raise OperationError('Empty block creation is not allowed')
-
+        block_id = self._canonical()['id']
         block = {
             'timestamp': self.timestamp,
             'transactions': [tx.to_dict() for tx in self.transactions],
             'node_pubkey': self.node_pubkey,
             'voters': self.voters,
         }
-        block_serialized = serialize(block)
-        block_id = hash_data(block_serialized)
 
         return {
             'id': block_id,
@@ -326,4 +613,7 @@ class Block(object):
         }
 
     def to_str(self):
-        return serialize(self.to_dict())
+        canonical = self._canonical()
+        return '{{"block":{},"id":{},"signature":{}}}'.format(
+            canonical['serialized'], serialize(canonical['id']),
+            serialize(self.signature))
@@ -1,9 +1,11 @@
 """This module takes care of all the logic related to block status.
 
-Specifically, what happens when a block becomes invalid.  The logic is
+Specifically, what happens when a block is decided: the utxo table is
+updated, and the transactions of an invalid block are requeued.  The logic is
 encapsulated in the ``Election`` class, while the sequence of actions
 is specified in ``create_pipeline``.
 """
+import collections
 import logging
 
 from multipipes import Pipeline, Node
@@ -11,6 +13,7 @@ from multipipes import Pipeline, Node
 from bigchaindb.pipelines.utils import ChangeFeed
 from bigchaindb.models import Block
 from bigchaindb import Bigchain
+from bigchaindb.core import DECIDED_BLOCKS_CACHE_SIZE
 
 
 logger = logging.getLogger(__name__)
@@ -21,31 +24,74 @@ class Election:
 
     def __init__(self):
         self.bigchain = Bigchain()
+        # the voters and the votes (by signature) of the undecided blocks
+        # that were voted on most recently
+        self.tallies = collections.OrderedDict()
 
     def check_for_quorum(self, next_vote):
         """
         Checks if block has enough invalid votes to make a decision
 
+        The votes on a block are tallied incrementally: the voters of the
+        block and the votes already cast are read once, and every vote coming
+        from the changefeed is added to the tally. Once the block is decided,
+        the utxo table is updated, and the full block is only read if it is
+        decided invalid.
+
         Args:
             next_vote: The next vote.
 
         """
-        next_block = self.bigchain.get_block(
-            next_vote['vote']['voting_for_block'])
-
-        block_status = self.bigchain.block_election_status(next_block['id'],
-                                                           next_block['block']['voters'])
+        block_id = next_vote['vote']['voting_for_block']
+        if block_id in self.bigchain.decided_blocks:
+            return
+
+        tally = self.tallies.pop(block_id, None)
+        if tally is None:
+            voters = self.bigchain.get_block_voters(block_id)
+            if voters is None:
+                # the block of the vote can't be read (yet), the vote is
+                # tallied again with the next vote on the block
+                return
+            votes = self.bigchain.get_votes(block_id)
+            tally = {
+                'voters': voters,
+                'votes': {vote['signature']: vote for vote in votes},
+            }
+        tally['votes'][next_vote['signature']] = next_vote
+
+        block_status = self.bigchain.block_election_status(
+            block_id, tally['voters'], votes=list(tally['votes'].values()))
+        if block_status == self.bigchain.BLOCK_UNDECIDED:
+            # only the undecided blocks are tallied, and only as many as the
+            # decided blocks remembered; the tally of a block that was left
+            # out is read again on its next vote
+            self.tallies[block_id] = tally
+            if len(self.tallies) > DECIDED_BLOCKS_CACHE_SIZE:
+                self.tallies.popitem(last=False)
+            return
+
+        self.bigchain.update_outputs(block_id, block_status)
         if block_status == self.bigchain.BLOCK_INVALID:
-            return Block.from_dict(next_block)
+            return Block.from_dict(self.bigchain.get_block(block_id))
 
     def requeue_transactions(self, invalid_block):
         """
         Liquidates transactions from invalid blocks so they can be processed again
+
+        Once the status of the block is not remembered anymore, a late vote
+        decides it again, so the transactions that are already back in the
+        backlog or in another block are left out.
         """
+        transactions = self.bigchain.get_transactions(
+            [tx.id for tx in invalid_block.transactions])
+        requeued = [tx for tx in invalid_block.transactions
+                    if transactions[tx.id] == (None, None)]
+
         logger.info('Rewriting %s transactions from invalid block %s',
-                    len(invalid_block.transactions),
+                    len(requeued),
                     invalid_block.id)
-        for tx in invalid_block.transactions:
+        for tx in requeued:
             self.bigchain.write_transaction(tx)
         return invalid_block
 
@@ -5,6 +5,7 @@ remain in the backlog past a certain amount of time.
 """
 
 import logging
+from itertools import islice
 from multipipes import Pipeline, Node
 from bigchaindb import Bigchain
 from time import sleep
@@ -12,6 +13,9 @@ from time import sleep
 
 logger = logging.getLogger(__name__)
 
+# The number of stale transactions reassigned with each query
+STALE_TRANSACTIONS_CHUNK_SIZE = 1000
+
 
 class StaleTransactionMonitor:
     """This class encapsulates the logic for re-assigning stale transactions.
@@ -36,20 +40,21 @@ class StaleTransactionMonitor:
         """Poll backlog for stale transactions
 
         Returns:
-            txs (list): txs to be re assigned
+            txs (list): chunks of txs to be re assigned
         """
         sleep(self.timeout)
-        for tx in self.bigchain.get_stale_transactions():
-            yield tx
+        stale_txs = iter(self.bigchain.get_stale_transactions())
+        for txs in iter(lambda: list(islice(stale_txs, STALE_TRANSACTIONS_CHUNK_SIZE)), []):
+            yield txs
 
-    def reassign_transactions(self, tx):
-        """Put tx back in backlog with new assignee
+    def reassign_transactions(self, txs):
+        """Put txs back in backlog with new assignees
 
         Returns:
-            transaction
+            transactions
         """
-        self.bigchain.reassign_transaction(tx)
-        return tx
+        self.bigchain.reassign_transactions(txs)
+        return txs
 
 
 def create_pipeline(timeout=5, backlog_reassign_delay=5):
@@ -6,10 +6,13 @@ function.
 """
 
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from multipipes import Pipeline, Node
 from bigchaindb.common import exceptions
 
+import bigchaindb
+
 from bigchaindb.consensus import BaseConsensusRules
 from bigchaindb.models import Transaction, Block
 from bigchaindb.pipelines.utils import ChangeFeed
@@ -42,11 +45,52 @@ class Vote:
         self.invalid_dummy_tx = Transaction.create([self.bigchain.me],
                                                    [([self.bigchain.me], 1)])
 
+        deserialization = bigchaindb.config['block_deserialization']
+        self.deserialization_workers = deserialization['workers']
+        self.deserialization_executor = deserialization['executor']
+        self.executor = None
+
+    def get_executor(self):
+        """Return the executor to deserialize blocks on, if any.
+
+        Note:
+            The executor is created lazily, in the process `validate_block`
+            runs in.
+
+        Returns:
+            A :class:`concurrent.futures.Executor`, or ``None`` if blocks
+            are deserialized serially.
+        """
+        if self.deserialization_workers <= 1:
+            return None
+
+        if self.executor is None:
+            if self.deserialization_executor == 'thread':
+                executor_class = ThreadPoolExecutor
+            else:
+                executor_class = ProcessPoolExecutor
+            self.executor = executor_class(self.deserialization_workers)
+        return self.executor
+
     def validate_block(self, block):
+        """Validate a block, and record its outputs in the utxo table.
+
+        The outputs of the block are recorded before its transactions are
+        validated, as the blocks come one at a time: the transactions are
+        then validated knowing the outputs spent by all the blocks before.
+
+        Args:
+            block (dict): the block to validate.
+
+        Returns:
+            ``None`` if the block has been already voted, the block id and
+            its transactions otherwise.
+        """
         if not self.bigchain.has_previous_vote(block['id'],
                                                block['block']['voters']):
+            block_dict = block
             try:
-                block = Block.from_dict(block)
+                block = Block.from_dict(block, executor=self.get_executor())
             except (exceptions.InvalidHash, exceptions.InvalidSignature):
                 # XXX: if a block is invalid we should skip the `validate_tx`
                 # step, but since we are in a pipeline we cannot just jump to
@@ -65,6 +109,9 @@ class Vote:
                 # transaction and propagate it to the next steps of the
                 # pipeline.
                 return block.id, [self.invalid_dummy_tx]
+
+            self.bigchain.write_block_outputs(block_dict)
+            self.bigchain.write_block_assets(block_dict)
             return block.id, block.transactions
 
     def ungroup(self, block_id, transactions):
@@ -2,6 +2,7 @@ import contextlib
 import threading
 import queue
 import multiprocessing as mp
+from functools import lru_cache
 
 from bigchaindb.common import crypto
 from bigchaindb.common.util import serialize
@@ -136,8 +137,21 @@ def verify_vote_signature(voters, signed_vote):
     if pk_base58 not in voters:
         return False
 
+    return _verify_signature(pk_base58, serialize(signed_vote['vote']),
+                             signature)
+
+
+# The number of vote signatures whose verification result is remembered
+VOTE_SIGNATURE_CACHE_SIZE = 2**14
+
+
+@lru_cache(maxsize=VOTE_SIGNATURE_CACHE_SIZE)
+def _verify_signature(pk_base58, message, signature):
+    """Verify a signature, remembering the result, since the same votes are
+    verified every time the status of a block is determined."""
+
     public_key = crypto.PublicKey(pk_base58)
-    return public_key.verify(serialize(signed_vote['vote']).encode(), signature)
+    return public_key.verify(message.encode(), signature)
 
 
 def is_genesis_block(block):
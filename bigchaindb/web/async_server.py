@@ -0,0 +1,348 @@
+"""This module contains an asyncio implementation of the BigchainDB API.
+
+It serves the same endpoints, with the same responses, as the Flask
+application of :mod:`bigchaindb.web.server`, but on an event loop: the
+handlers do not hold a thread while they wait for RethinkDB, and the
+validation of the posted transactions runs on a pool of processes.
+
+The application is implemented in aiohttp and runs using Gunicorn.
+"""
+
+import asyncio
+import functools
+import json
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from aiohttp import web
+from flask_restful import inputs
+
+import bigchaindb
+from bigchaindb import util
+from bigchaindb import version
+from bigchaindb import Bigchain
+from bigchaindb.common.exceptions import (
+    ValidationError,
+    InvalidSignature,
+    SchemaValidationError,
+)
+from bigchaindb.core import WRITE_TRANSACTIONS_CHUNK_SIZE
+from bigchaindb.db.async_utils import AsyncConnection
+from bigchaindb.db.backends.rethinkdb import RethinkDBBackend
+from bigchaindb.models import Transaction
+from bigchaindb.monitor import Monitor
+from bigchaindb.web.server import StandaloneApplication
+
+
+# The Bigchain instance of each process of the validation pool
+_bigchain = None
+
+
+class AsyncioApplication(StandaloneApplication):
+    """Run an aiohttp app with the aiohttp Gunicorn worker.
+
+    The app is created by each worker, once the worker has set up its event
+    loop.
+    """
+
+    def load(self):
+        return self.application()
+
+
+def make_error(status_code, message=None):
+
+    if status_code == 404 and message is None:
+        message = 'Not found'
+
+    return web.json_response({
+        'status': status_code,
+        'message': message
+    }, status=status_code)
+
+
+def validate_transactions(transactions):
+    """Validate posted transactions, in a process of the validation pool.
+
+    Args:
+        transactions (list): the posted transactions, as dicts.
+
+    Return:
+        A list with, for each transaction, a tuple with the document to
+        write to the backlog if the transaction is valid, and otherwise the
+        message of the error to respond with.
+    """
+    global _bigchain
+
+    if _bigchain is None:
+        _bigchain = Bigchain()
+
+    results = [None] * len(transactions)
+    tx_objs = []
+    for i, tx in enumerate(transactions):
+        try:
+            tx_objs.append((i, Transaction.from_dict(tx)))
+        except SchemaValidationError as e:
+            results[i] = (None, 'Invalid transaction schema: {}'.format(
+                e.__cause__.message))
+        except (ValidationError, InvalidSignature):
+            results[i] = (None, 'Invalid transaction')
+
+    validated = _bigchain.validate_each_transaction(
+        [tx_obj for _, tx_obj in tx_objs])
+
+    for (i, tx_obj), validated_tx in zip(tx_objs, validated):
+        if validated_tx is tx_obj:
+            results[i] = (_bigchain.assign_transaction(tx_obj), None)
+        else:
+            results[i] = (None, 'Invalid transaction')
+
+    return results
+
+
+@asyncio.coroutine
+def home(request):
+    return web.json_response({
+        'software': 'BigchainDB',
+        'version': version.__version__,
+        'public_key': bigchaindb.config['keypair']['public'],
+        'keyring': bigchaindb.config['keyring'],
+        'api_endpoint': bigchaindb.config['api_endpoint']
+    })
+
+
+@asyncio.coroutine
+def get_transaction(request):
+    """API endpoint to get details about a transaction.
+
+    The transaction is looked up the same way as in
+    :meth:`~bigchaindb.Bigchain.get_transaction`.
+    """
+    tx_id = request.match_info['tx_id']
+    bigchain = request.app['bigchain']
+    backend = request.app['backend']
+
+    blocks = yield from backend.get_blocks_status_from_transaction(
+        tx_id, include_transaction=True)
+    validity = bigchain.get_blocks_status(tx_id, blocks)
+    _, target_block_id = bigchain.get_tx_status(validity)
+
+    if target_block_id is not None:
+        tx = next(block['transaction'] for block in blocks
+                  if block['id'] == target_block_id)
+    else:
+        tx = yield from backend.get_transaction_from_backlog(tx_id)
+
+    if not tx:
+        return make_error(404)
+
+    return web.json_response(tx)
+
+
+@asyncio.coroutine
+def get_transaction_status(request):
+    """API endpoint to get details about the status of a transaction.
+
+    The status is determined the same way as in
+    :meth:`~bigchaindb.Bigchain.get_status`.
+    """
+    tx_id = request.match_info['tx_id']
+    bigchain = request.app['bigchain']
+    backend = request.app['backend']
+
+    blocks = yield from backend.get_blocks_status_from_transaction(tx_id)
+    validity = bigchain.get_blocks_status(tx_id, blocks)
+    status, _ = bigchain.get_tx_status(validity)
+
+    if status is None and \
+            (yield from backend.is_transaction_in_backlog(tx_id)):
+        status = bigchain.TX_IN_BACKLOG
+
+    if not status:
+        return make_error(404)
+
+    return web.json_response({'status': status})
+
+
+@asyncio.coroutine
+def get_transactions(request):
+    """API endpoint to get the transactions related to an asset.
+
+    Reading the history of an asset takes several queries, so it is done
+    with a :class:`~bigchaindb.Bigchain` instance, on a thread.
+    """
+    if 'asset_id' not in request.GET:
+        return web.json_response({'message': {
+            'asset_id': 'Missing required parameter in the query string'}},
+            status=400)
+
+    asset_id = request.GET['asset_id']
+    try:
+        offset = inputs.natural(request.GET.get('offset', 0))
+    except ValueError as e:
+        return web.json_response({'message': {'offset': str(e)}},
+                                 status=400)
+    try:
+        limit = request.GET.get('limit')
+        if limit is not None:
+            limit = inputs.positive(limit)
+    except ValueError as e:
+        return web.json_response({'message': {'limit': str(e)}},
+                                 status=400)
+
+    pool = request.app['bigchain_pool']
+
+    def read_transactions():
+        with pool() as bigchain:
+            txs = bigchain.iter_transactions_by_asset_id(
+                asset_id, offset=offset, limit=limit)
+            return [tx.to_dict() for tx in txs]
+
+    txs = yield from request.app.loop.run_in_executor(None, read_transactions)
+    return web.json_response(txs)
+
+
+@asyncio.coroutine
+def post_transaction(request):
+    """API endpoint to push transactions to the Federation."""
+    executor = request.app['executor']
+    backend = request.app['backend']
+    monitor = request.app['monitor']
+
+    try:
+        tx = json.loads((yield from request.text()))
+    except ValueError:
+        return make_error(400, 'Invalid JSON')
+
+    [(document, message)] = yield from request.app.loop.run_in_executor(
+        executor, validate_transactions, [tx])
+    if message:
+        return make_error(400, message)
+
+    rate = bigchaindb.config['statsd']['rate']
+    with monitor.timer('write_transaction', rate=rate):
+        yield from backend.write_transaction(document)
+
+    return web.json_response(tx)
+
+
+@asyncio.coroutine
+def post_transactions_batch(request):
+    """API endpoint to push many transactions to the Federation at once.
+
+    The body of the request is either a JSON array of transactions, or
+    newline-delimited JSON transactions with the ``application/x-ndjson``
+    content type. A transaction repeated in the batch is only accepted once.
+    """
+    executor = request.app['executor']
+    backend = request.app['backend']
+    monitor = request.app['monitor']
+
+    body = yield from request.text()
+    try:
+        if request.content_type == 'application/x-ndjson':
+            txs = [json.loads(line) for line in body.splitlines()
+                   if line.strip()]
+        else:
+            txs = json.loads(body)
+    except ValueError:
+        return make_error(400, 'Invalid JSON')
+
+    if not isinstance(txs, list):
+        return make_error(400, 'Expected a list of transactions')
+
+    max_batch_size = bigchaindb.config['server']['max_batch_size']
+    if len(txs) > max_batch_size:
+        return make_error(413, 'Too many transactions, the maximum is {}'
+                          .format(max_batch_size))
+
+    validated = yield from request.app.loop.run_in_executor(
+        executor, validate_transactions, txs)
+
+    results = []
+    documents = {}
+    for tx, (document, message) in zip(txs, validated):
+        result = {'id': tx.get('id') if isinstance(tx, dict) else None,
+                  'accepted': False}
+        if document is None:
+            result['message'] = message
+        elif document['id'] in documents:
+            result['message'] = 'Duplicate transaction'
+        else:
+            result['accepted'] = True
+            documents[document['id']] = document
+        results.append(result)
+
+    rate = bigchaindb.config['statsd']['rate']
+    documents = iter(documents.values())
+    with monitor.timer('write_transactions', rate=rate):
+        while True:
+            chunk = list(islice(documents, WRITE_TRANSACTIONS_CHUNK_SIZE))
+            if not chunk:
+                break
+            yield from backend.write_transactions(chunk)
+
+    return web.json_response(results)
+
+
+@asyncio.coroutine
+def shutdown(app):
+    app['executor'].shutdown(wait=False)
+
+
+def create_app(*, debug=False, threads=4, validation_workers=1):
+    """Return an instance of the aiohttp application.
+
+    Args:
+        debug (bool): a flag to activate the debug mode for the app
+            (default: False).
+        threads (int): number of connections to RethinkDB, and of Bigchain
+            instances to read the history of assets with.
+        validation_workers (int): number of processes to validate
+            transactions with (default: 1). Each Gunicorn worker creates
+            its own application, with its own processes.
+    Return:
+        an instance of the aiohttp application.
+    """
+
+    app = web.Application(debug=debug)
+
+    app['bigchain'] = Bigchain()
+    app['bigchain_pool'] = util.pool(Bigchain, size=threads)
+    app['backend'] = RethinkDBBackend(
+        connection=AsyncConnection(size=threads))
+    app['executor'] = ProcessPoolExecutor(validation_workers)
+    app['monitor'] = Monitor()
+    app.on_shutdown.append(shutdown)
+
+    app.router.add_route('GET', '/', home)
+    # the routes of the API accept a trailing slash, like the Flask ones
+    for path, method, handler in (
+            ('/transactions', 'GET', get_transactions),
+            ('/transactions', 'POST', post_transaction),
+            ('/transactions/batch', 'POST', post_transactions_batch),
+            ('/transactions/{tx_id}', 'GET', get_transaction),
+            ('/transactions/{tx_id}/status', 'GET', get_transaction_status)):
+        app.router.add_route(method, '/api/v1' + path, handler)
+        app.router.add_route(method, '/api/v1' + path + '/', handler)
+    return app
+
+
+def create_server(settings):
+    """Wrap and return an application ready to be run.
+
+    Args:
+        settings (dict): a dictionary containing the settings (see
+            :func:`bigchaindb.web.server.create_server`).
+
+    Return:
+        an initialized instance of the application.
+    """
+
+    settings = dict(settings,
+                    worker_class='aiohttp.worker.GunicornWebWorker')
+    app = functools.partial(create_app,
+                            debug=settings.get('debug', False),
+                            threads=settings['threads'],
+                            validation_workers=settings.get(
+                                'validation_workers') or 1)
+    return AsyncioApplication(app, settings)
@@ -78,6 +78,8 @@ def create_server(settings):
     Args:
         settings (dict): a dictionary containing the settings, more info
             here http://docs.gunicorn.org/en/latest/settings.html
+            If ``mode`` is ``'asyncio'``, the asyncio application of
+            :mod:`bigchaindb.web.async_server` is served instead.
 
     Return:
         an initialized instance of the application.
@@ -91,6 +93,11 @@ def create_server(settings):
     if not settings.get('threads'):
         settings['threads'] = (multiprocessing.cpu_count() * 2) + 1
 
+    if settings.get('mode') == 'asyncio':
+        # aiohttp is only needed in this mode
+        from bigchaindb.web import async_server
+        return async_server.create_server(settings)
+
     app = create_app(debug=settings.get('debug', False),
                      threads=settings['threads'])
     standalone = StandaloneApplication(app, settings)
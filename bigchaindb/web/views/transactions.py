@@ -3,8 +3,11 @@
 For more information please refer to the documentation on ReadTheDocs:
  - https://docs.bigchaindb.com/projects/server/en/latest/drivers-clients/http-client-server-api.html
 """
+import json
+
 from flask import current_app, request, Blueprint
-from flask_restful import Resource, Api
+from flask_restful import Resource, Api, reqparse, inputs
+from werkzeug.exceptions import BadRequest
 
 from bigchaindb.common.exceptions import (
     ValidationError,
@@ -87,6 +90,31 @@ class TransactionStatusApi(Resource):
 
 
 class TransactionListApi(Resource):
+    def get(self):
+        """API endpoint to get the transactions related to an asset.
+
+        The ``asset_id`` is given in the querystring, and the transactions
+        can be paginated with ``offset`` and ``limit``.
+
+        Return:
+            A list of the valid or undecided transactions related to the
+            asset.
+        """
+        parser = reqparse.RequestParser()
+        parser.add_argument('asset_id', type=str, required=True,
+                            location='args')
+        parser.add_argument('offset', type=inputs.natural, default=0,
+                            location='args')
+        parser.add_argument('limit', type=inputs.positive, location='args')
+        args = parser.parse_args()
+
+        pool = current_app.config['bigchain_pool']
+
+        with pool() as bigchain:
+            txs = bigchain.iter_transactions_by_asset_id(
+                args['asset_id'], offset=args['offset'], limit=args['limit'])
+            return [tx.to_dict() for tx in txs]
+
     def post(self):
         """API endpoint to push transactions to the Federation.
 
@@ -98,7 +126,10 @@ class TransactionListApi(Resource):
 
         # `force` will try to format the body of the POST request even if the `content-type` header is not
         # set to `application/json`
-        tx = request.get_json(force=True)
+        try:
+            tx = request.get_json(force=True)
+        except BadRequest:
+            return make_error(400, 'Invalid JSON')
 
         try:
             tx_obj = Transaction.from_dict(tx)
@@ -122,6 +153,81 @@ class TransactionListApi(Resource):
         return tx
 
 
+class TransactionBatchApi(Resource):
+    def post(self):
+        """API endpoint to push many transactions to the Federation at once.
+
+        The body of the request is either a JSON array of transactions, or
+        newline-delimited JSON transactions with the ``application/x-ndjson``
+        content type. The transactions are validated together, and the valid
+        ones are written even if others are invalid. A transaction repeated
+        in the batch is only accepted once.
+
+        Return:
+            A list with, for each transaction, its ``id``, whether it was
+            ``accepted``, and if not, a ``message`` describing why.
+        """
+        pool = current_app.config['bigchain_pool']
+        monitor = current_app.config['monitor']
+
+        if request.mimetype == 'application/x-ndjson':
+            try:
+                txs = [json.loads(line) for line
+                       in request.get_data(as_text=True).splitlines()
+                       if line.strip()]
+            except ValueError:
+                return make_error(400, 'Invalid JSON')
+        else:
+            # `force` will try to format the body of the POST request even
+            # if the `content-type` header is not set to `application/json`
+            try:
+                txs = request.get_json(force=True)
+            except BadRequest:
+                return make_error(400, 'Invalid JSON')
+
+        if not isinstance(txs, list):
+            return make_error(400, 'Expected a list of transactions')
+
+        max_batch_size = bigchaindb.config['server']['max_batch_size']
+        if len(txs) > max_batch_size:
+            return make_error(413, 'Too many transactions, the maximum is {}'
+                              .format(max_batch_size))
+
+        results = [{'id': tx.get('id') if isinstance(tx, dict) else None,
+                    'accepted': False}
+                   for tx in txs]
+        tx_objs = []
+        for result, tx in zip(results, txs):
+            try:
+                tx_objs.append((result, Transaction.from_dict(tx)))
+            except SchemaValidationError as e:
+                result['message'] = 'Invalid transaction schema: {}'.format(
+                    e.__cause__.message)
+            except (ValidationError, InvalidSignature):
+                result['message'] = 'Invalid transaction'
+
+        with pool() as bigchain:
+            validated = bigchain.validate_each_transaction(
+                [tx_obj for _, tx_obj in tx_objs])
+
+            valid_txs = {}
+            for (result, tx_obj), validated_tx in zip(tx_objs, validated):
+                if validated_tx is not tx_obj:
+                    result['message'] = 'Invalid transaction'
+                elif tx_obj.id in valid_txs:
+                    result['message'] = 'Duplicate transaction'
+                else:
+                    result['accepted'] = True
+                    valid_txs[tx_obj.id] = tx_obj
+
+            if valid_txs:
+                rate = bigchaindb.config['statsd']['rate']
+                with monitor.timer('write_transactions', rate=rate):
+                    bigchain.write_transactions(list(valid_txs.values()))
+
+        return results
+
+
 transaction_api.add_resource(TransactionApi,
                              '/transactions/<string:tx_id>',
                              strict_slashes=False)
@@ -131,3 +237,6 @@ transaction_api.add_resource(TransactionStatusApi,
 transaction_api.add_resource(TransactionListApi,
                              '/transactions',
                              strict_slashes=False)
+transaction_api.add_resource(TransactionBatchApi,
+                             '/transactions/batch',
+                             strict_slashes=False)
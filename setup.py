@@ -40,6 +40,10 @@ docs_require = [
     'sphinxcontrib-napoleon>=0.4.4',
 ]
 
+asyncio_require = [
+    'aiohttp~=1.3',
+]
+
 tests_require = [
     'coverage',
     'pep8',
@@ -49,7 +53,7 @@ tests_require = [
     'pytest-cov>=2.2.1',
     'pytest-xdist',
     'pytest-flask',
-] + docs_require
+] + docs_require + asyncio_require
 
 benchmarks_require = [
     'line-profiler==1.0',
@@ -111,6 +115,7 @@ setup(
         'test': tests_require,
         'dev': dev_require + tests_require + docs_require + benchmarks_require,
         'docs': docs_require,
+        'asyncio': asyncio_require,
     },
     package_data={'bigchaindb.common.schema': ['transaction.yaml']},
 )
@@ -89,9 +89,63 @@ def speedtest_deserialize_block_rapidjson():
     print('speedtest_deserialize_block_rapidjson: {} s'.format(time_elapsed))
 
 
+def speedtest_validate_transaction_schema():
+    import jsonschema
+    from bigchaindb.common.crypto import generate_key_pair
+    from bigchaindb.common.schema import TX_SCHEMA, validate_transaction_schema
+    from bigchaindb.models import Transaction
+
+    # create a transaction
+    private_key, public_key = generate_key_pair()
+    tx = Transaction.create([public_key], [([public_key], 1)])
+    tx_dict = tx.sign([private_key]).to_dict()
+
+    time_start = time.time()
+    for _ in range(1000):
+        jsonschema.validate(tx_dict, TX_SCHEMA)
+    time_elapsed = time.time() - time_start
+
+    print('speedtest_validate_transaction_schema_jsonschema: {} s'
+          .format(time_elapsed))
+
+    time_start = time.time()
+    for _ in range(1000):
+        validate_transaction_schema(tx_dict)
+    time_elapsed = time.time() - time_start
+
+    print('speedtest_validate_transaction_schema_compiled: {} s'
+          .format(time_elapsed))
+
+
+def speedtest_block_memory_size():
+    import pickle
+    import tracemalloc
+    from bigchaindb.common.crypto import generate_key_pair
+    from bigchaindb.models import Block, Transaction
+
+    private_key, public_key = generate_key_pair()
+    tx = Transaction.create([public_key], [([public_key], 1)])
+    tx_dict = tx.sign([private_key]).to_dict()
+
+    tracemalloc.start()
+    snapshot_start = tracemalloc.take_snapshot()
+    block = Block([Transaction.from_dict(tx_dict) for _ in range(1000)],
+                  public_key)
+    snapshot_end = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    size = sum(stat.size_diff for stat
+               in snapshot_end.compare_to(snapshot_start, 'filename'))
+    print('speedtest_block_memory_size: {} bytes'.format(size))
+    print('speedtest_block_pickle_size: {} bytes'
+          .format(len(pickle.dumps(block))))
+
+
 if __name__ == '__main__':
     speedtest_validate_transaction()
     speedtest_serialize_block_json()
     speedtest_serialize_block_rapidjson()
     speedtest_deserialize_block_json()
     speedtest_deserialize_block_rapidjson()
+    speedtest_validate_transaction_schema()
+    speedtest_block_memory_size()
@@ -199,6 +199,22 @@ def test_get_asset_by_id(b, user_pk, user_sk):
     assert asset == tx_create.asset
 
 
+def test_get_asset_by_id_reads_the_assets_table(b, user_pk, forbid):
+    from bigchaindb.models import Transaction
+
+    tx_create = Transaction.create([b.me], [([user_pk], 1)])
+    tx_create = tx_create.sign([b.me_private])
+    block = b.create_block([tx_create])
+    b.write_block(block, durability='hard')
+
+    forbid(b.backend, 'get_assets_by_ids')
+    assert b.get_asset_by_id(tx_create.asset.data_id) == tx_create.asset
+
+    # the asset is remembered
+    forbid(b.backend, 'get_asset_definitions')
+    assert b.get_asset_by_id(tx_create.asset.data_id) == tx_create.asset
+
+
 def test_create_invalid_divisible_asset(b, user_pk, user_sk):
     from bigchaindb.models import Transaction, Asset
     from bigchaindb.common.exceptions import AmountError
@@ -48,3 +48,12 @@ def test_addition_properties_always_set():
                 walk(val, path + name + '.')
 
     walk(TX_SCHEMA)
+
+
+def test_validation_does_not_rebuild_validator():
+    from unittest.mock import patch
+
+    with patch('jsonschema.validate') as mock_validate:
+        with raises(SchemaValidationError):
+            validate_transaction_schema({})
+    assert not mock_validate.called
@@ -1,3 +1,4 @@
+import pytest
 from pytest import raises
 from unittest.mock import patch
 
@@ -1036,3 +1037,288 @@ def test_cant_add_empty_fulfillment():
         tx = Transaction(Transaction.CREATE, None)
     with raises(TypeError):
         tx.add_fulfillment(None)
+
+
+def test_transaction_id_is_cached(utx):
+    from bigchaindb.common.transaction import Transaction
+
+    tx_id = utx.id
+    with patch.object(Transaction, '_to_hash') as mock_hash:
+        assert utx.id == tx_id
+        assert utx.to_dict()['id'] == tx_id
+    assert not mock_hash.called
+
+
+def test_transaction_id_cache_invalidation(utx, user2_pub, user2_cond):
+    from bigchaindb.common.transaction import Transaction, TransactionLink
+
+    def expected_id(tx):
+        tx_dict = tx.to_dict()
+        tx_dict.pop('id')
+        tx_no_signatures = Transaction._remove_signatures(tx_dict)
+        return Transaction._to_hash(Transaction._to_str(tx_no_signatures))
+
+    tx_id = utx.id
+
+    utx.metadata = {'msg': 'changed'}
+    assert utx.id != tx_id
+    assert utx.id == expected_id(utx)
+
+    tx_id = utx.id
+    utx.conditions[0].amount = 2
+    assert utx.id != tx_id
+    assert utx.id == expected_id(utx)
+
+    tx_id = utx.id
+    utx.fulfillments[0].tx_input = TransactionLink('a', 0)
+    assert utx.id != tx_id
+    assert utx.id == expected_id(utx)
+
+    tx_id = utx.id
+    utx.fulfillments[0].tx_input.cid = 1
+    assert utx.id != tx_id
+    assert utx.id == expected_id(utx)
+
+    tx_id = utx.id
+    utx.add_condition(user2_cond)
+    assert utx.id != tx_id
+    assert utx.id == expected_id(utx)
+
+    tx_id = utx.id
+    utx.asset.data = {'msg': 'changed'}
+    assert utx.id != tx_id
+    assert utx.id == expected_id(utx)
+
+
+def test_transaction_id_unchanged_by_signing(utx, user_priv):
+    tx_id = utx.id
+    utx.sign([user_priv])
+    assert utx.id == tx_id
+
+
+def test_sign_modified_transaction_again(utx, user_priv):
+    from bigchaindb.common.transaction import Transaction
+
+    utx.sign([user_priv])
+    utx.metadata = {'msg': 'changed'}
+    utx.sign([user_priv])
+    assert utx.fulfillments_valid() is True
+
+    tx = Transaction.from_dict(utx.to_dict())
+    tx.metadata = {'msg': 'changed again'}
+    tx.sign([user_priv])
+    assert tx.fulfillments_valid() is True
+    assert Transaction.from_dict(tx.to_dict()).fulfillments_valid() is True
+
+
+def test_sign_modified_threshold_transaction_again(user_user2_threshold_ffill,
+                                                   user_user2_threshold_cond,
+                                                   user_priv, user2_priv):
+    from bigchaindb.common.transaction import Transaction, Asset
+
+    tx = Transaction(Transaction.CREATE, Asset(), [user_user2_threshold_ffill],
+                     [user_user2_threshold_cond])
+    tx.sign([user_priv, user2_priv])
+    tx.metadata = {'msg': 'changed'}
+    tx.sign([user_priv, user2_priv])
+    assert tx.fulfillments_valid() is True
+
+
+def _random_json_string(rand):
+    return ''.join(rand.choice('aZ09 "\\/\n\té€😀')
+                   for _ in range(rand.randint(0, 8)))
+
+
+def _random_json_value(rand, depth=0):
+    kinds = ['str', 'int', 'float', 'bool', 'none']
+    if depth < 3:
+        kinds += ['list', 'dict']
+    kind = rand.choice(kinds)
+    if kind == 'str':
+        return _random_json_string(rand)
+    elif kind == 'int':
+        return rand.randint(-2**40, 2**40)
+    elif kind == 'float':
+        return rand.uniform(-1e6, 1e6)
+    elif kind == 'bool':
+        return rand.random() < 0.5
+    elif kind == 'none':
+        return None
+    elif kind == 'list':
+        return [_random_json_value(rand, depth + 1)
+                for _ in range(rand.randint(0, 4))]
+    return {_random_json_string(rand): _random_json_value(rand, depth + 1)
+            for _ in range(rand.randint(0, 4))}
+
+
+@pytest.mark.parametrize('seed', range(50))
+def test_to_str_without_signatures_matches_remove_signatures(seed):
+    import random
+    from copy import deepcopy
+    from bigchaindb.common.transaction import Transaction
+
+    rand = random.Random(seed)
+    tx_dict = {
+        'fulfillments': [{
+            'owners_before': [_random_json_value(rand)],
+            'input': _random_json_value(rand),
+            'fulfillment': _random_json_value(rand),
+            'fid': fid,
+        } for fid in range(rand.randint(0, 3))],
+        'conditions': [_random_json_value(rand)],
+        'operation': 'CREATE',
+        'metadata': _random_json_value(rand),
+        'asset': {'id': 'a', 'data': _random_json_value(rand)},
+        'version': 1,
+    }
+    original = deepcopy(tx_dict)
+
+    expected = Transaction._to_str(Transaction._remove_signatures(tx_dict))
+    assert Transaction._to_str_without_signatures(tx_dict) == expected
+    assert tx_dict == original
+
+
+def test_fulfillment_messages_match_partial_transactions(user_ffill,
+                                                         user2_ffill,
+                                                         user_cond,
+                                                         user2_cond):
+    from bigchaindb.common.transaction import (Transaction, Asset,
+                                               TransactionLink)
+
+    user_ffill.tx_input = TransactionLink('a', 0)
+    user2_ffill.tx_input = TransactionLink('b', 1)
+    tx = Transaction(Transaction.TRANSFER, Asset(), [user_ffill, user2_ffill],
+                     [user_cond, user2_cond], {'msg': 'é'})
+
+    expected = []
+    for ffill in tx.fulfillments:
+        tx_partial = Transaction(tx.operation, tx.asset, [ffill],
+                                 tx.conditions, tx.metadata, tx.version)
+        tx_partial_dict = Transaction._remove_signatures(tx_partial.to_dict())
+        expected.append(Transaction._to_str(tx_partial_dict))
+
+    assert tx._fulfillment_messages() == expected
+
+
+def test_verify_many(tx, transfer_tx, user_pub):
+    from concurrent.futures import ThreadPoolExecutor
+    from bigchaindb.common.transaction import Transaction
+
+    unsigned_tx = Transaction.create([user_pub], [([user_pub], 1)])
+    transactions = [tx, transfer_tx, unsigned_tx, tx]
+    input_conditions = [None, tx.conditions, None, None]
+
+    assert Transaction.verify_many(transactions, input_conditions) == \
+        [True, True, False, True]
+    with ThreadPoolExecutor(2) as executor:
+        assert Transaction.verify_many(transactions, input_conditions,
+                                       executor=executor) == \
+            [True, True, False, True]
+    assert Transaction.verify_many([]) == []
+
+
+def test_verify_many_reuses_its_executor(tx):
+    from bigchaindb.common import transaction
+
+    transaction.Transaction.verify_many([tx])
+    executor = transaction._verify_executor
+    transaction.Transaction.verify_many([tx])
+    assert transaction._verify_executor is executor
+
+
+def test_verify_many_uses_a_new_executor_after_a_fork(tx, monkeypatch):
+    from bigchaindb.common import transaction
+
+    transaction.Transaction.verify_many([tx])
+    executor = transaction._verify_executor
+
+    monkeypatch.setattr(transaction, 'getpid', lambda: -1)
+    assert transaction.Transaction.verify_many([tx]) == [True]
+    assert transaction._verify_executor is not executor
+
+
+def test_verify_many_with_invalid_input_conditions(tx, transfer_tx):
+    from bigchaindb.common.transaction import Transaction
+
+    with raises(ValueError):
+        Transaction.verify_many([transfer_tx], [[]])
+
+
+def test_fulfillment_validation_uses_parse_cache(tx):
+    from bigchaindb.common.transaction import (Transaction,
+                                               _parse_fulfillment_uri)
+
+    tx = Transaction.from_dict(tx.to_dict())
+    _parse_fulfillment_uri.cache_clear()
+
+    assert tx.fulfillments_valid() is True
+    assert tx.fulfillments_valid() is True
+    cache_info = _parse_fulfillment_uri.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 1
+
+
+def test_fulfillment_from_dict_keeps_uri(tx):
+    from unittest.mock import patch
+    from cryptoconditions import Ed25519Fulfillment
+    from bigchaindb.common.transaction import Fulfillment
+
+    ffill_dict = tx.fulfillments[0].to_dict()
+    ffill = Fulfillment.from_dict(ffill_dict)
+    with patch.object(Ed25519Fulfillment, 'serialize_uri') as mock_serialize:
+        assert ffill.to_dict()['fulfillment'] == ffill_dict['fulfillment']
+    assert not mock_serialize.called
+
+
+def test_trusted_transaction_deserialization(tx):
+    from unittest.mock import patch
+    from cryptoconditions import Fulfillment as CCFulfillment
+    from bigchaindb.common.transaction import Transaction
+
+    tx_dict = tx.to_dict()
+    with patch.object(CCFulfillment, 'from_uri') as mock_from_uri, \
+            patch.object(Transaction, '_to_hash') as mock_hash:
+        trusted_tx = Transaction.from_dict(tx_dict, trusted=True)
+        assert trusted_tx.id == tx.id
+        assert trusted_tx.to_dict() == tx_dict
+    assert not mock_from_uri.called
+    assert not mock_hash.called
+
+    assert trusted_tx.fulfillments[0].fulfillment.serialize_uri() == \
+        tx_dict['fulfillments'][0]['fulfillment']
+    assert trusted_tx.fulfillments_valid() is True
+    assert trusted_tx == Transaction.from_dict(tx_dict)
+
+
+def test_trusted_transaction_deserialization_skips_id_check(tx):
+    from bigchaindb.common.transaction import Transaction
+
+    tx_dict = tx.to_dict()
+    tx_dict['id'] = 'a' * 64
+
+    assert Transaction.from_dict(tx_dict, trusted=True).id == 'a' * 64
+
+
+def test_transaction_pickling(tx, transfer_utx):
+    import pickle
+    from unittest.mock import patch
+    from bigchaindb.common.transaction import Transaction
+
+    for transaction in (tx, transfer_utx):
+        with patch.object(Transaction, 'validate_structure') as mock_validate:
+            unpickled = pickle.loads(pickle.dumps(transaction))
+        assert not mock_validate.called
+        assert unpickled.to_dict() == transaction.to_dict()
+        assert unpickled.id == transaction.id
+
+    assert not hasattr(tx, '__dict__')
+    assert not hasattr(tx.fulfillments[0], '__dict__')
+    assert not hasattr(tx.conditions[0], '__dict__')
+
+
+def test_copied_fulfillment_is_a_new_revision(user_ffill):
+    from copy import deepcopy
+
+    ffill_copy = deepcopy(user_ffill)
+    assert ffill_copy == user_ffill
+    assert ffill_copy._revision_key() != user_ffill._revision_key()
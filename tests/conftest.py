@@ -69,6 +69,21 @@ def b(request, node_config):
     return Bigchain()
 
 
+@pytest.fixture
+def forbid(monkeypatch):
+    """Return a function that makes methods fail the test when called.
+
+    It is used to check that a result is obtained without the queries or
+    computations those methods would do.
+    """
+    def forbid_methods(obj, *names):
+        for name in names:
+            def fail(*args, name=name, **kwargs):
+                raise AssertionError('`{}` should not be called'.format(name))
+            monkeypatch.setattr(obj, name, fail)
+    return forbid_methods
+
+
 @pytest.fixture
 def create_tx(b, user_pk):
     from bigchaindb.models import Transaction
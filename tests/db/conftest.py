@@ -62,6 +62,8 @@ def cleanup_tables(request, node_config):
             r.db(db_name).table('bigchain').delete().run()
             r.db(db_name).table('backlog').delete().run()
             r.db(db_name).table('votes').delete().run()
+            r.db(db_name).table('utxo').delete().run()
+            r.db(db_name).table('assets').delete().run()
         except r.ReqlOpFailedError as e:
             if e.message != 'Database `{}` does not exist.'.format(db_name):
                 raise
@@ -196,6 +196,21 @@ class TestBigchainApi(object):
         assert response['replaced'] == 0
         assert response['inserted'] == 1
 
+    def test_write_transactions_in_chunks(self, b, user_pk, monkeypatch):
+        from bigchaindb import core
+        from bigchaindb.models import Transaction
+
+        monkeypatch.setattr(core, 'WRITE_TRANSACTIONS_CHUNK_SIZE', 2)
+        txs = [Transaction.create([b.me], [([user_pk], 1)])
+               .sign([b.me_private]) for _ in range(3)]
+        responses = b.write_transactions(iter(txs))
+
+        assert [response['inserted'] for response in responses] == [2, 1]
+        assert b.backend.count_backlog() == 3
+        for tx in txs:
+            assert b.get_transaction(tx.id, include_status=True) == \
+                (tx, b.TX_IN_BACKLOG)
+
     @pytest.mark.usefixtures('inputs')
     def test_read_transaction(self, b, user_pk, user_sk):
         from bigchaindb.models import Transaction
@@ -216,6 +231,68 @@ class TestBigchainApi(object):
         assert tx.to_dict() == response.to_dict()
         assert status == b.TX_UNDECIDED
 
+    @pytest.mark.usefixtures('inputs')
+    def test_read_transaction_from_block_is_trusted(self, b, user_pk,
+                                                    monkeypatch):
+        from unittest.mock import Mock
+        from bigchaindb.models import Transaction
+
+        input_tx = b.get_owned_ids(user_pk).pop()
+        tx = b.get_transaction(input_tx.txid)
+
+        validate_schema = Mock()
+        monkeypatch.setattr('bigchaindb.models.validate_transaction_schema',
+                            validate_schema)
+        monkeypatch.setattr(Transaction, 'validate_structure', Mock())
+        response = b.get_transaction(tx.id)
+
+        assert response.to_dict() == tx.to_dict()
+        assert not validate_schema.called
+        assert not Transaction.validate_structure.called
+
+    def test_read_transaction_from_undecided_block_is_checked(self, b,
+                                                              user_pk,
+                                                              user_sk,
+                                                              monkeypatch):
+        from unittest.mock import Mock
+        from bigchaindb.common import crypto
+        from bigchaindb.models import Transaction
+
+        genesis = b.create_genesis_block()
+        tx = Transaction.create([b.me], [([user_pk], 1)])
+        tx = tx.sign([b.me_private])
+        block = b.create_block([tx])
+        b.write_block(block, durability='hard')
+        b.write_vote(b.vote(block.id, genesis.id, True))
+
+        transfer_tx = Transaction.transfer(tx.to_inputs(), [([b.me], 1)],
+                                           tx.asset)
+        transfer_tx = transfer_tx.sign([user_sk])
+        transfer_block = b.create_block([transfer_tx])
+        # another voter keeps the block undecided
+        transfer_block.voters.append(crypto.generate_key_pair()[1])
+        transfer_block = transfer_block.sign(b.me_private)
+        b.write_block(transfer_block, durability='hard')
+
+        monkeypatch.setattr(Transaction, 'validate_structure', Mock())
+
+        def read_transfer_tx():
+            Transaction.validate_structure.reset_mock()
+            assert b.get_transaction(transfer_tx.id) == transfer_tx
+            assert b.get_transactions([transfer_tx.id]) == {
+                transfer_tx.id: (transfer_tx, b.TX_UNDECIDED)}
+            assert b.get_spent(tx.id, 0) == transfer_tx
+            assert list(b.get_transactions_by_asset_id(tx.asset.data_id)) == \
+                [tx, transfer_tx]
+            return Transaction.validate_structure.call_count
+
+        # the transaction is in an undecided block, it may not be valid
+        assert read_transfer_tx() == 4
+
+        # unless this node voted the block valid
+        b.write_vote(b.vote(transfer_block.id, block.id, True))
+        assert read_transfer_tx() == 0
+
     @pytest.mark.usefixtures('inputs')
     def test_read_transaction_invalid_block(self, b, user_pk, user_sk):
         from bigchaindb.models import Transaction
@@ -404,6 +481,45 @@ class TestBigchainApi(object):
         b.write_vote(b.vote(block_3.id, b.get_last_voted_block().id, True))
         assert b.get_last_voted_block().id == block_3.id
 
+    def test_get_unvoted_blocks_from_the_checkpoint(self, b, monkeypatch):
+        from bigchaindb import core
+
+        monkeypatch.setattr('time.time', lambda: 1)
+        genesis = b.create_genesis_block()
+        blocks = []
+        # the timestamps are compared as numbers, not as strings
+        for timestamp in (8, 9, 10, 11):
+            monkeypatch.setattr('time.time', lambda: timestamp)
+            block = dummy_block()
+            b.write_block(block, durability='hard')
+            blocks.append(block)
+
+        assert [block['id'] for block in b.get_unvoted_blocks()] == \
+            [block.id for block in blocks]
+
+        b.write_vote(b.vote(blocks[0].id, genesis.id, True))
+        b.write_vote(b.vote(blocks[1].id, blocks[0].id, True))
+
+        get_unvoted_blocks = b.backend.get_unvoted_blocks
+
+        def get_recent_unvoted_blocks(node_pubkey, since):
+            return get_unvoted_blocks(node_pubkey, since=since)
+
+        # the blocks older than the checkpoint are not read
+        monkeypatch.setattr(core, 'UNVOTED_BLOCKS_CHECKPOINT_MARGIN', 1)
+        monkeypatch.setattr(b.backend, 'get_unvoted_blocks',
+                            get_recent_unvoted_blocks)
+        assert [block['id'] for block in b.get_unvoted_blocks()] == \
+            [block.id for block in blocks[2:]]
+        monkeypatch.setattr(b.backend, 'get_unvoted_blocks',
+                            get_unvoted_blocks)
+
+        # unless this node did not vote on some of them
+        monkeypatch.setattr(core, 'UNVOTED_BLOCKS_CHECKPOINT_MARGIN', 0)
+        b.write_vote(b.vote(blocks[3].id, blocks[1].id, True))
+        assert [block['id'] for block in b.get_unvoted_blocks()] == \
+            [blocks[2].id]
+
     def test_no_vote_written_if_block_already_has_vote(self, b):
         from bigchaindb.models import Block
 
@@ -546,8 +662,70 @@ class TestBigchainApi(object):
 
         assert b.backend.count_backlog() == 4
 
+    def test_get_transaction_in_a_single_query(self, b, user_pk,
+                                               forbid):
+        from bigchaindb.models import Transaction
+
+        genesis = b.create_genesis_block()
+        tx = Transaction.create([b.me], [([user_pk], 1)])
+        tx = tx.sign([b.me_private])
+        block = b.create_block([tx])
+        b.write_block(block, durability='hard')
+        b.write_vote(b.vote(block.id, genesis.id, True))
+
+        forbid(b.backend, 'get_votes_by_block_id',
+               'get_transaction_from_block',
+               'get_transaction_from_backlog')
+
+        assert b.get_transaction(tx.id, include_status=True) == (tx,
+                                                                 b.TX_VALID)
+        assert b.get_status(tx.id) == b.TX_VALID
+
+    def test_get_status_does_not_read_the_transaction(self, b, user_pk,
+                                                      forbid):
+        from bigchaindb.models import Transaction
+
+        tx = Transaction.create([b.me], [([user_pk], 1)])
+        tx = tx.sign([b.me_private])
+        b.write_transaction(tx)
+
+        forbid(b, 'get_transaction')
+        forbid(b.backend, 'get_transaction_from_backlog')
+
+        assert b.get_status(tx.id) == b.TX_IN_BACKLOG
+        assert b.get_status('nonexistent') is None
+
 
 class TestTransactionValidation(object):
+    @pytest.mark.usefixtures('inputs')
+    def test_validate_each_transaction(self, b, user_pk, user_sk):
+        from bigchaindb.common.exceptions import (InvalidSignature,
+                                                  TransactionDoesNotExist)
+        from bigchaindb.common.transaction import TransactionLink
+        from bigchaindb.models import Transaction
+
+        input_tx = b.get_owned_ids(user_pk).pop()
+        input_tx = b.get_transaction(input_tx.txid)
+        valid_tx = Transaction.transfer(input_tx.to_inputs(), [([user_pk], 1)],
+                                        input_tx.asset).sign([user_sk])
+
+        # signed with the wrong key
+        unsigned_tx = Transaction.transfer(input_tx.to_inputs(),
+                                           [([user_pk], 1)], input_tx.asset)
+        unsigned_tx = unsigned_tx.sign([b.me_private])
+
+        missing_input_tx = Transaction.transfer(input_tx.to_inputs(),
+                                                [([user_pk], 1)],
+                                                input_tx.asset)
+        missing_input_tx.fulfillments[0].tx_input = TransactionLink('c', 0)
+        missing_input_tx = missing_input_tx.sign([user_sk])
+
+        results = b.validate_each_transaction([unsigned_tx, valid_tx,
+                                               missing_input_tx])
+        assert isinstance(results[0], InvalidSignature)
+        assert results[1] == valid_tx
+        assert isinstance(results[2], TransactionDoesNotExist)
+
     def test_create_operation_with_inputs(self, b, user_pk, create_tx):
         from bigchaindb.common.transaction import TransactionLink
 
@@ -996,6 +1174,132 @@ class TestMultipleInputs(object):
         assert owned_inputs_user1 == owned_inputs_user2
         assert owned_inputs_user1 == []
 
+    def test_get_owned_ids_checks_spent_inputs_at_once(self, b, user_sk,
+                                                       user_pk, forbid):
+        from bigchaindb.common.transaction import TransactionLink
+        from bigchaindb.models import Transaction
+
+        genesis = b.create_genesis_block()
+
+        tx = Transaction.create([b.me], [([user_pk], 1), ([user_pk], 1)])
+        tx = tx.sign([b.me_private])
+        block = b.create_block([tx])
+        b.write_block(block, durability='hard')
+        b.write_vote(b.vote(block.id, genesis.id, True))
+
+        transfer_tx = Transaction.transfer(tx.to_inputs()[:1],
+                                           [([b.me], 1)], tx.asset)
+        transfer_tx = transfer_tx.sign([user_sk])
+        block = b.create_block([transfer_tx])
+        b.write_block(block, durability='hard')
+
+        forbid(b, 'get_spent', 'get_blocks_status_containing_tx')
+        forbid(b.backend, 'get_votes_by_block_id')
+
+        assert b.get_owned_ids(user_pk) == [TransactionLink(tx.id, 1)]
+        assert b.get_spent_many([(tx.id, 0), (tx.id, 1)]) == {
+            (tx.id, 0): transfer_tx,
+            (tx.id, 1): None,
+        }
+
+    def test_validate_transfer_with_unspent_outputs(self, b, user_pk,
+                                                    user_sk, forbid):
+        from bigchaindb.models import Transaction
+
+        genesis = b.create_genesis_block()
+        tx = Transaction.create([b.me], [([user_pk], 1)])
+        tx = tx.sign([b.me_private])
+        block = b.create_block([tx])
+        b.write_block(block, durability='hard')
+        b.write_vote(b.vote(block.id, genesis.id, True))
+        b.update_outputs(block.id, b.BLOCK_VALID)
+
+        transfer_tx = Transaction.transfer(tx.to_inputs(), [([b.me], 1)],
+                                           tx.asset)
+        transfer_tx = transfer_tx.sign([user_sk])
+
+        forbid(b, 'get_transaction', 'get_spent', 'get_spent_many')
+        assert transfer_tx.validate(b) == transfer_tx
+
+    def test_validate_transfer_with_spend_recorded_first(self, b, user_pk,
+                                                         user_sk):
+        from bigchaindb.common.exceptions import DoubleSpend
+        from bigchaindb.models import Transaction
+
+        genesis = b.create_genesis_block()
+        tx = Transaction.create([b.me], [([user_pk], 1)])
+        tx = tx.sign([b.me_private])
+        block = b.create_block([tx])
+        b.backend.write_block(block.to_str(), durability='hard')
+        b.write_vote(b.vote(block.id, genesis.id, True))
+
+        # the spend is recorded before the output itself
+        transfer_tx = Transaction.transfer(tx.to_inputs(), [([b.me], 1)],
+                                           tx.asset)
+        transfer_tx = transfer_tx.sign([user_sk])
+        b.write_block(b.create_block([transfer_tx]), durability='hard')
+        b.write_block_outputs(block.to_dict(), durability='hard')
+        b.update_outputs(block.id, b.BLOCK_VALID)
+
+        double_spend_tx = Transaction.transfer(tx.to_inputs(),
+                                               [([user_pk], 1)], tx.asset)
+        double_spend_tx = double_spend_tx.sign([user_sk])
+
+        assert b.get_owned_ids(user_pk) == []
+        with pytest.raises(DoubleSpend):
+            double_spend_tx.validate(b)
+
+    def test_validate_transfers_resolves_inputs_in_bulk(self, b, user_pk,
+                                                        user_sk,
+                                                        monkeypatch, forbid):
+        from collections import Counter
+        from bigchaindb.common.exceptions import TransactionNotInValidBlock
+        from bigchaindb.models import Transaction
+
+        genesis = b.create_genesis_block()
+        txs = [Transaction.create([b.me], [([user_pk], 1)])
+               .sign([b.me_private]) for _ in range(3)]
+        block = b.create_block(txs)
+        b.write_block(block, durability='hard')
+        b.write_vote(b.vote(block.id, genesis.id, True))
+
+        # an input in an undecided block can't be spent
+        undecided_tx = Transaction.create([b.me], [([user_pk], 1)])
+        undecided_tx = undecided_tx.sign([b.me_private])
+        b.write_block(b.create_block([undecided_tx]), durability='hard')
+
+        transfer_txs = [Transaction.transfer(tx.to_inputs(), [([b.me], 1)],
+                                             tx.asset).sign([user_sk])
+                        for tx in txs]
+
+        forbid(b, 'get_transaction', 'get_spent', 'get_asset_by_id')
+
+        calls = Counter()
+
+        def count(name):
+            method = getattr(b.backend, name)
+
+            def counted(*args, **kwargs):
+                calls[name] += 1
+                return method(*args, **kwargs)
+            monkeypatch.setattr(b.backend, name, counted)
+
+        names = ('get_outputs', 'get_blocks_status_from_transactions',
+                 'get_spent_many', 'get_asset_definitions')
+        for name in names:
+            count(name)
+
+        assert b.validate_transactions(transfer_txs) == transfer_txs
+        assert calls == Counter(names)
+
+        calls.clear()
+        transfer_tx = Transaction.transfer(undecided_tx.to_inputs(),
+                                           [([b.me], 1)], undecided_tx.asset)
+        transfer_tx = transfer_tx.sign([user_sk])
+        with pytest.raises(TransactionNotInValidBlock):
+            b.validate_transactions(transfer_txs + [transfer_tx])
+        assert calls == Counter(names)
+
     def test_get_spent_single_tx_single_output(self, b, user_sk, user_pk):
         from bigchaindb.common import crypto
         from bigchaindb.models import Transaction
@@ -1066,6 +1370,30 @@ class TestMultipleInputs(object):
         # Now there should be no spents (the block is invalid)
         assert spent_inputs_user1 is None
 
+    def test_get_spent_resolves_block_status_with_the_query(self, b, user_sk,
+                                                            user_pk,
+                                                            forbid):
+        from bigchaindb.models import Transaction
+
+        genesis = b.create_genesis_block()
+
+        tx = Transaction.create([b.me], [([user_pk], 1)])
+        tx = tx.sign([b.me_private])
+        block = b.create_block([tx])
+        b.write_block(block, durability='hard')
+        b.write_vote(b.vote(block.id, genesis.id, True))
+
+        transfer_tx = Transaction.transfer(tx.to_inputs(), [([b.me], 1)],
+                                           tx.asset)
+        transfer_tx = transfer_tx.sign([user_sk])
+        block = b.create_block([transfer_tx])
+        b.write_block(block, durability='hard')
+
+        forbid(b, 'get_transaction')
+        forbid(b.backend, 'get_votes_by_block_id')
+
+        assert b.get_spent(tx.id, 0) == transfer_tx
+
     def test_get_spent_single_tx_multiple_outputs(self, b, user_sk, user_pk):
         from bigchaindb.common import crypto
         from bigchaindb.models import Transaction
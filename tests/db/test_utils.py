@@ -29,12 +29,17 @@ def test_init_creates_db_tables_and_indexes():
 
     assert r.db(dbname).table_list().contains('backlog', 'bigchain').run(conn) is True
 
+    assert r.db(dbname).table_list().contains('utxo', 'assets').run(conn) is True
+
     assert r.db(dbname).table('bigchain').index_list().contains(
-        'block_timestamp').run(conn) is True
+        'block_timestamp', 'block_timestamp_number').run(conn) is True
 
     assert r.db(dbname).table('backlog').index_list().contains(
         'assignee__transaction_timestamp').run(conn) is True
 
+    assert r.db(dbname).table('backlog').index_list().contains(
+        'assignment_timestamp').run(conn) is True
+
 
 def test_create_database():
     conn = utils.get_conn()
@@ -74,9 +79,13 @@ def test_create_bigchain_secondary_index():
     utils.create_bigchain_secondary_index(conn, dbname)
 
     assert r.db(dbname).table('bigchain').index_list().contains(
-        'block_timestamp').run(conn) is True
+        'block_timestamp', 'block_timestamp_number').run(conn) is True
     assert r.db(dbname).table('bigchain').index_list().contains(
         'transaction_id').run(conn) is True
+    assert r.db(dbname).table('bigchain').index_list().contains(
+        'inputs').run(conn) is True
+    assert r.db(dbname).table('bigchain').index_list().contains(
+        'block_operation').run(conn) is True
 
 
 def test_create_backlog_table():
@@ -108,6 +117,9 @@ def test_create_backlog_secondary_index():
     assert r.db(dbname).table('backlog').index_list().contains(
         'assignee__transaction_timestamp').run(conn) is True
 
+    assert r.db(dbname).table('backlog').index_list().contains(
+        'assignment_timestamp').run(conn) is True
+
 
 def test_create_votes_table():
     conn = utils.get_conn()
@@ -138,6 +150,60 @@ def test_create_votes_secondary_index():
     assert r.db(dbname).table('votes').index_list().contains(
         'block_and_voter').run(conn) is True
 
+    assert r.db(dbname).table('votes').index_list().contains(
+        'node_pubkey__timestamp').run(conn) is True
+
+
+def test_create_utxo_secondary_index():
+    conn = utils.get_conn()
+    dbname = utils.get_database_name()
+
+    # The db is set up by fixtures so we need to remove it
+    # and recreate it just with one table
+    r.db_drop(dbname).run(conn)
+    utils.create_database(conn, dbname)
+    utils.create_table(conn, dbname, 'utxo')
+    utils.create_utxo_secondary_index(conn, dbname)
+
+    assert r.db(dbname).table('utxo').index_list().contains(
+        'owners_after', 'block_id', 'spent_by_block_id').run(conn) is True
+
+
+def test_upgrade_creates_missing_tables_and_indexes(b, user_pk):
+    from bigchaindb.models import Transaction
+
+    conn = utils.get_conn()
+    dbname = utils.get_database_name()
+
+    genesis = b.create_genesis_block()
+    tx = Transaction.create([b.me], [([user_pk], 1)])
+    tx = tx.sign([b.me_private])
+    block = b.create_block([tx])
+    b.write_block(block, durability='hard')
+    b.write_vote(b.vote(block.id, genesis.id, True))
+
+    # a database created before the utxo and assets tables were added
+    r.db(dbname).table_drop('utxo').run(conn)
+    r.db(dbname).table_drop('assets').run(conn)
+    r.db(dbname).table('bigchain').index_drop('inputs').run(conn)
+
+    utils.upgrade()
+
+    assert r.db(dbname).table_list().contains('utxo', 'assets').run(conn) is True
+    assert r.db(dbname).table('bigchain').index_list().contains(
+        'inputs').run(conn) is True
+    assert r.db(dbname).table('utxo').index_list().contains(
+        'owners_after', 'block_id', 'spent_by_block_id').run(conn) is True
+
+    [output] = b.backend.get_outputs([[tx.id, 0]])
+    assert output['block'] == {'id': block.id, 'voters': block.voters,
+                               'valid': True}
+    [asset] = b.backend.get_asset_definitions([tx.asset.data_id])
+    assert asset == tx.asset.to_dict()
+
+    # upgrading an up to date database does nothing
+    utils.upgrade()
+
 
 def test_init_fails_if_db_exists():
     conn = utils.get_conn()
@@ -99,6 +99,157 @@ def test_check_for_quorum_valid(b, user_pk):
     assert e.check_for_quorum(votes[-1]) is None
 
 
+def test_check_for_quorum_updates_outputs(b, user_pk, user_sk):
+    from bigchaindb.common.transaction import TransactionLink
+    from bigchaindb.models import Transaction
+
+    e = election.Election()
+    genesis = b.create_genesis_block()
+
+    tx = Transaction.create([b.me], [([user_pk], 1)])
+    tx = tx.sign([b.me_private])
+    block = b.create_block([tx])
+    b.write_block(block)
+
+    # the block is undecided, its outputs are not valid yet
+    [output] = b.backend.get_outputs([[tx.id, 0]])
+    assert output['block']['valid'] is False
+    assert b.get_outputs([TransactionLink(tx.id, 0)]) == {}
+
+    vote = b.vote(block.id, genesis.id, True)
+    b.write_vote(vote)
+    assert e.check_for_quorum(vote) is None
+
+    [output] = b.backend.get_outputs([[tx.id, 0]])
+    assert output['block']['valid'] is True
+
+    # an invalid block does not spend the output
+    transfer_tx = Transaction.transfer(tx.to_inputs(), [([b.me], 1)],
+                                       tx.asset)
+    transfer_tx = transfer_tx.sign([user_sk])
+    invalid_block = b.create_block([transfer_tx])
+    b.write_block(invalid_block)
+    assert b.get_owned_ids(user_pk) == []
+
+    vote = b.vote(invalid_block.id, block.id, False)
+    b.write_vote(vote)
+    assert e.check_for_quorum(vote) == invalid_block
+
+    [output] = b.backend.get_outputs([[transfer_tx.id, 0]])
+    assert output['block']['invalid'] is True
+    [output] = b.backend.get_outputs([[tx.id, 0]])
+    assert output['spent_by'] == []
+    assert b.get_owned_ids(user_pk) == [TransactionLink(tx.id, 0)]
+
+    # a valid block spends it, for good
+    transfer_block = b.create_block([transfer_tx])
+    b.write_block(transfer_block)
+
+    vote = b.vote(transfer_block.id, invalid_block.id, True)
+    b.write_vote(vote)
+    assert e.check_for_quorum(vote) is None
+
+    [output] = b.backend.get_outputs([[tx.id, 0]])
+    assert output['spent'] is True
+    assert b.get_owned_ids(user_pk) == []
+    assert b.get_owned_ids(b.me) == [TransactionLink(transfer_tx.id, 0)]
+
+    # writing the outputs of the first block again leaves them spent
+    b.write_block_outputs(block.to_dict())
+    [output] = b.backend.get_outputs([[tx.id, 0]])
+    assert output['spent'] is True
+    assert b.get_owned_ids(user_pk) == []
+
+
+def test_check_for_quorum_tallies_votes_incrementally(b, user_pk,
+                                                      monkeypatch, forbid):
+    from bigchaindb.models import Transaction
+
+    e = election.Election()
+
+    tx1 = Transaction.create([b.me], [([user_pk], 1)])
+    test_block = b.create_block([tx1])
+
+    key_pairs = [crypto.generate_key_pair() for _ in range(4)]
+    test_federation = [Bigchain(public_key=key_pair[1],
+                                private_key=key_pair[0])
+                       for key_pair in key_pairs]
+
+    test_block.voters = [key_pair[1] for key_pair in key_pairs]
+    test_block = test_block.sign(b.me_private)
+    b.write_block(test_block)
+
+    votes = [member.vote(test_block.id, 'abc', True)
+             for member in test_federation[:2]] + \
+            [member.vote(test_block.id, 'abc', False)
+             for member in test_federation[2:]]
+
+    # the first vote reads the voters and the votes once
+    b.write_vote(votes[0])
+    assert e.check_for_quorum(votes[0]) is None
+    assert test_block.id in e.tallies
+
+    get_block = e.bigchain.get_block
+    forbid(e.bigchain, 'get_block_voters', 'get_votes', 'get_block')
+    for vote in votes[1:3]:
+        b.write_vote(vote)
+        assert e.check_for_quorum(vote) is None
+
+    # the full block is only read once it is decided invalid
+    monkeypatch.setattr(e.bigchain, 'get_block', get_block)
+    b.write_vote(votes[3])
+    assert e.check_for_quorum(votes[3]) == test_block
+    assert test_block.id not in e.tallies
+
+    # the votes received after the decision are ignored
+    assert e.check_for_quorum(votes[3]) is None
+
+
+def test_check_for_quorum_bounds_tallies(b, user_pk, monkeypatch):
+    from bigchaindb.models import Transaction
+
+    monkeypatch.setattr(election, 'DECIDED_BLOCKS_CACHE_SIZE', 1)
+    e = election.Election()
+
+    key_pairs = [crypto.generate_key_pair() for _ in range(4)]
+    test_federation = [Bigchain(public_key=key_pair[1],
+                                private_key=key_pair[0])
+                       for key_pair in key_pairs]
+
+    blocks = []
+    for _ in range(2):
+        tx = Transaction.create([b.me], [([user_pk], 1)])
+        block = b.create_block([tx])
+        block.voters = [key_pair[1] for key_pair in key_pairs]
+        block = block.sign(b.me_private)
+        b.write_block(block)
+        blocks.append(block)
+
+    for block in blocks:
+        vote = test_federation[0].vote(block.id, 'abc', False)
+        b.write_vote(vote)
+        assert e.check_for_quorum(vote) is None
+
+    # the tally of the first block was left out
+    assert list(e.tallies) == [blocks[1].id]
+
+    # and is read again on the next vote
+    vote = test_federation[1].vote(blocks[0].id, 'abc', False)
+    b.write_vote(vote)
+    assert e.check_for_quorum(vote) == blocks[0]
+    assert list(e.tallies) == [blocks[1].id]
+
+
+def test_check_for_quorum_skips_votes_on_unknown_blocks(b):
+    e = election.Election()
+
+    vote = b.vote('an unknown block id', 'abc', True)
+    b.write_vote(vote)
+
+    assert e.check_for_quorum(vote) is None
+    assert e.tallies == {}
+
+
 def test_check_requeue_transaction(b, user_pk):
     from bigchaindb.models import Transaction
 
@@ -116,6 +267,43 @@ def test_check_requeue_transaction(b, user_pk):
     assert backlog_tx == tx1
 
 
+def test_check_for_quorum_late_vote_does_not_requeue_again(b, user_pk,
+                                                           forbid):
+    from bigchaindb.models import Transaction
+
+    e = election.Election()
+
+    tx1 = Transaction.create([b.me], [([user_pk], 1)])
+    tx1 = tx1.sign([b.me_private])
+    test_block = b.create_block([tx1])
+
+    key_pairs = [crypto.generate_key_pair() for _ in range(3)]
+    test_federation = [Bigchain(public_key=key_pair[1],
+                                private_key=key_pair[0])
+                       for key_pair in key_pairs]
+
+    test_block.voters = [key_pair[1] for key_pair in key_pairs]
+    test_block = test_block.sign(b.me_private)
+    b.write_block(test_block)
+
+    votes = [member.vote(test_block.id, 'abc', False)
+             for member in test_federation]
+    for vote in votes[:2]:
+        b.write_vote(vote)
+    assert e.check_for_quorum(votes[1]) == test_block
+    e.requeue_transactions(test_block)
+    assert b.get_transaction(tx1.id, include_status=True)[1] == \
+        b.TX_IN_BACKLOG
+
+    # a late vote, once the status of the block is not remembered anymore
+    e.bigchain.decided_blocks.clear()
+    b.write_vote(votes[2])
+    assert e.check_for_quorum(votes[2]) == test_block
+
+    # the transaction is already back in the backlog
+    forbid(e.bigchain, 'write_transaction')
+    e.requeue_transactions(test_block)
+
 
 @patch.object(Pipeline, 'start')
 def test_start(mock_start):
@@ -16,10 +16,33 @@ def test_get_stale(b, user_pk):
                                         backlog_reassign_delay=0.001)
     tx_stale = stm.check_transactions()
 
-    for _tx in tx_stale:
-        _tx.pop('assignee')
-        _tx.pop('assignment_timestamp')
-        assert tx.to_dict() == _tx
+    for _txs in tx_stale:
+        for _tx in _txs:
+            _tx.pop('assignee')
+            _tx.pop('assignment_timestamp')
+            assert tx.to_dict() == _tx
+
+
+def test_get_stale_in_chunks(b, user_pk, monkeypatch):
+    from bigchaindb.models import Transaction
+    monkeypatch.setattr(stale, 'STALE_TRANSACTIONS_CHUNK_SIZE', 2)
+    for _ in range(3):
+        tx = Transaction.create([b.me], [([user_pk], 1)])
+        tx = tx.sign([b.me_private])
+        b.write_transaction(tx, durability='hard')
+
+    stm = stale.StaleTransactionMonitor(timeout=0.001,
+                                        backlog_reassign_delay=0.001)
+    txs = list(stm.check_transactions())
+    assert [len(chunk) for chunk in txs] == [2, 1]
+
+    stm.bigchain.nodes_except_me = ['aaa', 'bbb']
+    stm.reassign_transactions(txs[0])
+    reassigned = {tx['id']: tx for tx in b.backend.get_stale_transactions(0)}
+    for tx in txs[0]:
+        assert (reassigned[tx['id']]['assignment_timestamp'] >
+                tx['assignment_timestamp'])
+        assert reassigned[tx['id']]['assignee'] != tx['assignee']
 
 
 def test_reassign_transactions(b, user_pk):
@@ -31,7 +54,7 @@ def test_reassign_transactions(b, user_pk):
 
     stm = stale.StaleTransactionMonitor(timeout=0.001,
                                         backlog_reassign_delay=0.001)
-    stm.reassign_transactions(tx.to_dict())
+    stm.reassign_transactions([tx.to_dict()])
 
     # test with federation
     tx = Transaction.create([b.me], [([user_pk], 1)])
@@ -42,7 +65,7 @@ def test_reassign_transactions(b, user_pk):
                                         backlog_reassign_delay=0.001)
     stm.bigchain.nodes_except_me = ['aaa', 'bbb', 'ccc']
     tx = list(b.backend.get_stale_transactions(0))[0]
-    stm.reassign_transactions(tx)
+    stm.reassign_transactions([tx])
 
     reassigned_tx = list(b.backend.get_stale_transactions(0))[0]
     assert reassigned_tx['assignment_timestamp'] > tx['assignment_timestamp']
@@ -56,7 +79,7 @@ def test_reassign_transactions(b, user_pk):
     stm.bigchain.nodes_except_me = None
 
     tx = list(b.backend.get_stale_transactions(0))[0]
-    stm.reassign_transactions(tx)
+    stm.reassign_transactions([tx])
     assert tx['assignee'] != 'lol'
 
 
@@ -105,9 +128,8 @@ def test_full_pipeline(monkeypatch, user_pk):
     pipeline.setup(indata=inpipe, outdata=outpipe)
     pipeline.start()
 
-    # to terminate
-    for _ in range(100):
-        outpipe.get()
+    # to terminate: the stale transactions are reassigned in one chunk
+    assert len(outpipe.get()) == 100
 
     pipeline.terminate()
 
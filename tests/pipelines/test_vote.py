@@ -91,6 +91,40 @@ def test_vote_validate_block(b):
         assert tx1 == tx2
 
 
+def test_vote_validate_block_writes_outputs(b, user_pk, user_sk):
+    from bigchaindb.common.transaction import TransactionLink
+    from bigchaindb.models import Transaction
+    from bigchaindb.pipelines import vote
+
+    genesis = b.create_genesis_block()
+    tx = Transaction.create([b.me], [([user_pk], 1)])
+    tx = tx.sign([b.me_private])
+    block = b.create_block([tx])
+    b.write_block(block)
+    b.write_vote(b.vote(block.id, genesis.id, True))
+
+    # a block written by another node, the utxo table doesn't know it yet
+    transfer_tx = Transaction.transfer(tx.to_inputs(), [([b.me], 1)],
+                                       tx.asset)
+    transfer_tx = transfer_tx.sign([user_sk])
+    transfer_block = b.create_block([transfer_tx])
+    b.backend.write_block(transfer_block.to_str())
+    assert list(b.backend.get_outputs([[transfer_tx.id, 0]])) == []
+
+    vote_obj = vote.Vote()
+    assert vote_obj.validate_block(transfer_block.to_dict()) == (
+        transfer_block.id, transfer_block.transactions)
+
+    # the outputs are recorded before its transactions are validated
+    outputs = b.get_outputs([TransactionLink(tx.id, 0)])
+    assert outputs[(tx.id, 0)]['spent_by'] == [transfer_tx.id]
+    [output] = b.backend.get_outputs([[transfer_tx.id, 0]])
+    assert output['block'] == {'id': transfer_block.id,
+                               'voters': transfer_block.voters,
+                               'valid': False}
+    assert b.get_owned_ids(user_pk) == []
+
+
 def test_validate_block_with_invalid_id(b):
     from bigchaindb.pipelines import vote
 
@@ -119,6 +153,23 @@ def test_validate_block_with_invalid_signature(b):
     assert invalid_dummy_tx == [vote_obj.invalid_dummy_tx]
 
 
+def test_vote_validate_block_in_parallel(b, monkeypatch):
+    import bigchaindb
+    from bigchaindb.pipelines import vote
+
+    monkeypatch.setitem(bigchaindb.config, 'block_deserialization',
+                        {'workers': 2, 'executor': 'thread'})
+
+    b.create_genesis_block()
+    block = dummy_block(b)
+
+    vote_obj = vote.Vote()
+    assert vote_obj.get_executor() is vote_obj.get_executor()
+    validation = vote_obj.validate_block(block.to_dict())
+    assert validation[0] == block.id
+    assert validation[1] == block.transactions
+
+
 def test_vote_validate_transaction(b):
     from bigchaindb.pipelines import vote
     from bigchaindb.models import Transaction
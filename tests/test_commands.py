@@ -28,6 +28,7 @@ def mock_db_init_with_existing_db(monkeypatch):
         raise DatabaseAlreadyExists
 
     monkeypatch.setattr(db, 'init', mockreturn)
+    monkeypatch.setattr(db, 'upgrade', lambda: None)
 
 
 @pytest.fixture
@@ -129,6 +130,18 @@ def test_bigchain_run_start(mock_run_configure, mock_processes_start, mock_db_in
     run_start(args)
 
 
+def test_bigchain_run_start_upgrades_existing_db(mock_run_configure, mock_processes_start,
+                                                 mock_db_init_with_existing_db, monkeypatch):
+    from bigchaindb import db
+    from bigchaindb.commands.bigchain import run_start
+    mock_upgrade = Mock()
+    monkeypatch.setattr(db, 'upgrade', mock_upgrade)
+    args = Namespace(start_rethinkdb=False, allow_temp_keypair=False, config=None, yes=True)
+    run_start(args)
+
+    mock_upgrade.assert_called_once_with()
+
+
 @patch('bigchaindb.commands.utils.start_rethinkdb', return_value=Mock())
 def test_bigchain_run_start_with_rethinkdb(mock_start_rethinkdb,
                                            mock_run_configure,
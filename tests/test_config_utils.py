@@ -135,6 +135,9 @@ def test_autoconfigure_read_both_from_file_and_env(monkeypatch):
             'bind': '1.2.3.4:56',
             'workers': None,
             'threads': None,
+            'mode': 'sync',
+            'max_batch_size': 1000,
+            'validation_workers': 1,
         },
         'database': {
             'host': 'test-host',
@@ -152,7 +155,11 @@ def test_autoconfigure_read_both_from_file_and_env(monkeypatch):
             'rate': 0.01,
         },
         'api_endpoint': 'api://ipa',
-        'backlog_reassign_delay': 5
+        'backlog_reassign_delay': 5,
+        'block_deserialization': {
+            'workers': 1,
+            'executor': 'process',
+        },
     }
 
 
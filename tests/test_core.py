@@ -64,13 +64,15 @@ def test_bigchain_class_initialization_with_parameters(config):
 def test_get_blocks_status_containing_tx(monkeypatch):
     from bigchaindb.db.backends.rethinkdb import RethinkDBBackend
     from bigchaindb.core import Bigchain
+    from bigchaindb.common.exceptions import DoubleSpend
     blocks = [
-        {'id': 1}, {'id': 2}
+        {'id': 1, 'voters': [], 'votes': []},
+        {'id': 2, 'voters': [], 'votes': []},
     ]
-    monkeypatch.setattr(RethinkDBBackend, 'get_blocks_status_from_transaction', lambda x: blocks)
-    monkeypatch.setattr(Bigchain, 'block_election_status', lambda x, y, z: Bigchain.BLOCK_VALID)
+    monkeypatch.setattr(RethinkDBBackend, 'get_blocks_status_from_transaction', lambda x, y: blocks)
+    monkeypatch.setattr(Bigchain, 'block_election_status', lambda x, y, z, votes: Bigchain.BLOCK_VALID)
     bigchain = Bigchain(public_key='pubkey', private_key='privkey')
-    with pytest.raises(Exception):
+    with pytest.raises(DoubleSpend):
         bigchain.get_blocks_status_containing_tx('txid')
 
 
@@ -90,3 +92,38 @@ def test_transaction_exists(monkeypatch, count, exists):
     monkeypatch.setattr(RqlQuery, 'run', lambda x, y: count)
     bigchain = Bigchain(public_key='pubkey', private_key='privkey')
     assert bigchain.transaction_exists('txid') is exists
+
+
+def test_block_election_status_remembers_decided_blocks(monkeypatch, forbid):
+    from bigchaindb.db.backends.rethinkdb import RethinkDBBackend
+    from bigchaindb.core import Bigchain
+    monkeypatch.setattr(Bigchain, '_tally_votes',
+                        lambda x, y, z, votes: Bigchain.BLOCK_INVALID)
+    bigchain = Bigchain(public_key='pubkey', private_key='privkey')
+    assert bigchain.block_election_status('id', [], []) == 'invalid'
+
+    forbid(RethinkDBBackend, 'get_votes_by_block_id')
+    forbid(Bigchain, '_tally_votes')
+    assert bigchain.block_election_status('id', []) == 'invalid'
+
+
+def test_block_election_status_does_not_remember_undecided_blocks(
+        monkeypatch):
+    from bigchaindb.core import Bigchain
+    monkeypatch.setattr(Bigchain, '_tally_votes',
+                        lambda x, y, z, votes: Bigchain.BLOCK_UNDECIDED)
+    bigchain = Bigchain(public_key='pubkey', private_key='privkey')
+    assert bigchain.block_election_status('id', [], []) == 'undecided'
+    assert 'id' not in bigchain.decided_blocks
+
+
+def test_write_transactions_passes_the_durability(monkeypatch):
+    from bigchaindb.db.backends.rethinkdb import RethinkDBBackend
+    from bigchaindb.core import Bigchain
+    writes = []
+    monkeypatch.setattr(RethinkDBBackend, 'write_transactions',
+                        lambda x, chunk, durability: writes.append(durability))
+    monkeypatch.setattr(Bigchain, 'assign_transaction', lambda x, tx: tx)
+    bigchain = Bigchain(public_key='pubkey', private_key='privkey')
+    bigchain.write_transactions(['tx'], durability='hard')
+    assert writes == ['hard']
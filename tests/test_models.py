@@ -1,3 +1,4 @@
+import pytest
 from pytest import raises
 
 
@@ -16,6 +17,18 @@ class TestTransactionModel(object):
         with raises(ValueError):
             tx.validate(b)
 
+    def test_validate_many(self, b):
+        from bigchaindb.common.exceptions import InvalidSignature
+        from bigchaindb.models import Transaction
+
+        signed_tx = Transaction.create([b.me], [([b.me], 1)])
+        signed_tx = signed_tx.sign([b.me_private])
+        unsigned_tx = Transaction.create([b.me], [([b.me], 1)])
+
+        assert Transaction.validate_many(b, [signed_tx]) == [signed_tx]
+        with raises(InvalidSignature):
+            Transaction.validate_many(b, [signed_tx, unsigned_tx])
+
 
 class TestBlockModel(object):
     def test_block_initialization(self, monkeypatch):
@@ -176,3 +189,122 @@ class TestBlockModel(object):
         monkeypatch.setattr(b, 'has_previous_vote', has_previous_vote)
         assert block == block.validate(b)
         assert has_previous_vote.called is True
+
+    def test_validate_block_with_invalid_transaction(self, b):
+        from bigchaindb.common.exceptions import InvalidSignature
+        from bigchaindb.models import Transaction
+
+        tx = Transaction.create([b.me], [([b.me], 1)])
+        block = b.create_block([tx])
+
+        with raises(InvalidSignature):
+            block.validate(b)
+
+    def test_block_serialization_is_cached(self, b):
+        from bigchaindb.common.util import serialize
+        from bigchaindb.models import Block, Transaction
+
+        tx = Transaction.create([b.me], [([b.me], 1)])
+        block = Block([tx], b.me, voters=['Qaaa'])
+        canonical = block._canonical()
+
+        assert block.id == canonical['id']
+        assert block._canonical() is canonical
+        assert block.to_str() == serialize(block.to_dict())
+
+        block.sign(b.me_private)
+        assert block._canonical() is canonical
+        assert block.to_str() == serialize(block.to_dict())
+
+    def test_block_cache_invalidation(self, b):
+        from bigchaindb.common.crypto import hash_data
+        from bigchaindb.common.util import serialize
+        from bigchaindb.models import Block, Transaction
+
+        def expected_id(block):
+            return hash_data(serialize(block.to_dict()['block']))
+
+        tx = Transaction.create([b.me], [([b.me], 1)])
+        block = Block([tx], b.me, voters=['Qaaa'])
+        block_id = block.id
+
+        block.voters.append('Qbbb')
+        assert block.id != block_id
+        assert block.id == expected_id(block)
+
+        block_id = block.id
+        block.transactions.append(Transaction.create([b.me], [([b.me], 1)]))
+        assert block.id != block_id
+        assert block.id == expected_id(block)
+
+        block_id = block.id
+        tx.sign([b.me_private])
+        assert block.id != block_id
+        assert block.id == expected_id(block)
+
+    def test_block_deserialization_keeps_serialization(self, b):
+        from bigchaindb.models import Block, Transaction
+
+        tx = Transaction.create([b.me], [([b.me], 1)])
+        block = Block([tx], b.me, voters=['Qaaa']).sign(b.me_private)
+
+        deserialized = Block.from_dict(block.to_dict())
+        assert deserialized._canonical() == {
+            'key': deserialized._revision_key(),
+            'serialized': block._canonical()['serialized'],
+            'id': block.id,
+            'verified_signature': block.signature,
+        }
+        assert deserialized.is_signature_valid()
+
+        deserialized.signature = None
+        assert not deserialized.is_signature_valid()
+
+    def test_block_pickling_drops_cache(self, b):
+        import pickle
+        from bigchaindb.models import Block, Transaction
+
+        tx = Transaction.create([b.me], [([b.me], 1)])
+        block = Block([tx], b.me, voters=['Qaaa']).sign(b.me_private)
+        block_id = block.id
+
+        unpickled = pickle.loads(pickle.dumps(block))
+        assert unpickled._cache == {}
+        assert unpickled.id == block_id
+        assert unpickled == block
+
+    @pytest.mark.parametrize('executor_class', [
+        'ThreadPoolExecutor',
+        'ProcessPoolExecutor',
+    ])
+    def test_block_parallel_deserialization(self, b, executor_class):
+        import concurrent.futures
+        from bigchaindb.common.crypto import hash_data, PrivateKey
+        from bigchaindb.common.exceptions import (InvalidSignature,
+                                                  SchemaValidationError)
+        from bigchaindb.common.util import serialize
+        from bigchaindb.models import Block, Transaction
+
+        transactions = [Transaction.create([b.me], [([b.me], 1)])
+                        .sign([b.me_private]) for _ in range(5)]
+        block = Block(transactions, b.me, voters=['Qaaa']).sign(b.me_private)
+        block_body = block.to_dict()
+
+        executor_class = getattr(concurrent.futures, executor_class)
+        with executor_class(2) as executor:
+            deserialized = Block.from_dict(block_body, executor=executor,
+                                           chunk_size=2)
+            assert deserialized == block
+            assert deserialized.transactions == transactions
+
+            block_body['block']['transactions'][3]['operation'] = 'invalid'
+            block_serialized = serialize(block_body['block'])
+            block_body['id'] = hash_data(block_serialized)
+            block_body['signature'] = PrivateKey(b.me_private)\
+                .sign(block_serialized.encode()).decode()
+            with raises(SchemaValidationError):
+                Block.from_dict(block_body, executor=executor, chunk_size=2)
+
+            block_body['signature'] = 'an invalid signature'
+            with raises(InvalidSignature):
+                Block.from_dict(block_body, executor=executor, chunk_size=2)
@@ -1,3 +1,4 @@
+import asyncio
 from threading import Thread
 import pytest
 
@@ -103,3 +104,53 @@ def test_changefeed_reconnects_when_connection_lost(monkeypatch):
 
     fact = changefeed.outqueue.get()['fact']
     assert fact == 'Cats sleep 70% of their lives.'
+
+
+# the asyncio mode is written with generator-based coroutines, to run on
+# Python 3.4, and these were removed from Python 3.11
+@pytest.mark.skipif(not hasattr(asyncio, 'coroutine'),
+                    reason='requires generator-based coroutines')
+def test_async_connection_runs_queries_on_a_pool():
+    from bigchaindb.db.async_utils import AsyncConnection
+
+    conn = AsyncConnection(size=2)
+    loop = asyncio.get_event_loop()
+
+    assert loop.run_until_complete(conn.run(r.expr('1'))) == '1'
+
+    # cursors are read to the end
+    query = r.range(3).map(lambda i: i * 2)
+    results = loop.run_until_complete(asyncio.gather(
+        *[conn.run(query) for _ in range(4)]))
+    assert results == [[0, 2, 4]] * 4
+
+    # the queries shared the two connections
+    assert conn.conns.qsize() == 2
+    conns = [conn.conns.get_nowait() for _ in range(2)]
+    assert all(c is not None and c.is_open() for c in conns)
+
+
+@pytest.mark.skipif(not hasattr(asyncio, 'coroutine'),
+                    reason='requires generator-based coroutines')
+def test_async_connection_replaces_broken_connections():
+    from bigchaindb.db.async_utils import AsyncConnection
+
+    conn = AsyncConnection(size=1)
+    loop = asyncio.get_event_loop()
+
+    assert loop.run_until_complete(conn.run(r.expr('1'))) == '1'
+    broken = conn.conns.get_nowait()
+    loop.run_until_complete(broken.close())
+    conn.conns.put_nowait(broken)
+
+    # the query is run again on a new connection
+    assert loop.run_until_complete(conn.run(r.expr('1'))) == '1'
+    new = conn.conns.get_nowait()
+    assert new is not broken and new.is_open()
+    loop.run_until_complete(new.close())
+    conn.conns.put_nowait(new)
+
+    # but an insert is not, as it may have been written already
+    with pytest.raises(r.ReqlDriverError):
+        loop.run_until_complete(conn.run(r.table('backlog').insert({})))
+    assert conn.conns.get_nowait() is None
@@ -137,3 +137,21 @@ def test_is_genesis_block_returns_true_if_genesis(b):
     from bigchaindb.util import is_genesis_block
     genesis_block = b.prepare_genesis_block()
     assert is_genesis_block(genesis_block)
+
+
+def test_verify_vote_signature_remembers_the_result():
+    from bigchaindb.common import crypto
+    from bigchaindb.common.util import serialize
+    from bigchaindb.util import verify_vote_signature, _verify_signature
+
+    sk, pk = crypto.generate_key_pair()
+    vote = {'voting_for_block': 'id', 'is_block_valid': True}
+    signature = crypto.PrivateKey(sk).sign(serialize(vote).encode())
+    signed_vote = {'node_pubkey': pk, 'vote': vote,
+                   'signature': signature.decode()}
+
+    _verify_signature.cache_clear()
+    assert verify_vote_signature([pk], signed_vote)
+    assert verify_vote_signature([pk], signed_vote)
+    assert _verify_signature.cache_info().hits == 1
+    assert not verify_vote_signature([], signed_vote)
@@ -0,0 +1,197 @@
+import asyncio
+import json
+
+import pytest
+from bigchaindb.common import crypto
+
+
+# the asyncio mode is written with generator-based coroutines, to run on
+# Python 3.4, and these were removed from Python 3.11
+pytestmark = pytest.mark.skipif(not hasattr(asyncio, 'coroutine'),
+                                reason='requires generator-based coroutines')
+
+
+TX_ENDPOINT = '/api/v1/transactions/'
+
+# The asyncio application must answer like the Flask one: the tests send the
+# same requests to both, and compare the status codes and the bodies.
+
+
+@pytest.fixture
+def async_client(request, node_config):
+    from aiohttp.test_utils import (TestClient, setup_test_loop,
+                                    teardown_test_loop)
+    from bigchaindb import config_utils
+    from bigchaindb.web import async_server
+
+    config_utils.set_config(node_config)
+
+    loop = setup_test_loop()
+    # the application runs on the event loop of the thread
+    asyncio.set_event_loop(loop)
+    app = async_server.create_app(debug=True, validation_workers=1)
+    client = TestClient(app)
+    loop.run_until_complete(client.start_server())
+
+    def fin():
+        loop.run_until_complete(client.close())
+        teardown_test_loop(loop)
+    request.addfinalizer(fin)
+
+    @asyncio.coroutine
+    def fetch(method, path, data):
+        res = yield from client.request(method, path, data=data)
+        return res.status, (yield from res.json())
+
+    def send(method, path, data=None):
+        return loop.run_until_complete(fetch(method, path, data))
+
+    return send
+
+
+@pytest.fixture
+def compare(client, async_client):
+    """Send a request to both applications, and check that they answer the
+    same. Return the body of the response."""
+
+    def send(method, path, data=None):
+        res = client.open(path, method=method, data=data)
+        status, body = async_client(method, path, data)
+        assert status == res.status_code
+        assert body == res.json
+        return body
+
+    return send
+
+
+def test_home(compare):
+    assert compare('GET', '/')['software'] == 'BigchainDB'
+
+
+@pytest.mark.usefixtures('inputs')
+def test_get_transaction(b, compare, user_pk):
+    input_tx = b.get_owned_ids(user_pk).pop()
+    tx = b.get_transaction(input_tx.txid)
+
+    assert compare('GET', TX_ENDPOINT + tx.id) == tx.to_dict()
+    assert compare('GET', TX_ENDPOINT + tx.id + '/status') == {
+        'status': b.get_status(tx.id)}
+
+
+def test_get_unknown_transaction(compare):
+    assert compare('GET', TX_ENDPOINT + '123')['status'] == 404
+    assert compare('GET', TX_ENDPOINT + '123/')['status'] == 404
+    assert compare('GET', TX_ENDPOINT + '123/status')['status'] == 404
+
+
+def test_get_transactions_by_asset(b, compare):
+    from bigchaindb.models import Transaction
+
+    tx = Transaction.create([b.me], [([b.me], 1)]).sign([b.me_private])
+    b.write_block(b.create_block([tx]))
+
+    assert compare('GET', TX_ENDPOINT + '?asset_id=' +
+                   tx.asset.data_id) == [tx.to_dict()]
+    assert compare('GET', TX_ENDPOINT + '?asset_id=abc') == []
+
+
+def test_get_transactions_with_invalid_query(compare):
+    compare('GET', TX_ENDPOINT)
+    compare('GET', TX_ENDPOINT + '?asset_id=abc&offset=-1')
+    compare('GET', TX_ENDPOINT + '?asset_id=abc&limit=0')
+
+
+def test_post_transaction(b, client, async_client):
+    from bigchaindb.models import Transaction
+    user_priv, user_pub = crypto.generate_key_pair()
+
+    # a transaction is only accepted once, so each application gets its own
+    txs = [Transaction.create([user_pub], [([user_pub], 1)]).sign([user_priv])
+           for _ in range(2)]
+
+    res = client.post(TX_ENDPOINT, data=json.dumps(txs[0].to_dict()))
+    assert (res.status_code, res.json) == (200, txs[0].to_dict())
+    assert async_client('POST', TX_ENDPOINT,
+                        json.dumps(txs[1].to_dict())) == (200,
+                                                          txs[1].to_dict())
+
+    for tx in txs:
+        assert b.get_status(tx.id) == b.TX_IN_BACKLOG
+
+
+def test_post_invalid_json(compare):
+    assert compare('POST', TX_ENDPOINT, '{') == {
+        'status': 400, 'message': 'Invalid JSON'}
+    assert compare('POST', TX_ENDPOINT + 'batch', '{') == {
+        'status': 400, 'message': 'Invalid JSON'}
+
+
+def test_post_invalid_transaction(b, compare):
+    from bigchaindb.models import Transaction
+    user_priv, user_pub = crypto.generate_key_pair()
+
+    tx = Transaction.create([user_pub], [([user_pub], 1)])
+    tx = tx.sign([crypto.generate_key_pair()[0]])
+    assert compare('POST', TX_ENDPOINT, json.dumps(tx.to_dict())) == {
+        'status': 400, 'message': 'Invalid transaction'}
+    assert compare('POST', TX_ENDPOINT, '{}')['message'].startswith(
+        'Invalid transaction schema')
+
+    assert b.get_status(tx.id) is None
+
+
+def test_post_transactions_batch(b, client, async_client):
+    from bigchaindb.models import Transaction
+    user_priv, user_pub = crypto.generate_key_pair()
+
+    invalid_tx = Transaction.create([user_pub], [([user_pub], 1)])
+    invalid_tx = invalid_tx.sign([crypto.generate_key_pair()[0]])
+
+    # a transaction is only accepted once, so each application gets its own
+    txs = [Transaction.create([user_pub], [([user_pub], 1)]).sign([user_priv])
+           for _ in range(2)]
+
+    def batch(tx):
+        return json.dumps([tx.to_dict(), invalid_tx.to_dict(), {}])
+
+    res = client.post(TX_ENDPOINT + 'batch', data=batch(txs[0]))
+    status, body = async_client('POST', TX_ENDPOINT + 'batch', batch(txs[1]))
+    assert status == res.status_code == 200
+    assert body[0] == {'id': txs[1].id, 'accepted': True}
+    assert body[1:] == res.json[1:]
+
+    for tx in txs:
+        assert b.get_status(tx.id) == b.TX_IN_BACKLOG
+
+
+def test_post_transactions_batch_with_duplicates(b, client, async_client):
+    from bigchaindb.models import Transaction
+    user_priv, user_pub = crypto.generate_key_pair()
+
+    # a transaction is only accepted once, so each application gets its own
+    txs = [Transaction.create([user_pub], [([user_pub], 1)]).sign([user_priv])
+           for _ in range(2)]
+
+    def batch(tx):
+        return json.dumps([tx.to_dict()] * 2)
+
+    res = client.post(TX_ENDPOINT + 'batch', data=batch(txs[0]))
+    status, body = async_client('POST', TX_ENDPOINT + 'batch', batch(txs[1]))
+    assert status == res.status_code == 200
+    assert body == [{'id': txs[1].id, 'accepted': True},
+                    {'id': txs[1].id, 'accepted': False,
+                     'message': 'Duplicate transaction'}]
+    assert body[1:] == [dict(result, id=txs[1].id) for result in res.json[1:]]
+
+    for tx in txs:
+        assert b.get_status(tx.id) == b.TX_IN_BACKLOG
+
+
+def test_post_transactions_batch_invalid(compare, monkeypatch):
+    import bigchaindb
+
+    assert compare('POST', TX_ENDPOINT + 'batch', '{}')['status'] == 400
+
+    monkeypatch.setitem(bigchaindb.config['server'], 'max_batch_size', 2)
+    assert compare('POST', TX_ENDPOINT + 'batch',
+                   json.dumps([{}] * 3))['status'] == 413
@@ -1,3 +1,8 @@
+import asyncio
+
+import pytest
+
+
 def test_settings(monkeypatch):
     import bigchaindb
     from bigchaindb.web import server
@@ -7,3 +12,24 @@ def test_settings(monkeypatch):
     # for whatever reason the value is wrapped in a list
     # needs further investigation
     assert s.cfg.bind[0] == bigchaindb.config['server']['bind']
+
+
+# the asyncio mode is written with generator-based coroutines, to run on
+# Python 3.4, and these were removed from Python 3.11
+@pytest.mark.skipif(not hasattr(asyncio, 'coroutine'),
+                    reason='requires generator-based coroutines')
+def test_settings_asyncio_mode():
+    import bigchaindb
+    from bigchaindb.web import server, async_server
+
+    settings = dict(bigchaindb.config['server'], mode='asyncio')
+    s = server.create_server(settings)
+
+    assert isinstance(s, async_server.AsyncioApplication)
+    assert s.cfg.bind[0] == bigchaindb.config['server']['bind']
+    assert s.cfg.worker_class_str == 'aiohttp.worker.GunicornWebWorker'
+    assert s.application.keywords['validation_workers'] == 1
+
+    settings['validation_workers'] = 2
+    s = server.create_server(settings)
+    assert s.application.keywords['validation_workers'] == 2
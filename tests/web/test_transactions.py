@@ -66,6 +66,12 @@ def test_post_create_transaction_with_invalid_structure(client):
     assert res.status_code == 400
 
 
+def test_post_create_transaction_with_invalid_json(client):
+    res = client.post(TX_ENDPOINT, data='{')
+    assert res.status_code == 400
+    assert res.json['message'] == 'Invalid JSON'
+
+
 def test_post_create_transaction_with_invalid_schema(client):
     from bigchaindb.models import Transaction
     user_priv, user_pub = crypto.generate_key_pair()
@@ -132,3 +138,119 @@ def test_get_transaction_status_returns_404_if_not_found(client):
 
     res = client.get(TX_ENDPOINT + '123' + "/status/")
     assert res.status_code == 404
+
+
+@pytest.mark.usefixtures('inputs')
+def test_get_transactions_by_asset_id_endpoint(b, client, user_pk, user_sk):
+    from bigchaindb.models import Transaction
+
+    input_tx = b.get_owned_ids(user_pk).pop()
+    create_tx = b.get_transaction(input_tx.txid)
+    transfer_tx = Transaction.transfer(create_tx.to_inputs(),
+                                       [([user_pk], 1)], create_tx.asset)
+    transfer_tx = transfer_tx.sign([user_sk])
+    block = b.create_block([transfer_tx])
+    b.write_block(block, durability='hard')
+
+    asset_id = create_tx.asset.data_id
+    res = client.get(TX_ENDPOINT + '?asset_id=' + asset_id)
+    assert res.status_code == 200
+    assert len(res.json) == 2
+    assert {tx['id'] for tx in res.json} == {create_tx.id, transfer_tx.id}
+
+    res_page = client.get(TX_ENDPOINT +
+                          '?asset_id={}&offset=1&limit=1'.format(asset_id))
+    assert res_page.status_code == 200
+    assert res_page.json == res.json[1:]
+
+
+def test_get_transactions_by_asset_id_endpoint_requires_asset_id(client):
+    res = client.get(TX_ENDPOINT)
+    assert res.status_code == 400
+
+    res = client.get(TX_ENDPOINT + '?asset_id=abc&limit=0')
+    assert res.status_code == 400
+
+
+@pytest.mark.usefixtures('inputs')
+def test_post_transactions_batch_endpoint(b, client, user_pk, user_sk):
+    from bigchaindb.models import Transaction
+    user_priv, user_pub = crypto.generate_key_pair()
+
+    input_tx = b.get_owned_ids(user_pk).pop()
+    create_tx = b.get_transaction(input_tx.txid)
+    valid_tx = Transaction.transfer(create_tx.to_inputs(), [([user_pub], 1)],
+                                    create_tx.asset).sign([user_sk])
+    invalid_tx = Transaction.transfer(create_tx.to_inputs(),
+                                      [([user_pub], 1)], create_tx.asset)
+    invalid_tx = invalid_tx.sign([user_priv])
+    invalid_schema_tx = valid_tx.to_dict()
+    del invalid_schema_tx['conditions']
+
+    res = client.post(TX_ENDPOINT + 'batch',
+                      data=json.dumps([valid_tx.to_dict(),
+                                       invalid_tx.to_dict(),
+                                       invalid_schema_tx]))
+    assert res.status_code == 200
+    assert res.json[0] == {'id': valid_tx.id, 'accepted': True}
+    assert res.json[1] == {'id': invalid_tx.id, 'accepted': False,
+                           'message': 'Invalid transaction'}
+    assert res.json[2]['id'] == valid_tx.id
+    assert res.json[2]['accepted'] is False
+    assert res.json[2]['message'].startswith('Invalid transaction schema')
+
+    assert b.get_status(valid_tx.id) == b.TX_IN_BACKLOG
+    assert b.get_status(invalid_tx.id) is None
+
+
+def test_post_transactions_batch_endpoint_ndjson(b, client):
+    from bigchaindb.models import Transaction
+    user_priv, user_pub = crypto.generate_key_pair()
+
+    txs = [Transaction.create([user_pub], [([user_pub], 1)])
+           .sign([user_priv]) for _ in range(2)]
+    body = '\n'.join(json.dumps(tx.to_dict()) for tx in txs) + '\n'
+
+    res = client.post(TX_ENDPOINT + 'batch', data=body,
+                      content_type='application/x-ndjson')
+    assert res.status_code == 200
+    assert res.json == [{'id': tx.id, 'accepted': True} for tx in txs]
+    assert b.backend.count_backlog() == 2
+
+
+def test_post_transactions_batch_endpoint_accepts_a_transaction_once(client):
+    from unittest.mock import patch
+    from bigchaindb import Bigchain
+    from bigchaindb.models import Transaction
+    user_priv, user_pub = crypto.generate_key_pair()
+
+    tx = Transaction.create([user_pub], [([user_pub], 1)]).sign([user_priv])
+
+    with patch.object(Bigchain, 'write_transactions', autospec=True,
+                      side_effect=Bigchain.write_transactions) as write:
+        res = client.post(TX_ENDPOINT + 'batch',
+                          data=json.dumps([tx.to_dict()] * 2))
+    assert res.status_code == 200
+    assert res.json == [{'id': tx.id, 'accepted': True},
+                        {'id': tx.id, 'accepted': False,
+                         'message': 'Duplicate transaction'}]
+    assert write.call_args[0][1] == [tx]
+
+
+def test_post_transactions_batch_endpoint_requires_a_list(client):
+    res = client.post(TX_ENDPOINT + 'batch', data=json.dumps({}))
+    assert res.status_code == 400
+
+    res = client.post(TX_ENDPOINT + 'batch', data='{',
+                      content_type='application/x-ndjson')
+    assert res.status_code == 400
+
+
+def test_post_transactions_batch_endpoint_rejects_large_batches(client,
+                                                                monkeypatch):
+    import bigchaindb
+    monkeypatch.setitem(bigchaindb.config['server'], 'max_batch_size', 2)
+
+    res = client.post(TX_ENDPOINT + 'batch', data=json.dumps([{}] * 3))
+    assert res.status_code == 413
+    assert res.json['message'] == 'Too many transactions, the maximum is 2'